@@ -31,10 +31,11 @@ FastAPI에서는 Depends()를 사용하여 의존성을 주입받습니다.
 from typing import Annotated, Optional
 
 from fastapi import Cookie, Depends, HTTPException, Request, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
+from app.core.principals import lookup_principal
 from app.core.security import verify_token
-from app.database import get_db
+from app.database import get_db, get_session_factory
 from app.models.user import User
 from app.services.auth import AuthService
 from app.services.item import ItemService
@@ -58,6 +59,9 @@ from app.services.user import UserService
 # =============================================================================
 DbSession = Annotated[AsyncSession, Depends(get_db)]
 
+# 백그라운드 작업용 세션 팩토리 (요청 세션과 별도로 세션을 열 때 사용)
+SessionFactory = Annotated[async_sessionmaker[AsyncSession], Depends(get_session_factory)]
+
 
 # =============================================================================
 # 토큰 추출 함수
@@ -108,9 +112,10 @@ async def get_token_from_cookie(
 #     1. 쿠키에서 토큰 추출 (get_token_from_cookie)
 #     2. 토큰 유효성 검증 (verify_token)
 #     3. 토큰에서 사용자 ID 추출
-#     4. DB에서 사용자 조회
-#     5. 사용자 활성 상태 확인
-#     6. 사용자 객체 반환
+#     4. 공유 principal 테이블에서 비활성 사용자 확인 (사용 시, DB 조회 없음)
+#     5. DB(또는 캐시)에서 사용자 조회
+#     6. 사용자 활성 상태 확인
+#     7. 사용자 객체 반환
 # =============================================================================
 
 
@@ -167,9 +172,18 @@ async def get_current_user(
     # JWT의 'sub' (subject) 클레임에 사용자 ID가 저장되어 있습니다.
     user_id = int(payload["sub"])
 
-    # Step 4: 데이터베이스에서 사용자 조회
+    # Step 4: 공유 principal 테이블 확인
+    # 여러 워커가 공유하는 레코드에 비활성으로 기록되어 있으면 DB 조회 없이 거부합니다.
+    principal = lookup_principal(user_id)
+    if principal is not None and not principal.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="비활성화된 계정입니다.",
+        )
+
+    # Step 5: 데이터베이스(또는 캐시)에서 사용자 조회
     user_service = UserService(db)
-    user = await user_service.get_by_id(user_id)
+    user = await user_service.get_principal(user_id, principal)
 
     if not user:
         raise HTTPException(
@@ -178,7 +192,7 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Step 5: 사용자 활성 상태 확인
+    # Step 6: 사용자 활성 상태 확인
     # 관리자가 계정을 비활성화했을 수 있습니다.
     if not user.is_active:
         raise HTTPException(
@@ -234,10 +248,13 @@ async def get_current_user_optional(
     if not payload:
         return None
 
-    # 사용자 조회
+    # 사용자 조회 (공유 principal 테이블에 비활성으로 기록되어 있으면 DB 조회 없이 None)
     user_id = int(payload["sub"])
+    principal = lookup_principal(user_id)
+    if principal is not None and not principal.is_active:
+        return None
     user_service = UserService(db)
-    user = await user_service.get_by_id(user_id)
+    user = await user_service.get_principal(user_id, principal)
 
     # 사용자가 없거나 비활성화되었으면 None 반환
     if not user or not user.is_active:
@@ -6,13 +6,15 @@ Auth API Endpoints
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Response
+from fastapi import APIRouter, Depends, Request, Response
 
 from app.api.deps import (
     CurrentUser,
     DbSession,
     get_auth_service,
 )
+from app.core.cache import current_generation
+from app.core.etag import content_etag, not_modified, validator_etag
 from app.schemas.user import Token, User, UserCreate, UserLogin
 from app.services.auth import AuthService
 
@@ -117,10 +119,24 @@ async def refresh_tokens(
 
 
 @router.get("/me", response_model=User)
-async def get_current_user_info(current_user: CurrentUser):
+async def get_current_user_info(
+    request: Request,
+    response: Response,
+    current_user: CurrentUser,
+):
     """
     현재 사용자 정보
 
     인증된 사용자의 프로필 정보를 반환합니다.
+    사용자 버전(ID, 수정 시각)이 If-None-Match와 같으면 304를 반환합니다.
+    (캐시가 없으면 본문으로 만든 ETag)
     """
+    generation = await current_generation(f"user:{current_user.id}")
+    if generation is None:
+        # 세대 번호가 없으면 같은 초 안의 변경을 구분하도록 본문으로 검증
+        etag = content_etag(User, current_user)
+    else:
+        etag = validator_etag(generation, current_user.id, current_user.updated_at)
+    if (unchanged := not_modified(request, response, etag)) is not None:
+        return unchanged
     return current_user
@@ -4,23 +4,49 @@ Items API Endpoints
 아이템 CRUD API 엔드포인트
 """
 
-from typing import Annotated, List, Optional
+from typing import Annotated, List, Literal, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
+from fastapi.responses import Response, StreamingResponse
 
 from app.api.deps import (
+    CurrentSuperuser,
     CurrentUser,
+    SessionFactory,
     get_item_service,
 )
+from app.config import settings
+from app.core.cache import current_generation
+from app.core.etag import content_etag, not_modified, validator_etag
+from app.core.exceptions import NotFoundError
+from app.core.export import EXPORT_FORMATS, gzip_stream, serialize_rows
 from app.schemas.common import PaginatedResponse
 from app.schemas.item import Item, ItemCreate, ItemUpdate
-from app.services.item import ItemService
+from app.schemas.job import JobStatus
+from app.services.item import EXPORT_COLUMNS, ItemService
+from app.services.item_import import (
+    build_error_report,
+    get_import_job,
+    start_item_import,
+)
 
 router = APIRouter()
 
 
 @router.get("", response_model=List[Item])
 async def get_items(
+    request: Request,
+    response: Response,
     current_user: CurrentUser,
     item_service: Annotated[ItemService, Depends(get_item_service)],
     skip: int = Query(0, ge=0),
@@ -32,19 +58,43 @@ async def get_items(
     아이템 목록 조회
 
     현재 사용자의 아이템만 조회됩니다.
+    목록 버전(개수, 최종 수정 시각)이 If-None-Match와 같으면 304를 반환합니다.
+    (캐시가 없으면 본문으로 만든 ETag)
     """
-    items = await item_service.get_all(
-        owner_id=current_user.id,
-        skip=skip,
-        limit=limit,
-        search=search,
-        is_active=is_active,
+
+    async def load() -> list:
+        return await item_service.get_all(
+            owner_id=current_user.id,
+            skip=skip,
+            limit=limit,
+            search=search,
+            is_active=is_active,
+        )
+
+    generation = await current_generation(f"items:owner:{current_user.id}")
+    if generation is None:
+        # 세대 번호가 없으면 같은 초 안의 변경을 구분하도록 본문으로 검증
+        items = await load()
+        unchanged = not_modified(request, response, content_etag(List[Item], items))
+        return unchanged if unchanged is not None else items
+
+    etag = validator_etag(
+        generation,
+        await item_service.get_list_version(
+            owner_id=current_user.id, is_active=is_active, search=search
+        ),
+        skip,
+        limit,
     )
-    return items
+    if (unchanged := not_modified(request, response, etag)) is not None:
+        return unchanged
+    return await load()
 
 
 @router.get("/paginated", response_model=PaginatedResponse[Item])
 async def get_items_paginated(
+    request: Request,
+    response: Response,
     current_user: CurrentUser,
     item_service: Annotated[ItemService, Depends(get_item_service)],
     page: int = Query(1, ge=1),
@@ -55,37 +105,202 @@ async def get_items_paginated(
     """
     아이템 목록 조회 (페이지네이션)
     """
+
+    async def load() -> PaginatedResponse:
+        skip = (page - 1) * size
+        items = await item_service.get_all(
+            owner_id=current_user.id,
+            skip=skip,
+            limit=size,
+            search=search,
+            is_active=is_active,
+        )
+        total = await item_service.count(
+            owner_id=current_user.id,
+            search=search,
+            is_active=is_active,
+        )
+        return PaginatedResponse.create(
+            items=items,
+            total=total,
+            page=page,
+            size=size,
+        )
+
+    generation = await current_generation(f"items:owner:{current_user.id}")
+    if generation is None:
+        # 세대 번호가 없으면 같은 초 안의 변경을 구분하도록 본문으로 검증
+        result = await load()
+        etag = content_etag(PaginatedResponse[Item], result)
+        unchanged = not_modified(request, response, etag)
+        return unchanged if unchanged is not None else result
+
+    etag = validator_etag(
+        generation,
+        await item_service.get_list_version(
+            owner_id=current_user.id, is_active=is_active, search=search
+        ),
+        page,
+        size,
+    )
+    if (unchanged := not_modified(request, response, etag)) is not None:
+        return unchanged
+    return await load()
+
+
+@router.get("/all", response_model=PaginatedResponse[Item])
+async def get_all_items(
+    current_user: CurrentSuperuser,
+    item_service: Annotated[ItemService, Depends(get_item_service)],
+    page: int = Query(1, ge=1),
+    size: int = Query(20, ge=1, le=100),
+    search: Optional[str] = None,
+    is_active: Optional[bool] = None,
+):
+    """
+    전체 사용자 아이템 목록 조회 (관리자 전용)
+
+    아이템 샤딩 사용 시 모든 샤드를 조회하므로 비용이 큽니다.
+    """
     skip = (page - 1) * size
-    items = await item_service.get_all(
-        owner_id=current_user.id,
+    items = await item_service.scan_all(
         skip=skip,
         limit=size,
         search=search,
         is_active=is_active,
     )
-    total = await item_service.count(
+    total = await item_service.count_all(search=search, is_active=is_active)
+
+    return PaginatedResponse.create(items=items, total=total, page=page, size=size)
+
+
+@router.get("/export")
+async def export_items(
+    current_user: CurrentUser,
+    item_service: Annotated[ItemService, Depends(get_item_service)],
+    format: Literal["csv", "ndjson", "json"] = "csv",
+    search: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    compress: bool = Query(False, description="gzip 압축 전송 여부"),
+):
+    """
+    아이템 내보내기 (스트리밍)
+
+    현재 사용자의 아이템을 CSV / NDJSON / JSON 배열로 내보냅니다.
+    서버 사이드 커서로 읽으면서 바로 전송하므로 아이템 수와 관계없이
+    메모리 사용량이 일정합니다.
+
+    - **format**: csv, ndjson, json
+    - **compress**: true이면 gzip으로 압축하여 전송
+    """
+    media_type, extension = EXPORT_FORMATS[format]
+
+    rows = item_service.stream_rows(
         owner_id=current_user.id,
         search=search,
         is_active=is_active,
+        batch_size=settings.export_batch_size,
+    )
+    body = serialize_rows(
+        rows,
+        format=format,
+        fields=[column.key for column in EXPORT_COLUMNS],
+        chunk_rows=settings.export_chunk_rows,
     )
 
-    return PaginatedResponse.create(
-        items=items,
-        total=total,
-        page=page,
-        size=size,
+    headers = {"Content-Disposition": f'attachment; filename="items.{extension}"'}
+    if compress:
+        body = gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
+@router.post("/import", response_model=JobStatus, status_code=status.HTTP_202_ACCEPTED)
+async def import_items(
+    current_user: CurrentUser,
+    session_factory: SessionFactory,
+    file: UploadFile = File(...),
+    format: Optional[Literal["csv", "ndjson"]] = Form(None),
+):
+    """
+    아이템 가져오기 (백그라운드)
+
+    CSV(title, description, priority 컬럼) 또는 NDJSON 파일을 업로드하면
+    백그라운드 작업으로 가져오기를 시작하고 작업 상태를 반환합니다.
+    진행 상황은 `GET /items/import/{job_id}`로 조회합니다.
+
+    - **file**: 업로드 파일 (.csv, .ndjson, .jsonl)
+    - **format**: 형식 (생략 시 파일 확장자로 판단)
+    """
+    job = await start_item_import(
+        file,
+        owner_id=current_user.id,
+        session_factory=session_factory,
+        format=format,
+    )
+    return job
+
+
+@router.get("/import/{job_id}", response_model=JobStatus)
+async def get_import_status(job_id: str, current_user: CurrentUser):
+    """
+    아이템 가져오기 진행 상황 조회
+    """
+    job = get_import_job(job_id, owner_id=current_user.id)
+    if job is None:
+        raise NotFoundError("가져오기 작업을 찾을 수 없습니다.")
+    return job
+
+
+@router.get("/import/{job_id}/errors")
+async def download_import_errors(job_id: str, current_user: CurrentUser):
+    """
+    아이템 가져오기 오류 리포트 다운로드 (CSV)
+
+    검증에 실패한 행의 줄 번호, 오류 메시지, 원본 내용을 반환합니다.
+    """
+    job = get_import_job(job_id, owner_id=current_user.id)
+    if job is None:
+        raise NotFoundError("가져오기 작업을 찾을 수 없습니다.")
+    return Response(
+        content=build_error_report(job),
+        media_type="text/csv; charset=utf-8",
+        headers={
+            "Content-Disposition": f'attachment; filename="import-errors-{job.id}.csv"'
+        },
     )
 
 
 @router.get("/{item_id}", response_model=Item)
 async def get_item(
+    request: Request,
+    response: Response,
     item_id: int,
     current_user: CurrentUser,
     item_service: Annotated[ItemService, Depends(get_item_service)],
 ):
     """
     아이템 상세 조회
+
+    아이템 버전(ID, 수정 시각)이 If-None-Match와 같으면 304를 반환합니다.
+    (캐시가 없으면 본문으로 만든 ETag)
     """
+    generation = await current_generation(f"items:owner:{current_user.id}")
+    if generation is None:
+        # 세대 번호가 없으면 같은 초 안의 변경을 구분하도록 본문으로 검증
+        item = await item_service.get_or_404(item_id, owner_id=current_user.id)
+        unchanged = not_modified(request, response, content_etag(Item, item))
+        return unchanged if unchanged is not None else item
+
+    version = await item_service.get_version(item_id, owner_id=current_user.id)
+    if version is None:
+        raise NotFoundError("아이템을 찾을 수 없습니다.")
+    etag = validator_etag(generation, version)
+    if (unchanged := not_modified(request, response, etag)) is not None:
+        return unchanged
+
     item = await item_service.get_or_404(item_id, owner_id=current_user.id)
     return item
 
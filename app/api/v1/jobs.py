@@ -0,0 +1,27 @@
+"""
+Jobs API Endpoints
+
+백그라운드 작업 상태 조회 API 엔드포인트
+"""
+
+from fastapi import APIRouter
+
+from app.api.deps import CurrentUser
+from app.core.exceptions import NotFoundError
+from app.core.jobs import job_registry
+from app.schemas.job import JobStatus
+
+router = APIRouter()
+
+
+@router.get("/{job_id}", response_model=JobStatus)
+async def get_job(job_id: str, current_user: CurrentUser):
+    """
+    작업 상태 조회
+
+    작업을 시작한 사용자만 조회할 수 있습니다.
+    """
+    job = job_registry.get(job_id)
+    if job is None or job.owner_id != current_user.id:
+        raise NotFoundError("작업을 찾을 수 없습니다.")
+    return job
@@ -0,0 +1,32 @@
+"""
+Metrics API Endpoints
+
+운영 지표 조회 API 엔드포인트 (관리자 전용)
+"""
+
+from fastapi import APIRouter
+
+from app.api.deps import CurrentSuperuser
+from app.core.cache import get_cache
+from app.core.fragment_cache import fragment_cache_stats
+from app.core.template_metrics import template_metrics
+
+router = APIRouter()
+
+
+@router.get("")
+async def get_metrics(current_user: CurrentSuperuser):
+    """
+    운영 지표 조회
+
+    - **cache**: 캐시 백엔드와 적중/미스/제거 통계 (현재 워커 기준)
+    - **fragments**: 템플릿 조각 전용 저장소(아이템 카드 등) 통계 (현재 워커 기준)
+    - **templates**: 템플릿별 렌더링 횟수, 시간(ms)/출력 크기(문자 수) 히스토그램
+      (include 포함, 현재 워커 기준)
+    """
+    cache = get_cache()
+    return {
+        "cache": cache.stats() if cache is not None else {"backend": "none"},
+        "fragments": fragment_cache_stats(),
+        "templates": template_metrics.snapshot(),
+    }
@@ -8,6 +8,8 @@ from fastapi import APIRouter
 
 from app.api.v1.auth import router as auth_router
 from app.api.v1.items import router as items_router
+from app.api.v1.jobs import router as jobs_router
+from app.api.v1.metrics import router as metrics_router
 from app.api.v1.users import router as users_router
 
 api_router = APIRouter()
@@ -16,3 +18,5 @@ api_router = APIRouter()
 api_router.include_router(auth_router, prefix="/auth", tags=["auth"])
 api_router.include_router(users_router, prefix="/users", tags=["users"])
 api_router.include_router(items_router, prefix="/items", tags=["items"])
+api_router.include_router(jobs_router, prefix="/jobs", tags=["jobs"])
+api_router.include_router(metrics_router, prefix="/metrics", tags=["metrics"])
@@ -7,16 +7,22 @@ Users API Endpoints
 from typing import Annotated, List
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import JSONResponse
 
 from app.api.deps import (
     CurrentSuperuser,
     CurrentUser,
     DbSession,
+    SessionFactory,
+    get_item_service,
     get_user_service,
 )
+from app.config import settings
 from app.schemas.user import PasswordChange, User, UserUpdate
 from app.services.auth import AuthService
+from app.services.item import ItemService
 from app.services.user import UserService
+from app.services.user_deletion import start_user_deletion
 
 router = APIRouter()
 
@@ -70,21 +76,22 @@ async def update_current_user(
     """
     현재 사용자 정보 수정
     """
-    # 이메일 중복 확인
-    if user_in.email:
-        if await user_service.is_email_taken(user_in.email, current_user.id):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 사용중인 이메일입니다.",
-            )
-
-    # 사용자명 중복 확인
-    if user_in.username:
-        if await user_service.is_username_taken(user_in.username, current_user.id):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="이미 사용중인 사용자명입니다.",
-            )
+    # 이메일/사용자명 중복 확인 (한 번의 EXISTS 쿼리)
+    taken = await user_service.get_taken_fields(
+        email=user_in.email,
+        username=user_in.username,
+        exclude_user_id=current_user.id,
+    )
+    if "email" in taken:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 사용중인 이메일입니다.",
+        )
+    if "username" in taken:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="이미 사용중인 사용자명입니다.",
+        )
 
     user = await user_service.update(current_user, user_in)
     return user
@@ -110,12 +117,22 @@ async def change_password(
 
 @router.delete("/{user_id}")
 async def delete_user(
+    db: DbSession,
     user_id: int,
     current_user: CurrentSuperuser,
     user_service: Annotated[UserService, Depends(get_user_service)],
+    item_service: Annotated[ItemService, Depends(get_item_service)],
+    session_factory: SessionFactory,
 ):
     """
     사용자 삭제 (관리자 전용)
+
+    아이템은 DB의 ON DELETE CASCADE가 사용자와 함께 삭제합니다.
+    (아이템 샤딩 사용 시에는 CASCADE가 동작하지 않으므로 소유자 기준 DELETE
+    한 문장으로 먼저 삭제)
+    아이템이 user_delete_batch_threshold개를 넘으면 사용자를 먼저 비활성화하고
+    백그라운드 작업으로 배치 삭제한 뒤 202와 작업 ID를 반환합니다.
+    진행 상황은 `GET /api/v1/jobs/{job_id}`로 조회합니다.
     """
     user = await user_service.get_by_id(user_id)
     if not user:
@@ -130,5 +147,25 @@ async def delete_user(
             detail="자기 자신은 삭제할 수 없습니다.",
         )
 
+    # 캐시된(오래되었을 수 있는) 개수가 아닌 DB의 현재 개수로 결정
+    item_count = await item_service.count_owned_uncached(user.id)
+    if item_count > settings.user_delete_batch_threshold:
+        # 삭제가 끝날 때까지 로그인/접근을 막고, 작업 시작 전에 커밋
+        await user_service.deactivate(user)
+        await db.commit()
+
+        job = start_user_deletion(
+            user_id=user.id,
+            item_count=item_count,
+            requested_by=current_user.id,
+            session_factory=session_factory,
+        )
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={"message": "사용자 삭제가 시작되었습니다.", "job_id": job.id},
+        )
+
+    if settings.item_shard_urls:
+        await item_service.delete_by_owner(user.id)
     await user_service.delete(user)
     return {"message": "사용자가 삭제되었습니다."}
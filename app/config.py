@@ -30,6 +30,19 @@ class Settings(BaseSettings):
 
     # Database
     database_url: str = "sqlite+aiosqlite:///./app.db"
+    database_replica_url: Optional[str] = None  # 읽기 전용 레플리카 (선택)
+    database_replica_pin_seconds: int = 5  # 쓰기 후 프라이머리로 읽는 시간 (초)
+
+    # SQLite write coordination (단일 작성자 + group commit, SQLite 파일 DB 전용)
+    sqlite_write_coordination: bool = False
+    sqlite_reader_pool_size: int = 5  # 읽기 연결 수
+    sqlite_busy_timeout_ms: int = 5000  # 잠금 대기 시간
+    sqlite_group_commit_ms: float = 2.0  # 쓰기를 모으는 시간 창 (밀리초)
+    sqlite_group_commit_max: int = 100  # 한 트랜잭션에 묶을 최대 쓰기 수
+
+    # Item sharding (소유자 기준으로 아이템 테이블을 여러 DB에 분산, 비어 있으면 사용 안 함)
+    # 사용 시 레플리카 라우팅과 SQLite 쓰기 조정은 적용되지 않습니다.
+    item_shard_urls: List[str] = []
 
     # JWT Settings
     jwt_secret_key: str = "change-me-in-production"
@@ -46,16 +59,75 @@ class Settings(BaseSettings):
     # CORS
     cors_origins: List[str] = ["http://localhost:3000", "http://localhost:8000"]
 
+    # Request coalescing (같은 사용자의 동일한 GET이 동시에 오면 한 번만 처리)
+    # 적용할 경로 접두사 목록, 비어 있으면 사용 안 함
+    # 스트리밍 응답(/dashboard, /items 페이지)은 합치지 않으므로 파셜 경로에 사용
+    # 예: ["/partials/items"]
+    request_coalescing_paths: List[str] = []
+
+    # Anonymous page cache (로그인하지 않은 방문자의 페이지 응답 전체를 캐시, debug가 아닐 때)
+    # 캐시할 경로 목록(정확히 일치), 비어 있으면 사용 안 함
+    anonymous_page_cache_paths: List[str] = ["/", "/about", "/login", "/register", "/forgot-password"]
+    anonymous_page_cache_ttl: int = 300  # 저장 시간 (초)
+    anonymous_page_cache_prewarm: bool = True  # 시작 시 미리 렌더링하여 저장
+
     # Logging
     log_level: str = "INFO"
 
+    # Templates (debug가 아니면 auto_reload를 끄고 아래 캐시/사전 컴파일 사용)
+    template_bytecode_cache: bool = True  # 컴파일 결과를 파일로 캐시
+    template_bytecode_cache_dir: Optional[str] = None  # 없으면 시스템 임시 디렉토리
+    template_precompile: bool = True  # 시작 시 모든 템플릿 미리 컴파일
+    template_streaming: bool = True  # 느린 페이지는 레이아웃을 먼저 보내고 이어서 렌더링
+    template_fragment_cache_ttl: int = 300  # {% cache %} 블록 기본 만료 시간(초)
+    template_card_cache_entries: int = 5000  # 렌더링한 아이템 카드 최대 항목 수 (워커당)
+    template_card_cache_ttl: int = 3600  # 렌더링한 아이템 카드 만료 시간(초)
+    template_etags: bool = False  # 페이지/파셜 응답에 약한 ETag, If-None-Match 일치 시 304 (선택)
+    template_metrics: bool = True  # 템플릿 이름별 렌더링 시간/출력 크기 기록 (/api/v1/metrics)
+    template_server_timing: bool = False  # 템플릿 렌더링 시간 Server-Timing 헤더 (템플릿 이름 노출, 선택)
+
+    # Export (아이템 내보내기 스트리밍)
+    export_batch_size: int = 1000  # 서버 사이드 커서 yield_per 크기
+    export_chunk_rows: int = 500  # 응답 청크 하나에 담을 행 수
+
+    # Import (아이템 대량 가져오기)
+    import_batch_size: int = 500  # executemany 한 번에 INSERT할 행 수
+    import_max_errors: int = 1000  # 오류 리포트에 보관할 최대 행 수
+
+    # User deletion (대량 아이템 보유 사용자 삭제)
+    user_delete_batch_threshold: int = 10000  # 초과 시 백그라운드 배치 삭제
+    user_delete_batch_size: int = 1000  # 배치당 삭제할 아이템 수
+
     # Redis (Optional)
     redis_url: Optional[str] = None
 
-    @field_validator("cors_origins", mode="before")
+    # Cache (서비스 조회 결과 캐시)
+    # auto: redis_url 있으면 tiered, 없으면 workers == 1일 때만 memory (여러 워커면 사용 안 함)
+    cache_backend: str = "auto"  # auto | memory | redis | tiered | none
+    cache_default_ttl: int = 60  # 기본 만료 시간 (초)
+    cache_max_entries: int = 10000  # 메모리 캐시(L1) 최대 항목 수 (워커당)
+    cache_l1_ttl: int = 30  # tiered: 워커별 L1 만료 시간 (초)
+    cache_l1_fallback_ttl: int = 5  # tiered: 무효화 브로커 장애 시 L1 만료 시간 (초)
+    cache_stale_ttl: int = 30  # 만료 후 이전 값을 반환하며 백그라운드 갱신하는 시간 (초)
+    cache_negative_ttl: int = 10  # 없는 아이템/사용자 조회 결과 저장 시간 (초)
+    cache_snapshot_path: Optional[str] = None  # 메모리 캐시 스냅샷 파일 (없으면 사용 안 함)
+    cache_snapshot_max_entries: int = 5000  # 스냅샷에 저장할 최근 사용 항목 수
+
+    # Principal cache (인증 사용자 공유 메모리 테이블, 같은 호스트의 워커 간 공유)
+    principal_cache: str = "auto"  # auto(workers > 1 이고 redis_url 없음) | shared | none
+    principal_cache_slots: int = 65536  # 레코드 수 (레코드당 32바이트)
+    principal_cache_ttl: int = 300  # 레코드 유지 시간 (초)
+
+    @field_validator(
+        "cors_origins",
+        "item_shard_urls",
+        "request_coalescing_paths",
+        "anonymous_page_cache_paths",
+        mode="before",
+    )
     @classmethod
     def parse_cors_origins(cls, v):
-        """CORS origins 문자열을 리스트로 변환"""
+        """CORS origins / 샤드 URL / 경로 문자열을 리스트로 변환"""
         if isinstance(v, str):
             import json
 
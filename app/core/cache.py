@@ -0,0 +1,1260 @@
+"""
+Cache
+
+서비스 조회 결과 캐시
+
+백엔드:
+    - MemoryCache: 프로세스 내 TTL-LRU (항목 수 제한, 워커마다 별도)
+    - RedisCache: settings.redis_url의 Redis (워커 간 공유, redis 패키지 필요)
+    - TieredCache: 워커별 L1(MemoryCache) + 공유 L2(RedisCache),
+      무효화를 pub/sub로 모든 워커에 전파
+
+사용:
+    @cached("item:{item_id}:{owner_id}", tags=("items:owner:{owner_id}",))
+    async def get_by_id(self, item_id, owner_id=None): ...
+
+    # 세대 키: 태그의 세대 번호를 키에 넣고, 무효화는 세대 번호만 증가 (키 스캔 없음)
+    @cached("items:{owner_id}:g{generation}:{skip}", generation="items:owner:{owner_id}")
+    async def get_all(self, owner_id, skip=0): ...
+
+    # 변경 시: 커밋 후 무효화할 태그 등록
+    invalidate(self.db, f"items:owner:{owner_id}")
+
+흐름:
+    1. 조회 메서드 결과(ORM 객체는 컬럼 값만)를 키/태그와 함께 저장
+    2. 적중 시 DB 조회 없이 현재 세션에 객체를 붙여서 반환
+    3. 변경 메서드는 invalidate()로 태그를 세션에 등록
+    4. 세션이 커밋되면 등록된 태그의 키를 모두 삭제하고 태그의 세대 번호 증가
+       (롤백 시 폐기) - 이전 세대의 키는 더 이상 조회되지 않고 LRU/TTL로 정리됨
+    5. 무효화 대기 중인(=쓰기 중인) 세션의 조회는 캐시를 거치지 않음
+       (커밋 전 데이터가 캐시에 들어가지 않도록)
+    6. 같은 키의 동시 미스는 하나의 조회로 합침 (single flight)
+    7. stale_ttl을 지정한 메서드는 만료 후 stale_ttl 동안 이전 값을 바로 반환하고
+       키마다 한 번만 백그라운드에서 갱신 (stale-while-revalidate)
+    8. negative_ttl을 지정한 메서드는 None(없음) 결과도 짧게 저장하여
+       없는 ID의 반복 조회가 DB에 가지 않게 함 (생성 시 태그 무효화로 삭제)
+
+민감한 컬럼:
+    info={"cache": False}로 표시한 컬럼(User.hashed_password)은 캐시에 저장하지
+    않습니다. 캐시에서 복원한 객체에서는 이 속성을 읽을 수 없으므로 필요한 곳은
+    DB에서 직접 조회합니다. (UserService.get_hashed_password)
+"""
+
+import asyncio
+import base64
+import functools
+import inspect
+import json
+import logging
+import os
+import time
+import uuid
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from datetime import date, datetime
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Iterable,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+from sqlalchemy import event
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Mapper, Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.state import InstanceState
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable[..., Awaitable[Any]])
+
+# 캐시 미스 표시 (None도 값으로 저장할 수 있도록 별도 객체 사용)
+MISSING: Any = object()
+
+# session.info에 커밋 후 무효화할 태그를 보관하는 키
+PENDING_TAGS_KEY = "cache_pending_tags"
+
+# 세대 번호 유지 시간 (초) - 만료되면 현재 시각(ns)으로 다시 시작하므로
+# 이전 세대 번호와 겹치지 않음
+GENERATION_TTL = 86400
+
+
+def _generation_key(tag: str) -> str:
+    return f"gen:{tag}"
+
+
+def _new_generation() -> int:
+    """새 세대 번호 (재시작/만료 후에도 이전 번호보다 크도록 현재 시각 사용)"""
+    return time.time_ns()
+
+
+@dataclass
+class CacheMetrics:
+    """캐시 적중/미스/제거 통계"""
+
+    hits: int = 0
+    misses: int = 0
+    sets: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+    errors: int = 0
+    stale_hits: int = 0  # 만료된 값을 반환하고 백그라운드 갱신한 횟수
+    negative_hits: int = 0  # 저장된 "없음" 결과를 반환한 횟수
+    coalesced: int = 0  # 진행 중인 같은 키 조회에 합쳐진 미스 수
+
+    @property
+    def hit_ratio(self) -> float:
+        """적중률 (0~1)"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def as_dict(self) -> dict[str, Any]:
+        data: dict[str, Any] = {f.name: getattr(self, f.name) for f in fields(self)}
+        data["hit_ratio"] = round(self.hit_ratio, 4)
+        return data
+
+
+class Cache:
+    """
+    캐시 백엔드 기본 클래스
+
+    get()은 키가 없으면 MISSING을 반환합니다.
+    """
+
+    backend = "base"
+
+    def __init__(self, default_ttl: int = 60):
+        self.default_ttl = default_ttl
+        self.metrics = CacheMetrics()
+        self._pending: set[asyncio.Task] = set()
+        # 진행 중인 미스 조회 (key → 결과 Future), 갱신 중인 stale 키
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._refreshing: set[str] = set()
+
+    async def get(self, key: str) -> Any:
+        raise NotImplementedError
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        raise NotImplementedError
+
+    async def delete(self, *keys: str) -> None:
+        raise NotImplementedError
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        """태그가 붙은 키 모두 삭제 및 태그의 세대 번호 증가"""
+        raise NotImplementedError
+
+    async def get_generation(self, tag: str) -> Optional[int]:
+        """태그의 현재 세대 번호 (없으면 생성, 조회 실패 시 None)"""
+        raise NotImplementedError
+
+    async def clear(self) -> None:
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        await self.wait_pending()
+
+    def stats(self) -> dict[str, Any]:
+        """백엔드 이름과 통계"""
+        return {"backend": self.backend, **self.metrics.as_dict()}
+
+    def invalidate_tags_nowait(self, *tags: str) -> None:
+        """
+        태그 무효화를 예약 (동기 코드 - 세션 이벤트 등 - 에서 사용)
+
+        이벤트 루프에서 백그라운드 태스크로 실행합니다.
+        """
+        self.run_background(self.invalidate_tags(*tags))
+
+    def run_background(self, coro: Coroutine[Any, Any, Any]) -> None:
+        """백그라운드 작업 실행 (close/wait_pending에서 완료를 기다림)"""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def wait_pending(self) -> None:
+        """예약된 무효화/갱신이 끝날 때까지 대기 (테스트/종료 처리용)"""
+        while self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+
+class MemoryCache(Cache):
+    """
+    프로세스 내 TTL-LRU 캐시
+
+    max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 제거하고,
+    만료된 항목은 조회 시점에 제거합니다.
+    """
+
+    backend = "memory"
+
+    def __init__(self, max_entries: int = 10000, default_ttl: int = 60):
+        super().__init__(default_ttl)
+        self.max_entries = max_entries
+        # key → (만료 시각, 값, 태그)
+        self._entries: OrderedDict[str, tuple[float, Any, tuple[str, ...]]] = OrderedDict()
+        self._tags: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_nowait(self, key: str) -> Any:
+        """동기 조회"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self.metrics.misses += 1
+            return MISSING
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self._remove(key)
+            self.metrics.expirations += 1
+            self.metrics.misses += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self.metrics.hits += 1
+        return value
+
+    def set_nowait(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        """동기 저장"""
+        self._store(key, value, ttl, tags)
+        self.metrics.sets += 1
+
+    def _store(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[float],
+        tags: Iterable[str] = (),
+    ) -> None:
+        if key in self._entries:
+            self._remove(key)
+        tags = tuple(tags)
+        expires_at = time.monotonic() + (ttl if ttl is not None else self.default_ttl)
+        self._entries[key] = (expires_at, value, tags)
+        for tag in tags:
+            self._tags.setdefault(tag, set()).add(key)
+
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.metrics.evictions += 1
+
+    def invalidate_tags_nowait(self, *tags: str) -> None:
+        for tag in tags:
+            for key in self._tags.pop(tag, ()):
+                if key in self._entries:
+                    self._remove(key)
+                    self.metrics.invalidations += 1
+            # 세대 번호가 없으면 다음 조회 때 새 번호로 시작하므로 증가할 필요 없음
+            entry = self._entries.get(_generation_key(tag))
+            if entry is not None:
+                expires_at, generation, gen_tags = entry
+                self._entries[_generation_key(tag)] = (expires_at, generation + 1, gen_tags)
+
+    def get_generation_nowait(self, tag: str) -> int:
+        """동기 세대 번호 조회 (LRU 항목으로 보관, 통계에는 포함하지 않음)"""
+        key = _generation_key(tag)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            return entry[1]
+        generation = _new_generation()
+        self._store(key, generation, GENERATION_TTL)
+        return generation
+
+    def _remove(self, key: str) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+    async def get(self, key: str) -> Any:
+        return self.get_nowait(key)
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        self.set_nowait(key, value, ttl, tags)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            if key in self._entries:
+                self._remove(key)
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        self.invalidate_tags_nowait(*tags)
+
+    async def get_generation(self, tag: str) -> Optional[int]:
+        return self.get_generation_nowait(tag)
+
+    def clear_nowait(self) -> None:
+        """동기 전체 삭제"""
+        self._entries.clear()
+        self._tags.clear()
+
+    async def clear(self) -> None:
+        self.clear_nowait()
+
+    def dump_entries(self, max_entries: int) -> list[tuple[str, float, Any, tuple[str, ...]]]:
+        """
+        최근 사용한 항목 최대 max_entries개 (스냅샷용)
+
+        Returns:
+            (키, 만료 시각(epoch 초), 값, 태그) 목록 - 오래 전에 사용한 항목부터
+        """
+        now, wall_now = time.monotonic(), time.time()
+        entries = []
+        for key in reversed(self._entries):
+            expires_at, value, tags = self._entries[key]
+            if expires_at > now:
+                entries.append((key, wall_now + (expires_at - now), value, tags))
+                if len(entries) >= max_entries:
+                    break
+        entries.reverse()
+        return entries
+
+    def load_entries(self, entries: Iterable[tuple[str, float, Any, tuple[str, ...]]]) -> int:
+        """dump_entries() 결과 불러오기 (만료된 항목은 건너뜀), 불러온 항목 수 반환"""
+        wall_now = time.time()
+        loaded = 0
+        for key, wall_expires_at, value, tags in entries:
+            remaining = wall_expires_at - wall_now
+            if remaining <= 0 or key in self._entries:
+                continue
+            self._store(key, value, remaining, tags)
+            loaded += 1
+        return loaded
+
+
+class RedisCache(Cache):
+    """
+    Redis 캐시
+
+    값은 encode_value(형식을 아는 값만 JSON)로 직렬화하며, 태그마다 키 집합(SET)을
+    유지합니다. 읽을 수 없는 값은 오류로 기록하고 캐시 미스로 처리합니다.
+    Redis 오류는 캐시 미스로 처리하여 요청이 실패하지 않게 합니다.
+
+    Args:
+        url: Redis URL (client를 주지 않을 때 사용)
+        client: redis.asyncio 호환 클라이언트 (테스트에서는 fakeredis)
+        prefix: 키 접두사
+    """
+
+    backend = "redis"
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        client: Any = None,
+        default_ttl: int = 60,
+        prefix: str = "cache:",
+    ):
+        super().__init__(default_ttl)
+        if client is None:
+            try:
+                from redis import asyncio as redis_asyncio
+            except ImportError as exc:  # pragma: no cover - 선택 의존성
+                raise RuntimeError(
+                    "Redis 캐시를 사용하려면 redis 패키지가 필요합니다. (pip install redis)"
+                ) from exc
+            if url is None:
+                raise ValueError("Redis 캐시에는 url 또는 client가 필요합니다.")
+            client = redis_asyncio.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}{key}"
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+    def _error(self, operation: str, exc: Exception) -> None:
+        self.metrics.errors += 1
+        logger.warning("Redis 캐시 %s 실패: %s", operation, exc)
+
+    async def get(self, key: str) -> Any:
+        try:
+            raw = await self.client.get(self._key(key))
+        except Exception as exc:
+            self._error("get", exc)
+            self.metrics.misses += 1
+            return MISSING
+        if raw is None:
+            self.metrics.misses += 1
+            return MISSING
+        try:
+            value = decode_value(raw)
+        except (ValueError, TypeError, KeyError) as exc:
+            self._error("decode", exc)
+            self.metrics.misses += 1
+            return MISSING
+        self.metrics.hits += 1
+        return value
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        ttl = ttl if ttl is not None else self.default_ttl
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                pipe.set(self._key(key), encode_value(value), ex=ttl)
+                for tag in tags:
+                    tag_key = self._tag_key(tag)
+                    pipe.sadd(tag_key, key)
+                    # 태그 집합은 가장 늦게 만료되는 키까지 유지
+                    pipe.expire(tag_key, ttl, nx=True)
+                    pipe.expire(tag_key, ttl, gt=True)
+                await pipe.execute()
+            self.metrics.sets += 1
+        except Exception as exc:
+            self._error("set", exc)
+
+    async def delete(self, *keys: str) -> None:
+        if not keys:
+            return
+        try:
+            await self.client.delete(*(self._key(key) for key in keys))
+        except Exception as exc:
+            self._error("delete", exc)
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        try:
+            for tag in tags:
+                tag_key = self._tag_key(tag)
+                keys = await self.client.smembers(tag_key)
+                names = [self._key(k.decode() if isinstance(k, bytes) else k) for k in keys]
+                gen_key = self._key(_generation_key(tag))
+                async with self.client.pipeline(transaction=True) as pipe:
+                    pipe.delete(tag_key, *names)
+                    # 세대 번호가 없으면 새 번호로 시작한 뒤 증가
+                    pipe.set(gen_key, _new_generation(), nx=True, ex=GENERATION_TTL)
+                    pipe.incr(gen_key)
+                    pipe.expire(gen_key, GENERATION_TTL)
+                    await pipe.execute()
+                self.metrics.invalidations += len(names)
+        except Exception as exc:
+            self._error("invalidate", exc)
+
+    async def get_generation(self, tag: str) -> Optional[int]:
+        gen_key = self._key(_generation_key(tag))
+        try:
+            raw = await self.client.get(gen_key)
+            if raw is None:
+                async with self.client.pipeline(transaction=True) as pipe:
+                    pipe.set(gen_key, _new_generation(), nx=True, ex=GENERATION_TTL)
+                    pipe.get(gen_key)
+                    _, raw = await pipe.execute()
+        except Exception as exc:
+            self._error("generation", exc)
+            return None
+        return int(raw)
+
+    async def clear(self) -> None:
+        try:
+            async for name in self.client.scan_iter(match=f"{self.prefix}*"):
+                await self.client.delete(name)
+        except Exception as exc:
+            self._error("clear", exc)
+
+    async def close(self) -> None:
+        await super().close()
+        await self.client.aclose()
+
+
+class TieredCache(Cache):
+    """
+    2단계 캐시 (워커별 L1 + 공유 L2)
+
+    조회는 L1 → L2 순서로 하고, L2 적중 시 L1을 채웁니다.
+    무효화는 L1/L2에서 삭제한 뒤 Redis pub/sub 채널로 발행하여
+    다른 워커의 L1에서도 곧바로 삭제되게 합니다.
+
+    브로커에 연결할 수 없으면 TTL 전용 모드로 전환합니다:
+    L1을 비우고 이후 L1 항목은 fallback_ttl만 유지하여
+    다른 워커의 변경이 늦어도 fallback_ttl 안에 반영되게 합니다.
+    연결이 복구되면 (놓친 메시지가 있을 수 있으므로) L1을 비우고 정상 모드로 돌아갑니다.
+
+    Args:
+        l1: 워커별 메모리 캐시
+        l2: 공유 Redis 캐시
+        l1_ttl: L1 항목 만료 시간 (초)
+        fallback_ttl: TTL 전용 모드의 L1 항목 만료 시간 (초)
+        channel: 무효화 pub/sub 채널
+    """
+
+    backend = "tiered"
+
+    def __init__(
+        self,
+        l1: MemoryCache,
+        l2: RedisCache,
+        l1_ttl: int = 30,
+        fallback_ttl: int = 5,
+        channel: str = "cache:invalidate",
+    ):
+        super().__init__(l2.default_ttl)
+        self.l1 = l1
+        self.l2 = l2
+        self.l1_ttl = l1_ttl
+        self.fallback_ttl = fallback_ttl
+        self.channel = channel
+        self.origin = uuid.uuid4().hex
+        self.degraded = False
+        self._listener: Optional[asyncio.Task] = None
+        self._subscribed = asyncio.Event()
+
+    def _l1_ttl(self, ttl: Optional[int]) -> int:
+        limit = self.fallback_ttl if self.degraded else self.l1_ttl
+        return min(ttl, limit) if ttl is not None else limit
+
+    def _set_degraded(self, degraded: bool) -> None:
+        if degraded == self.degraded:
+            return
+        self.degraded = degraded
+        # 모드 전환 시 무효화를 놓쳤을 수 있는 L1 항목 폐기
+        self.l1.clear_nowait()
+        if degraded:
+            logger.warning("캐시 무효화 브로커 연결 끊김: TTL 전용 모드로 전환")
+        else:
+            logger.info("캐시 무효화 브로커 연결 복구")
+
+    def start(self) -> None:
+        """무효화 구독 태스크 시작 (이미 실행 중이면 무시)"""
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.get_running_loop().create_task(self._listen())
+
+    async def wait_subscribed(self, timeout: float = 1.0) -> None:
+        """구독이 시작될 때까지 대기 (테스트용)"""
+        self.start()
+        await asyncio.wait_for(self._subscribed.wait(), timeout)
+
+    async def _listen(self) -> None:
+        """무효화 메시지를 받아 L1에서 삭제 (연결 실패 시 재시도)"""
+        delay = 0.1
+        while True:
+            pubsub = self.l2.client.pubsub()
+            try:
+                await pubsub.subscribe(self.channel)
+                self._set_degraded(False)
+                self._subscribed.set()
+                delay = 0.1
+                while True:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=1.0
+                    )
+                    if message is not None:
+                        self._apply(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self._subscribed.clear()
+                self._set_degraded(True)
+                logger.debug("무효화 구독 실패: %s", exc)
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, 5.0)
+            finally:
+                try:
+                    await pubsub.aclose()
+                except Exception:
+                    pass
+
+    def _apply(self, data: Any) -> None:
+        """다른 워커가 발행한 무효화 적용"""
+        try:
+            payload = json.loads(data)
+        except (TypeError, ValueError):
+            return
+        if payload.get("origin") == self.origin:
+            return
+        self.l1.invalidate_tags_nowait(*payload.get("tags", ()))
+
+    async def get(self, key: str) -> Any:
+        self.start()
+        value = self.l1.get_nowait(key)
+        if value is not MISSING:
+            self.metrics.hits += 1
+            return value
+
+        entry = await self.l2.get(key)
+        if entry is MISSING:
+            self.metrics.misses += 1
+            return MISSING
+        tags, value = entry
+        self.l1.set_nowait(key, value, self._l1_ttl(None), tags)
+        self.metrics.hits += 1
+        return value
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Iterable[str] = (),
+    ) -> None:
+        self.start()
+        tags = tuple(tags)
+        self.l1.set_nowait(key, value, self._l1_ttl(ttl), tags)
+        await self.l2.set(key, (tags, value), ttl, tags)
+        self.metrics.sets += 1
+
+    async def delete(self, *keys: str) -> None:
+        await self.l1.delete(*keys)
+        await self.l2.delete(*keys)
+
+    def invalidate_tags_nowait(self, *tags: str) -> None:
+        # 현재 워커의 L1은 즉시 삭제, L2 삭제와 발행은 백그라운드로
+        self.l1.invalidate_tags_nowait(*tags)
+        super().invalidate_tags_nowait(*tags)
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        self.l1.invalidate_tags_nowait(*tags)
+        await self.l2.invalidate_tags(*tags)
+        # L2 갱신 전에 L1에 다시 채워진 이전 값/세대 번호 제거
+        self.l1.invalidate_tags_nowait(*tags)
+        self.metrics.invalidations += 1
+        try:
+            await self.l2.client.publish(
+                self.channel, json.dumps({"origin": self.origin, "tags": list(tags)})
+            )
+        except Exception as exc:
+            self.l2._error("publish", exc)
+            self._set_degraded(True)
+
+    async def get_generation(self, tag: str) -> Optional[int]:
+        # L1의 세대 번호 항목에는 태그를 붙여 무효화 전파 시 함께 삭제되게 함
+        key = _generation_key(tag)
+        entry = self.l1._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+        generation = await self.l2.get_generation(tag)
+        if generation is not None:
+            self.l1._store(key, generation, self._l1_ttl(None), (tag,))
+        return generation
+
+    async def clear(self) -> None:
+        await self.l1.clear()
+        await self.l2.clear()
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except (asyncio.CancelledError, Exception):
+                pass
+            self._listener = None
+        await super().close()
+        await self.l2.close()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            **super().stats(),
+            "degraded": self.degraded,
+            "l1": self.l1.stats(),
+            "l2": self.l2.stats(),
+        }
+
+
+# =============================================================================
+# 전역 캐시
+# =============================================================================
+
+_cache: Optional[Cache] = None
+_configured = False
+
+
+def create_cache() -> Optional[Cache]:
+    """
+    설정으로 캐시 생성
+
+    cache_backend:
+        - "auto": redis_url이 있으면 2단계(L1 + Redis), 없으면 워커가 하나일 때만
+          메모리 (워커가 여러 개면 캐시 사용 안 함)
+        - "memory" / "redis" / "tiered": 지정한 백엔드
+        - "none": 캐시 사용 안 함
+
+    워커별 메모리 캐시는 다른 워커의 변경을 알 수 없으므로, 워커가 여러 개일 때
+    쓰면 TTL 동안 오래된 조회 결과/세대 번호(ETag)를 반환합니다.
+    """
+    backend = settings.cache_backend
+    if backend == "none":
+        return None
+    if backend == "auto":
+        if settings.redis_url:
+            backend = "tiered"
+        elif settings.workers > 1:
+            logger.warning(
+                "워커가 %d개이고 REDIS_URL이 없어 캐시를 사용하지 않습니다. "
+                "(워커별 메모리 캐시는 다른 워커의 변경을 반영하지 못함)",
+                settings.workers,
+            )
+            return None
+        else:
+            backend = "memory"
+
+    memory = MemoryCache(
+        max_entries=settings.cache_max_entries,
+        default_ttl=settings.cache_default_ttl,
+    )
+    if backend == "memory":
+        if settings.workers > 1:
+            logger.warning(
+                "워커가 %d개인데 CACHE_BACKEND=memory입니다. "
+                "다른 워커의 변경은 최대 %d초 동안 반영되지 않습니다.",
+                settings.workers,
+                settings.cache_default_ttl,
+            )
+        return memory
+
+    redis_cache = RedisCache(settings.redis_url, default_ttl=settings.cache_default_ttl)
+    if backend == "redis":
+        return redis_cache
+    return TieredCache(
+        memory,
+        redis_cache,
+        l1_ttl=settings.cache_l1_ttl,
+        fallback_ttl=settings.cache_l1_fallback_ttl,
+    )
+
+
+def get_cache() -> Optional[Cache]:
+    """전역 캐시 (처음 사용 시 설정으로 생성)"""
+    global _cache, _configured
+    if not _configured:
+        _cache = create_cache()
+        _configured = True
+    return _cache
+
+
+def set_cache(cache: Optional[Cache]) -> None:
+    """전역 캐시 교체 (테스트용)"""
+    global _cache, _configured
+    _cache = cache
+    _configured = True
+
+
+async def close_cache() -> None:
+    """전역 캐시 연결 종료"""
+    if _cache is not None:
+        await _cache.close()
+
+
+# =============================================================================
+# 캐시 스냅샷 (재시작 후 빠른 워밍업)
+# =============================================================================
+# 종료 시 메모리 캐시에서 최근 사용한 항목을 파일로 저장하고, 시작 시 남은 TTL이
+# 있는 항목만 불러옵니다. 배포/재시작 직후 모든 요청이 DB로 몰리는 것을 막습니다.
+#
+# 파일 형식: SNAPSHOT_MAGIC + zlib(encode_value([(키, 만료 epoch 초, 값, 태그), ...]))
+# 값은 Redis와 같은 JSON 형식(encode_value)이므로 민감한 컬럼은 들어가지 않고,
+# 읽을 때 모르는 형식은 거부합니다.
+#
+# 단일 작성자: 모든 워커가 같은 파일을 불러오지만 종료 시에는 한 워커만 씁니다.
+# 잠금 파일({path}.lock)을 잡은 뒤 이 프로세스가 시작한 후에 다른 워커가 이미
+# 저장했으면 건너뜁니다. (워커별 캐시 중 먼저 종료한 워커의 것이 남음)
+# Redis 캐시는 재시작과 관계없이 유지되므로 대상이 아닙니다.
+# =============================================================================
+
+SNAPSHOT_MAGIC = b"FCSNAP2\n"
+
+# 이 프로세스의 시작 시각 (이후에 쓰인 스냅샷은 다른 워커가 이번 종료 때 쓴 것)
+_process_started_at = time.time()
+
+
+def _snapshot_lock(path: str) -> Optional[int]:
+    """스냅샷 잠금 파일을 열고 잠금 (fcntl이 없으면 None)"""
+    try:
+        import fcntl
+    except ImportError:  # pragma: no cover - Windows
+        return None
+    fd = os.open(f"{path}.lock", os.O_RDWR | os.O_CREAT, 0o600)
+    fcntl.lockf(fd, fcntl.LOCK_EX)
+    return fd
+
+
+def save_cache_snapshot(
+    path: Optional[str] = None,
+    max_entries: Optional[int] = None,
+) -> int:
+    """
+    전역 메모리 캐시 스냅샷 저장, 저장한 항목 수 반환
+
+    실패(직렬화, 파일 쓰기)는 기록만 하고 0을 반환합니다. (종료 처리를 막지 않음)
+    """
+    path = path or settings.cache_snapshot_path
+    cache = _cache
+    if not path or not isinstance(cache, MemoryCache):
+        return 0
+
+    entries = cache.dump_entries(max_entries or settings.cache_snapshot_max_entries)
+    try:
+        data = zlib.compress(encode_value(entries))
+    except (TypeError, ValueError) as exc:
+        logger.warning("캐시 스냅샷 직렬화 실패: %s", exc)
+        return 0
+
+    # 임시 파일에 쓴 뒤 교체하여 읽는 쪽이 쓰다 만 파일을 보지 않게 함
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    lock_fd = None
+    try:
+        lock_fd = _snapshot_lock(path)
+        try:
+            if os.path.getmtime(path) >= _process_started_at:
+                logger.info("다른 워커가 캐시 스냅샷을 이미 저장했습니다: %s", path)
+                return 0
+        except FileNotFoundError:
+            pass
+        with open(temp_path, "wb") as file:
+            file.write(SNAPSHOT_MAGIC)
+            file.write(data)
+        os.replace(temp_path, path)
+    except OSError as exc:
+        logger.error("캐시 스냅샷 저장 실패 (%s): %s", path, exc)
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        return 0
+    finally:
+        if lock_fd is not None:
+            os.close(lock_fd)
+    return len(entries)
+
+
+def load_cache_snapshot(path: Optional[str] = None) -> int:
+    """스냅샷을 전역 메모리 캐시로 불러오기, 불러온 항목 수 반환"""
+    path = path or settings.cache_snapshot_path
+    cache = get_cache()
+    if not path or not isinstance(cache, MemoryCache):
+        return 0
+
+    try:
+        with open(path, "rb") as file:
+            raw = file.read()
+    except FileNotFoundError:
+        return 0
+    if not raw.startswith(SNAPSHOT_MAGIC):
+        logger.warning("캐시 스냅샷 형식이 올바르지 않습니다: %s", path)
+        return 0
+    try:
+        entries = decode_value(zlib.decompress(raw[len(SNAPSHOT_MAGIC) :]))
+        return cache.load_entries(entries)
+    except (zlib.error, ValueError, TypeError, KeyError) as exc:
+        logger.warning("캐시 스냅샷 읽기 실패 (%s): %s", path, exc)
+        return 0
+
+
+# stale 값 백그라운드 갱신에 사용할 세션 팩토리 (없으면 app.database의 기본 팩토리)
+_refresh_session_factory: Optional[Callable[[], AsyncSession]] = None
+
+
+def set_refresh_session_factory(factory: Optional[Callable[[], AsyncSession]]) -> None:
+    """백그라운드 갱신용 세션 팩토리 교체 (테스트용)"""
+    global _refresh_session_factory
+    _refresh_session_factory = factory
+
+
+def _get_refresh_session_factory() -> Callable[[], AsyncSession]:
+    if _refresh_session_factory is not None:
+        return _refresh_session_factory
+    from app.database import get_session_factory  # 순환 import 방지
+
+    return get_session_factory()
+
+
+# =============================================================================
+# ORM 객체 저장/복원
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class NegativeEntry:
+    """조회 결과가 없었음을 나타내는 캐시 값 (negative caching)"""
+
+
+@dataclass(frozen=True)
+class StaleEntry:
+    """stale-while-revalidate 캐시 값 (fresh_until 이후에는 갱신 대상)"""
+
+    value: Any
+    fresh_until: float
+
+
+@dataclass(frozen=True)
+class CachedInstance:
+    """캐시에 저장되는 ORM 객체 (컬럼 값만)"""
+
+    cls: type
+    values: dict[str, Any]
+    identity_token: Any = None
+
+
+@functools.cache
+def _cached_columns(mapper: Mapper) -> frozenset[str]:
+    """캐시에 저장하는 컬럼 속성 (info={"cache": False}인 민감한 컬럼 제외)"""
+    return frozenset(
+        attr.key
+        for attr in mapper.column_attrs
+        if all(column.info.get("cache", True) for column in attr.columns)
+    )
+
+
+def dump_value(value: Any) -> Any:
+    """조회 결과를 캐시 저장용 값으로 변환 (ORM 객체 → CachedInstance)"""
+    if isinstance(value, list):
+        return [dump_value(item) for item in value]
+    state = sa_inspect(value, raiseerr=False)
+    if isinstance(state, InstanceState):
+        columns = _cached_columns(state.mapper)
+        return CachedInstance(
+            cls=state.class_,
+            values={key: state.dict[key] for key in columns if key in state.dict},
+            identity_token=state.identity_token,
+        )
+    return value
+
+
+def restore_value(db: AsyncSession, value: Any) -> Any:
+    """
+    캐시 값을 조회 결과로 복원
+
+    ORM 객체는 SELECT 없이 db 세션에 persistent 상태로 붙입니다.
+    같은 객체가 이미 세션에 있으면 그 객체를 반환합니다.
+    """
+    if isinstance(value, list):
+        return [restore_value(db, item) for item in value]
+    if not isinstance(value, CachedInstance):
+        return value
+
+    instance: Any = sa_inspect(value.cls).class_manager.new_instance()
+    for key, column_value in value.values.items():
+        set_committed_value(instance, key, column_value)
+    state = sa_inspect(instance)
+    state.identity_token = value.identity_token
+    make_transient_to_detached(instance)
+
+    existing = db.sync_session.identity_map.get(state.key)
+    if existing is not None:
+        return existing
+    db.add(instance)
+    return instance
+
+
+# =============================================================================
+# 캐시 값 직렬화 (Redis, 스냅샷)
+# =============================================================================
+# pickle 대신 형식을 아는 값만 JSON으로 저장합니다. 캐시 저장소에 쓸 수 있는
+# 쪽이 역직렬화로 코드를 실행할 수 없고, 모르는 형식은 읽지 않습니다.
+#
+#   - JSON 기본 값(None, bool, int, float, str)과 list는 그대로
+#   - 그 외는 {"$": 형식, ...}: tuple, dict, bytes, datetime, date,
+#     orm(CachedInstance), negative(NegativeEntry), stale(StaleEntry)
+#   - ORM 객체는 매핑된 모델 이름과 캐시 대상 컬럼 값만 저장하고, 읽을 때
+#     모델의 컬럼 목록(_cached_columns)에 없는 값이 있으면 거부합니다.
+# =============================================================================
+
+
+def _mapped_model(name: str) -> Mapper:
+    """모델 클래스 이름으로 매퍼 조회 (app.database.Base에 매핑된 모델만)"""
+    from app.database import Base  # 순환 import 방지
+
+    for mapper in Base.registry.mappers:
+        if mapper.class_.__name__ == name:
+            return mapper
+    raise ValueError(f"캐시 값의 모델을 찾을 수 없습니다: {name}")
+
+
+def _encode(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, tuple):
+        return {"$": "tuple", "v": [_encode(item) for item in value]}
+    if isinstance(value, dict):
+        return {"$": "dict", "v": [[_encode(k), _encode(v)] for k, v in value.items()]}
+    if isinstance(value, bytes):
+        return {"$": "bytes", "v": base64.b64encode(value).decode("ascii")}
+    if isinstance(value, datetime):
+        return {"$": "datetime", "v": value.isoformat()}
+    if isinstance(value, date):
+        return {"$": "date", "v": value.isoformat()}
+    if isinstance(value, CachedInstance):
+        return {
+            "$": "orm",
+            "model": value.cls.__name__,
+            "v": {key: _encode(column_value) for key, column_value in value.values.items()},
+            "token": value.identity_token,
+        }
+    if isinstance(value, NegativeEntry):
+        return {"$": "negative"}
+    if isinstance(value, StaleEntry):
+        return {"$": "stale", "v": _encode(value.value), "fresh_until": value.fresh_until}
+    raise TypeError(f"캐시에 저장할 수 없는 값입니다: {type(value).__name__}")
+
+
+def _decode(data: Any) -> Any:
+    if isinstance(data, list):
+        return [_decode(item) for item in data]
+    if not isinstance(data, dict):
+        return data
+
+    kind = data["$"]
+    if kind == "tuple":
+        return tuple(_decode(item) for item in data["v"])
+    if kind == "dict":
+        return {_decode(key): _decode(value) for key, value in data["v"]}
+    if kind == "bytes":
+        return base64.b64decode(data["v"])
+    if kind == "datetime":
+        return datetime.fromisoformat(data["v"])
+    if kind == "date":
+        return date.fromisoformat(data["v"])
+    if kind == "orm":
+        mapper = _mapped_model(data["model"])
+        values = data["v"]
+        if not isinstance(values, dict) or not values.keys() <= _cached_columns(mapper):
+            raise ValueError(f"캐시 값의 컬럼이 모델과 다릅니다: {data['model']}")
+        token = data["token"]
+        if token is not None and not isinstance(token, str):
+            raise ValueError("캐시 값의 identity token이 올바르지 않습니다.")
+        return CachedInstance(
+            cls=mapper.class_,
+            values={key: _decode(value) for key, value in values.items()},
+            identity_token=token,
+        )
+    if kind == "negative":
+        return NegativeEntry()
+    if kind == "stale":
+        return StaleEntry(_decode(data["v"]), float(data["fresh_until"]))
+    raise ValueError(f"알 수 없는 캐시 값 형식입니다: {kind}")
+
+
+def encode_value(value: Any) -> bytes:
+    """
+    캐시 값을 바이트로 직렬화
+
+    Raises:
+        TypeError: 저장할 수 없는 형식의 값
+    """
+    return json.dumps(_encode(value), ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def decode_value(raw: bytes) -> Any:
+    """
+    encode_value로 직렬화한 값 복원
+
+    Raises:
+        ValueError: JSON이 아니거나 알 수 없는 형식/모델/컬럼
+    """
+    return _decode(json.loads(raw))
+
+
+# =============================================================================
+# 서비스 메서드 데코레이터 / 무효화
+# =============================================================================
+
+
+# 커밋된 무효화 태그를 받는 추가 훅 (캐시 외의 저장소 - 공유 principal 테이블 등)
+_invalidation_hooks: list[Callable[[set[str]], None]] = []
+
+
+def on_invalidate(hook: Callable[[set[str]], None]) -> None:
+    """커밋 후 무효화 태그를 받을 훅 등록"""
+    _invalidation_hooks.append(hook)
+
+
+def invalidate(db: AsyncSession, *tags: str) -> None:
+    """
+    커밋 후 무효화할 태그 등록
+
+    세션이 커밋되면 태그가 붙은 캐시 키가 삭제되고, 롤백되면 폐기됩니다.
+    """
+    db.info.setdefault(PENDING_TAGS_KEY, set()).update(tags)
+
+
+def has_pending_invalidation(db: AsyncSession) -> bool:
+    """세션에 커밋 대기 중인 변경(무효화 태그)이 있는지 여부"""
+    return bool(db.info.get(PENDING_TAGS_KEY))
+
+
+async def current_generation(tag: str) -> Optional[int]:
+    """
+    태그의 현재 세대 번호 (캐시가 없거나 조회 실패 시 None)
+
+    커밋된 변경마다 바뀌므로 응답 검증자(ETag)에 넣으면 DB 값의 정밀도
+    (초 단위 updated_at 등)로 구분하지 못하는 같은 초 안의 변경도 구분합니다.
+    """
+    cache = get_cache()
+    if cache is None:
+        return None
+    return await cache.get_generation(tag)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session: Session) -> None:
+    tags = session.info.pop(PENDING_TAGS_KEY, None)
+    if not tags:
+        return
+    for hook in _invalidation_hooks:
+        hook(tags)
+    cache = get_cache()
+    if cache is not None:
+        cache.invalidate_tags_nowait(*tags)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_after_rollback(session: Session, previous_transaction: Any) -> None:
+    if session.in_transaction():
+        return
+    session.info.pop(PENDING_TAGS_KEY, None)
+
+
+def cached(
+    key: str,
+    tags: Sequence[str] = (),
+    ttl: Optional[int] = None,
+    generation: Optional[str] = None,
+    stale_ttl: Optional[int] = None,
+    negative_ttl: Optional[int] = None,
+) -> Callable[[F], F]:
+    """
+    서비스 조회 메서드 결과 캐시 데코레이터
+
+    key/tags는 메서드 인자 이름으로 채우는 format 문자열입니다.
+    메서드는 self.db(AsyncSession)를 가진 서비스의 메서드여야 합니다.
+    None 결과는 negative_ttl을 지정한 경우에만 캐시합니다.
+
+    Args:
+        key: 캐시 키 템플릿 (예: "user:{user_id}")
+        tags: 무효화 태그 템플릿 목록
+        ttl: 만료 시간 (초, 없으면 백엔드 기본값)
+        generation: 세대 태그 템플릿 - 지정하면 태그의 현재 세대 번호를
+            key의 {generation}에 넣습니다. 태그 무효화는 세대 번호만 올리므로
+            키 목록을 유지/스캔하지 않으며, 이전 세대의 키는 LRU/TTL로 정리됩니다.
+        stale_ttl: 만료 후 이전 값을 반환할 시간 (초) - 지정하면 만료된 값을
+            바로 반환하고 키마다 한 번만 백그라운드에서 새 세션으로 다시 조회합니다.
+            (서비스는 db 세션 하나로 생성할 수 있어야 함)
+        negative_ttl: None 결과 저장 시간 (초) - 대상이 생성될 때 같은 태그를
+            무효화해야 합니다.
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+            cache = get_cache()
+            if cache is None or has_pending_invalidation(self.db):
+                return await func(self, *args, **kwargs)
+
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            params = {name: value for name, value in bound.arguments.items() if name != "self"}
+            if generation is not None:
+                params["generation"] = await cache.get_generation(generation.format(**params))
+                if params["generation"] is None:
+                    return await func(self, *args, **kwargs)
+            cache_key = key.format(**params)
+
+            async def store(result: Any) -> Any:
+                if result is None:
+                    if negative_ttl is not None:
+                        await cache.set(
+                            cache_key, NegativeEntry(), ttl=negative_ttl, tags=key_tags
+                        )
+                    return None
+                value = dump_value(result)
+                if stale_ttl is None:
+                    await cache.set(cache_key, value, ttl=ttl, tags=key_tags)
+                else:
+                    fresh = ttl if ttl is not None else cache.default_ttl
+                    await cache.set(
+                        cache_key,
+                        StaleEntry(value, time.time() + fresh),
+                        ttl=fresh + stale_ttl,
+                        tags=key_tags,
+                    )
+                return value
+
+            async def refresh() -> None:
+                try:
+                    async with _get_refresh_session_factory()() as session:
+                        await store(await func(type(self)(session), *args, **kwargs))
+                except Exception as exc:
+                    logger.warning("캐시 갱신 실패 (%s): %s", cache_key, exc)
+                finally:
+                    cache._refreshing.discard(cache_key)
+
+            key_tags = [tag.format(**params) for tag in tags]
+            value = await cache.get(cache_key)
+            if value is not MISSING:
+                if isinstance(value, NegativeEntry):
+                    cache.metrics.negative_hits += 1
+                    return None
+                if isinstance(value, StaleEntry):
+                    if value.fresh_until <= time.time() and cache_key not in cache._refreshing:
+                        cache._refreshing.add(cache_key)
+                        cache.metrics.stale_hits += 1
+                        cache.run_background(refresh())
+                    value = value.value
+                return restore_value(self.db, value)
+
+            # 같은 키를 조회 중인 요청이 있으면 그 결과를 기다림 (single flight)
+            inflight = cache._inflight.get(cache_key)
+            if inflight is not None:
+                cache.metrics.coalesced += 1
+                value = await asyncio.shield(inflight)
+                if value is not MISSING:
+                    return restore_value(self.db, value)
+                return await func(self, *args, **kwargs)
+
+            inflight = asyncio.get_running_loop().create_future()
+            cache._inflight[cache_key] = inflight
+            try:
+                result = await func(self, *args, **kwargs)
+                inflight.set_result(await store(result))
+                return result
+            finally:
+                # 실패 시 기다리던 요청은 각자 조회
+                if not inflight.done():
+                    inflight.set_result(MISSING)
+                cache._inflight.pop(cache_key, None)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
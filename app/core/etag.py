@@ -0,0 +1,137 @@
+"""
+ETag
+
+응답 검증자(ETag) 생성, If-None-Match 비교, 템플릿 응답의 조건부 응답(304) 처리,
+DB 값으로 만든 검증자로 본문 생성 전 304 처리 (JSON API)
+"""
+
+import functools
+import hashlib
+import zlib
+from typing import Any, Optional, TypeVar
+
+from pydantic import TypeAdapter
+from starlette.requests import Request
+from starlette.responses import Response
+
+# 304 응답에서 제거하는 본문 관련 헤더
+_BODY_HEADERS = ("content-length", "content-type")
+
+ResponseT = TypeVar("ResponseT", bound=Response)
+
+
+def compute_etag(body: bytes, weak: bool = False) -> str:
+    """
+    본문 해시로 ETag 생성
+
+    - 강한 ETag: blake2b(8바이트) - 응답 전체를 저장해 두고 재사용할 때
+    - 약한 ETag: 길이 + CRC32 - 요청마다 렌더링한 본문에 붙일 때
+      (40KB 기준 blake2b 약 60us, CRC32 약 10us, 렌더링 시간의 일부만 사용)
+
+    Args:
+        body: 응답 본문
+        weak: 약한 ETag(W/"...") 여부
+    """
+    if weak:
+        return f'W/"{len(body):x}-{zlib.crc32(body):08x}"'
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 ETag와 일치하는지 (약한 비교, RFC 9110 13.1.2)
+
+    GET/HEAD의 If-None-Match는 약한 비교를 사용하므로 W/ 접두사는 무시합니다.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def validator_etag(*parts: Any) -> str:
+    """
+    DB에서 얻은 값(ID, 수정 시각, 개수, 캐시 세대 번호 등)으로 약한 ETag 생성
+
+    본문을 만들지 않고 계산하므로 표현(JSON 인코딩 등)이 아닌 리소스 버전을
+    나타내는 약한 ETag입니다. 값이 같으면 워커/재시작과 상관없이 같은 ETag입니다.
+    """
+    return f"W/{compute_etag(repr(parts).encode())}"
+
+
+@functools.cache
+def _adapter(schema: Any) -> TypeAdapter:
+    return TypeAdapter(schema)
+
+
+def content_etag(schema: Any, value: Any) -> str:
+    """
+    응답 스키마로 직렬화한 본문으로 약한 ETag 생성
+
+    캐시 세대 번호가 없을 때(캐시를 사용하지 않음) 사용합니다. DB 값의 정밀도
+    (초 단위 updated_at 등)로는 같은 초 안의 변경을 구분하지 못하므로 본문을
+    만든 뒤 검증합니다. (조회는 줄지 않고 전송만 줄어듦)
+
+    Args:
+        schema: 응답 스키마 (예: Item, List[Item])
+        value: 응답 값 (ORM 객체 가능, 스키마가 from_attributes)
+    """
+    return f"W/{compute_etag(_adapter(schema).dump_json(value))}"
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    응답에 검증자를 설정하고, If-None-Match가 일치하면 304 응답 반환
+
+    ORM 객체 조회/직렬화 전에 호출합니다. 사용자별 응답이므로
+    Cache-Control: private, no-cache (공유 캐시에는 저장하지 않고 매번 검증).
+
+    Args:
+        request: 요청
+        response: 라우트가 주입받은 응답 (본문을 만들 때 헤더가 합쳐짐)
+        etag: validator_etag로 만든 ETag
+
+    Returns:
+        304 응답 또는 None (본문을 만들어 반환)
+    """
+    headers = {"etag": etag, "cache-control": "private, no-cache"}
+    response.headers.update(headers)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return None
+
+
+def conditional_response(request: Request, response: ResponseT) -> ResponseT:
+    """
+    렌더링한 응답에 약한 ETag를 붙이고, If-None-Match가 일치하면 304로 교체
+
+    GET/HEAD의 200 응답(본문이 있는 일반 Response)에만 적용합니다.
+    Cache-Control: no-cache를 함께 보내므로 브라우저는 저장한 응답을 매번
+    검증 요청으로 확인하고, 304를 받으면 저장한 본문을 사용합니다
+    (HTMX의 XHR 요청도 브라우저 캐시를 거치므로 동일).
+
+    Returns:
+        같은 응답 객체 (일치하면 본문을 비운 304로 바꿈, 헤더는 그대로 유지)
+    """
+    if request.method not in ("GET", "HEAD") or response.status_code != 200:
+        return response
+    if "etag" in response.headers:
+        return response
+
+    etag = compute_etag(bytes(response.body), weak=True)
+    response.headers["etag"] = etag
+    if "cache-control" not in response.headers:
+        response.headers["cache-control"] = "no-cache"
+    if not etag_matches(request.headers.get("if-none-match"), etag):
+        return response
+
+    response.status_code = 304
+    response.body = b""
+    for name in _BODY_HEADERS:
+        del response.headers[name]
+    return response
@@ -0,0 +1,123 @@
+"""
+Streaming Export Utilities
+
+행 스트림을 CSV / NDJSON / JSON 배열로 직렬화하는 유틸리티
+StreamingResponse와 함께 사용하여 일정한 메모리로 대용량 데이터를 내보냅니다.
+"""
+
+import csv
+import io
+import json
+import zlib
+from datetime import date, datetime
+from typing import Any, AsyncIterator, Sequence
+
+from sqlalchemy import RowMapping
+
+# 지원하는 내보내기 형식: 형식 → (media type, 파일 확장자)
+EXPORT_FORMATS: dict[str, tuple[str, str]] = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "json": ("application/json", "json"),
+}
+
+
+def _to_jsonable(value: Any) -> Any:
+    """JSON으로 표현할 수 없는 값(날짜 등) 변환"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _dump_json(row: RowMapping, fields: Sequence[str]) -> str:
+    """행을 한 줄짜리 JSON 문자열로 직렬화"""
+    return json.dumps(
+        {field: _to_jsonable(row[field]) for field in fields},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+async def serialize_rows(
+    rows: AsyncIterator[RowMapping],
+    format: str,
+    fields: Sequence[str],
+    chunk_rows: int = 500,
+) -> AsyncIterator[bytes]:
+    """
+    행 스트림을 지정한 형식의 바이트 청크로 직렬화
+
+    행을 하나씩 보내지 않고 chunk_rows개 단위로 모아서 내보내므로
+    전송 오버헤드가 줄어들고, 메모리에는 한 청크만 유지됩니다.
+
+    Args:
+        rows: 행 매핑 비동기 이터레이터
+        format: "csv", "ndjson", "json" 중 하나
+        fields: 출력할 필드 (순서 유지)
+        chunk_rows: 한 청크에 포함할 행 수
+
+    Yields:
+        UTF-8 인코딩된 바이트 청크
+    """
+    if format not in EXPORT_FORMATS:
+        raise ValueError(f"지원하지 않는 내보내기 형식입니다: {format}")
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer) if format == "csv" else None
+    pending = 0
+    first = True
+
+    if writer is not None:
+        writer.writerow(fields)
+    elif format == "json":
+        buffer.write("[")
+
+    async for row in rows:
+        if writer is not None:
+            writer.writerow([_to_jsonable(row[field]) for field in fields])
+        elif format == "ndjson":
+            buffer.write(_dump_json(row, fields))
+            buffer.write("\n")
+        else:
+            if not first:
+                buffer.write(",")
+            buffer.write(_dump_json(row, fields))
+        first = False
+
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+
+    if format == "json":
+        buffer.write("]")
+
+    tail = buffer.getvalue()
+    if tail:
+        yield tail.encode("utf-8")
+
+
+async def gzip_stream(
+    chunks: AsyncIterator[bytes],
+    level: int = 6,
+) -> AsyncIterator[bytes]:
+    """
+    바이트 스트림을 gzip으로 압축 (스트리밍)
+
+    청크마다 Z_SYNC_FLUSH를 수행하여 클라이언트가 받은 만큼 바로
+    압축을 풀 수 있게 합니다.
+
+    Args:
+        chunks: 원본 바이트 청크 이터레이터
+        level: 압축 레벨 (1~9)
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # 31 = gzip 헤더 포함
+
+    async for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+
+    yield compressor.flush()
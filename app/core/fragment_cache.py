@@ -0,0 +1,246 @@
+"""
+Template Fragment Cache
+
+템플릿 일부(레이아웃 컴포넌트 등)의 렌더링 결과를 앱 캐시에 저장하는
+Jinja 확장
+
+사용:
+    {% cache "footer" %}...{% endcache %}
+    {% cache "navbar:" ~ current_user.id, 300, tags="user:" ~ current_user.id %}
+        {% include "components/navbar.html" %}
+    {% endcache %}
+
+    - key: 조각 키 (블록이 있는 템플릿 이름과 템플릿 버전이 자동으로 붙음)
+    - ttl: 만료 시간(초), 없으면 TEMPLATE_FRAGMENT_CACHE_TTL
+    - tags: 문자열 또는 목록, 태그 무효화 시 함께 삭제
+      (예: "user:{id}" - 사용자 정보 변경 커밋 시 UserService가 무효화)
+    - store: 앱 캐시 대신 사용할 프로세스 내 전용 저장소 이름 (FRAGMENT_STORES)
+
+전용 저장소:
+    - "cards": 렌더링한 아이템 카드 (partials/items/item.html)
+      키에 소유자 ID, 아이템 ID(샤드마다 따로 매겨짐), item.updated_at과 소유자
+      아이템 세대(card_version, item_card_version)를 넣어 버전마다 다른 키를
+      쓰므로, 목록/상세/변경 파셜과 아이템 페이지가 같은 카드를 공유하고 바뀐
+      카드만 다시 렌더링합니다. 저장소는 워커마다 따로 있지만 세대는 공유
+      캐시에 있으므로, 다른 워커에서 커밋된 변경도 updated_at 정밀도(초 단위 등)와
+      관계없이 다음 렌더링부터 반영됩니다.
+      항목 수 제한(LRU)이 있고, 변경 파셜(forget_item_card)과 이 워커에서 커밋된
+      아이템 변경(items:owner:{owner_id} 태그, on_invalidate 훅)에서 즉시 삭제합니다.
+
+동기 환경(일반 렌더링)에서는 async 캐시를 기다릴 수 없으므로 프로세스 내
+메모리 캐시(MemoryCache, TieredCache의 L1)만 사용하고, 비동기 환경(스트리밍)은
+캐시 백엔드 전체를 사용합니다. 사용할 수 있는 캐시가 없으면 매번 렌더링합니다.
+
+템플릿 버전:
+    블록 안에서 include한 템플릿(partials/navbar.html 등)이 바뀌어도 키가
+    달라지도록, 블록이 있는 파일이 아니라 템플릿 디렉토리 전체의 최종 수정
+    시각을 키에 넣습니다. auto_reload가 꺼진 환경(프로덕션)은 프로세스마다 한 번
+    (배포/재시작 시) 계산하고, 켜진 환경(개발)은 최대 1초마다 다시 확인합니다.
+"""
+
+import os
+import time
+from typing import Any, Awaitable, Callable, Iterable, Optional, Union
+
+from jinja2 import Environment, nodes
+from jinja2.ext import Extension
+from jinja2.parser import Parser
+from markupsafe import Markup
+
+from app.config import settings
+from app.core.cache import (
+    MISSING,
+    Cache,
+    MemoryCache,
+    TieredCache,
+    current_generation,
+    get_cache,
+    on_invalidate,
+)
+
+# 렌더링한 아이템 카드 저장소 (워커마다 별도)
+card_cache = MemoryCache(
+    max_entries=settings.template_card_cache_entries,
+    default_ttl=settings.template_card_cache_ttl,
+)
+
+# {% cache ..., store="이름" %}으로 사용할 수 있는 전용 저장소
+FRAGMENT_STORES: dict[str, MemoryCache] = {"cards": card_cache}
+
+# 커밋된 변경의 태그(items:owner:{owner_id} 등)로 전용 저장소의 조각도 삭제
+on_invalidate(lambda tags: card_cache.invalidate_tags_nowait(*tags))
+
+
+def forget_item_card(owner_id: int, item_id: int) -> None:
+    """
+    아이템 카드 삭제 (변경 파셜이 렌더링 전에 호출)
+
+    변경 직후 updated_at과 세대가 이전과 같을 수 있으므로(커밋 전, 같은 초)
+    같은 키의 이전 카드를 쓰지 않도록 먼저 지웁니다. 커밋 후에는 on_invalidate
+    훅이 한 번 더 지우고, 다른 워커는 바뀐 세대로 다시 렌더링합니다.
+    """
+    card_cache.invalidate_tags_nowait(f"item:{owner_id}:{item_id}")
+
+
+async def item_card_version(owner_id: int) -> Optional[int]:
+    """
+    아이템 카드 키에 넣을 소유자 아이템 세대 (템플릿 변수 card_version)
+
+    커밋된 아이템 변경마다 공유 캐시에서 바뀌므로 모든 워커의 카드 키가
+    함께 바뀝니다. 캐시가 없으면 None (updated_at만으로 구분).
+    """
+    return await current_generation(f"items:owner:{owner_id}")
+
+
+def directory_version(directory: str) -> str:
+    """디렉토리 안 파일의 최종 수정 시각 (없으면 "0")"""
+    latest = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            latest = max(latest, os.stat(os.path.join(root, name)).st_mtime_ns)
+    return str(latest)
+
+
+def fragment_cache_stats() -> dict[str, Any]:
+    """전용 저장소별 항목 수와 적중/미스/제거 통계"""
+    return {
+        name: {**store.stats(), "entries": len(store), "max_entries": store.max_entries}
+        for name, store in FRAGMENT_STORES.items()
+    }
+
+
+def _sync_cache(cache: Optional[Cache]) -> Optional[MemoryCache]:
+    """동기로 조회/저장할 수 있는 프로세스 내 캐시"""
+    if isinstance(cache, MemoryCache):
+        return cache
+    if isinstance(cache, TieredCache):
+        return cache.l1
+    return None
+
+
+def _tag_list(tags: Union[str, Iterable[str], None]) -> tuple[str, ...]:
+    """tags 인자를 태그 튜플로 (없거나 undefined면 빈 튜플)"""
+    if not tags:
+        return ()
+    if isinstance(tags, str):
+        return (tags,)
+    return tuple(tag for tag in tags if tag)
+
+
+class FragmentCacheExtension(Extension):
+    """{% cache key[, ttl][, tags=...][, store=...] %}...{% endcache %} 블록"""
+
+    # Jinja는 태그를 순회만 하므로 변경할 수 없는 집합 사용 (Extension.tags는 set으로 선언됨)
+    tags = frozenset({"cache"})  # type: ignore[assignment]
+
+    # auto_reload 환경에서 템플릿 버전을 다시 확인하는 최소 간격(초)
+    VERSION_CHECK_INTERVAL = 1.0
+
+    def __init__(self, environment: Environment) -> None:
+        super().__init__(environment)
+        self._version: Optional[str] = None
+        self._version_checked = 0.0
+
+    def templates_version(self) -> str:
+        """로더 디렉토리 전체의 최종 수정 시각 (include한 템플릿 변경 포함)"""
+        now = time.monotonic()
+        if self._version is None or (
+            self.environment.auto_reload
+            and now - self._version_checked >= self.VERSION_CHECK_INTERVAL
+        ):
+            searchpath = getattr(self.environment.loader, "searchpath", ())
+            self._version = "-".join(directory_version(path) for path in searchpath) or "0"
+            self._version_checked = now
+        return self._version
+
+    def parse(self, parser: Parser) -> nodes.Node:
+        lineno = next(parser.stream).lineno
+        key = parser.parse_expression()
+        ttl: nodes.Expr = nodes.Const(None)
+        tags: nodes.Expr = nodes.Const(None)
+        store: nodes.Expr = nodes.Const(None)
+
+        while parser.stream.skip_if("comma"):
+            if parser.stream.current.type == "name" and parser.stream.look().type == "assign":
+                name = next(parser.stream).value
+                parser.stream.expect("assign")
+                if name == "ttl":
+                    ttl = parser.parse_expression()
+                elif name == "tags":
+                    tags = parser.parse_expression()
+                elif name == "store":
+                    store = parser.parse_expression()
+                else:
+                    parser.fail(f"cache 블록에 알 수 없는 인자: {name}", lineno)
+            else:
+                ttl = parser.parse_expression()
+
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+
+        # 템플릿 버전은 컴파일 결과(바이트코드 캐시)에 고정되지 않도록 렌더링 시 붙임
+        prefix = nodes.Const(f"fragment:{parser.name}:")
+
+        return nodes.CallBlock(
+            self.call_method("_render", [prefix, key, ttl, tags, store]), [], [], body
+        ).set_lineno(lineno)
+
+    def _render(
+        self,
+        prefix: str,
+        key: Any,
+        ttl: Optional[int],
+        tags: Union[str, Iterable[str], None],
+        store: Optional[str],
+        caller: Callable[[], Any],
+    ) -> Any:
+        """조각 캐시 조회, 없으면 블록을 렌더링하여 저장"""
+        key = f"{prefix}{self.templates_version()}:{key}"
+        tags = _tag_list(tags)
+        cache: Optional[MemoryCache]
+        if store is not None:
+            # 전용 저장소는 동기 메모리 캐시이므로 두 환경에서 같은 방식으로 사용
+            cache = FRAGMENT_STORES[store]
+            ttl = ttl or cache.default_ttl
+        else:
+            ttl = ttl or settings.template_fragment_cache_ttl
+            if self.environment.is_async:
+                return self._render_async(key, ttl, tags, caller)
+            cache = _sync_cache(get_cache())
+        if cache is None:
+            return caller()
+
+        value = cache.get_nowait(key)
+        if value is MISSING:
+            value = caller()
+            if self.environment.is_async:
+                return self._store_async(cache, key, value, ttl, tags)
+            cache.set_nowait(key, str(value), ttl, tags)
+        return Markup(value)
+
+    async def _store_async(
+        self,
+        cache: MemoryCache,
+        key: str,
+        rendered: Awaitable[str],
+        ttl: int,
+        tags: tuple[str, ...],
+    ) -> Markup:
+        value = await rendered
+        cache.set_nowait(key, str(value), ttl, tags)
+        return Markup(value)
+
+    async def _render_async(
+        self,
+        key: str,
+        ttl: int,
+        tags: tuple[str, ...],
+        caller: Callable[[], Any],
+    ) -> Markup:
+        cache = get_cache()
+        if cache is None:
+            return await caller()
+        value = await cache.get(key)
+        if value is MISSING:
+            value = await caller()
+            await cache.set(key, str(value), ttl, tags)
+        return Markup(value)
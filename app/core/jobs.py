@@ -0,0 +1,126 @@
+"""
+Background Job Registry
+
+요청 이후에도 계속 실행되는 백그라운드 작업(가져오기, 대량 삭제 등)의
+진행 상황을 추적하는 프로세스 내 작업 레지스트리
+
+Note:
+    작업 상태는 워커 프로세스 메모리에 저장됩니다.
+    workers > 1 환경에서는 진행 상황 폴링이 작업을 시작한 워커로
+    라우팅되어야 합니다 (sticky session 등).
+"""
+
+import asyncio
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Optional
+
+# 작업 상태 값
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+
+
+@dataclass
+class Job:
+    """백그라운드 작업 상태"""
+
+    id: str
+    kind: str
+    owner_id: int
+    status: str = JOB_PENDING
+    total: Optional[int] = None
+    processed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    message: Optional[str] = None
+    errors: list[dict[str, Any]] = field(default_factory=list)
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: Optional[datetime] = None
+
+    @property
+    def done(self) -> bool:
+        """작업 종료 여부 (성공/실패 무관)"""
+        return self.status in (JOB_COMPLETED, JOB_FAILED)
+
+    @property
+    def progress(self) -> Optional[float]:
+        """진행률 (0~100, 전체 크기를 모르면 None)"""
+        if self.done:
+            return 100.0
+        if not self.total:
+            return None
+        return min(100.0, self.processed * 100.0 / self.total)
+
+
+class JobRegistry:
+    """
+    작업 레지스트리
+
+    최근 작업을 최대 max_jobs개까지 보관하며, 초과하면 종료된 작업부터
+    오래된 순서로 제거합니다.
+    """
+
+    def __init__(self, max_jobs: int = 1000):
+        self.max_jobs = max_jobs
+        self._jobs: OrderedDict[str, Job] = OrderedDict()
+        self._tasks: dict[str, asyncio.Task] = {}
+
+    def create(self, kind: str, owner_id: int) -> Job:
+        """새 작업 등록"""
+        job = Job(id=uuid.uuid4().hex, kind=kind, owner_id=owner_id)
+        self._jobs[job.id] = job
+        self._evict()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """작업 조회"""
+        return self._jobs.get(job_id)
+
+    def run(self, job: Job, func: Callable[[Job], Awaitable[None]]) -> asyncio.Task:
+        """
+        작업 실행
+
+        func(job)을 백그라운드 태스크로 실행하고 상태 전이를 관리합니다.
+        func 내부에서 발생한 예외는 작업 실패로 기록됩니다.
+        """
+
+        async def runner() -> None:
+            job.status = JOB_RUNNING
+            try:
+                await func(job)
+                job.status = JOB_COMPLETED
+            except Exception as exc:
+                job.status = JOB_FAILED
+                job.message = str(exc) or exc.__class__.__name__
+            finally:
+                job.finished_at = datetime.now(timezone.utc)
+                self._tasks.pop(job.id, None)
+
+        task = asyncio.create_task(runner())
+        # 태스크가 GC되지 않도록 참조 유지
+        self._tasks[job.id] = task
+        return task
+
+    async def wait(self, job_id: str) -> Optional[Job]:
+        """작업 종료까지 대기 (테스트/종료 처리용)"""
+        task = self._tasks.get(job_id)
+        if task is not None:
+            await asyncio.shield(task)
+        return self.get(job_id)
+
+    def _evict(self) -> None:
+        """보관 한도를 넘은 종료 작업 제거"""
+        if len(self._jobs) <= self.max_jobs:
+            return
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.done]:
+            del self._jobs[job_id]
+            if len(self._jobs) <= self.max_jobs:
+                break
+
+
+# 전역 작업 레지스트리
+job_registry = JobRegistry()
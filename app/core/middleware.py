@@ -0,0 +1,365 @@
+"""
+Custom Middleware
+
+애플리케이션 전용 ASGI 미들웨어 정의
+"""
+
+import asyncio
+import logging
+from http.cookies import CookieError, SimpleCookie
+from typing import Optional, Sequence
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.cache import MISSING, get_cache
+from app.core.etag import compute_etag, etag_matches
+from app.core.fragment_cache import directory_version
+from app.database import PRIMARY_PIN_COOKIE
+
+logger = logging.getLogger(__name__)
+
+
+class ReadYourWritesMiddleware:
+    """
+    쓰기 후 읽기 일관성(read-your-writes) 미들웨어
+
+    요청 처리 중 DB 쓰기가 발생하면 응답에 짧은 수명의 PRIMARY_PIN_COOKIE를
+    설정합니다. 쿠키가 유효한 동안 해당 클라이언트의 읽기 요청은 레플리카 대신
+    프라이머리를 사용하므로 복제 지연 때문에 방금 변경한 데이터가 사라져 보이는
+    일이 없습니다. 쿠키 기반이므로 여러 워커에서도 동일하게 동작합니다.
+    """
+
+    def __init__(self, app: ASGIApp, pin_seconds: int = 5):
+        self.app = app
+        self.pin_seconds = pin_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                session = scope.get("state", {}).get("db_session")
+                if session is not None and session.info.get("wrote"):
+                    cookie = SimpleCookie()
+                    cookie[PRIMARY_PIN_COOKIE] = "1"
+                    cookie[PRIMARY_PIN_COOKIE]["max-age"] = self.pin_seconds
+                    cookie[PRIMARY_PIN_COOKIE]["path"] = "/"
+                    cookie[PRIMARY_PIN_COOKIE]["httponly"] = True
+                    cookie[PRIMARY_PIN_COOKIE]["samesite"] = "lax"
+                    headers = list(message.get("headers", []))
+                    headers.append(
+                        (b"set-cookie", cookie.output(header="").strip().encode("latin-1"))
+                    )
+                    message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+class RequestCoalescingMiddleware:
+    """
+    동일 요청 합치기(request coalescing) 미들웨어
+
+    더블 클릭, HTMX 트리거 연속 발생, 여러 탭 새로고침으로 같은 사용자의
+    같은 GET/HEAD 요청이 동시에 들어오면 첫 요청(리더)만 핸들러를 실행하고,
+    처리 중에 도착한 나머지(팔로워)는 리더의 응답을 그대로 받습니다.
+
+    키: 메서드, 경로, 쿼리 문자열, Cookie 헤더(= 사용자), 응답이 달라지는 헤더
+    (Accept, Origin, HX-Request, If-None-Match 등). 처리가 끝난 응답은 보관하지 않습니다(캐시 아님).
+
+    스트리밍 응답(본문이 여러 조각, 예: render_template_async로 스트리밍하는
+    /dashboard, /items 페이지)은 합치지 않습니다. 리더의 첫 조각이 more_body이면
+    기다리던 팔로워를 바로 풀어 각자 처리하게 하므로, 팔로워가 리더의 전체
+    본문을 기다리느라 첫 바이트가 늦어지지 않습니다.
+
+    Args:
+        app: ASGI 앱
+        paths: 합치기를 적용할 경로 접두사 (예: "/items" → /items, /items/...)
+        max_body_bytes: 팔로워와 공유할 최대 응답 크기 (넘으면 팔로워가 직접 처리)
+    """
+
+    SAFE_METHODS = ("GET", "HEAD")
+    VARY_HEADERS = (
+        b"cookie",
+        b"accept",
+        b"accept-encoding",
+        b"origin",
+        b"hx-request",
+        b"hx-target",
+        b"hx-boosted",
+        b"if-none-match",
+    )
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: Sequence[str] = (),
+        max_body_bytes: int = 1024 * 1024,
+    ):
+        self.app = app
+        self.paths = tuple(path.rstrip("/") for path in paths)
+        self.max_body_bytes = max_body_bytes
+        self._inflight: dict[tuple, asyncio.Future] = {}
+        # 통계
+        self.coalesced = 0
+
+    def _key(self, scope: Scope) -> Optional[tuple]:
+        """합치기 대상이면 요청 키, 아니면 None"""
+        if scope["type"] != "http" or scope["method"] not in self.SAFE_METHODS:
+            return None
+        path = scope["path"]
+        if not any(path == prefix or path.startswith(prefix + "/") for prefix in self.paths):
+            return None
+        headers = dict(scope["headers"])
+        return (
+            scope["method"],
+            path,
+            scope.get("query_string", b""),
+            *(headers.get(name) for name in self.VARY_HEADERS),
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        key = self._key(scope)
+        if key is None:
+            await self.app(scope, receive, send)
+            return
+
+        leader = self._inflight.get(key)
+        if leader is not None:
+            shared = await asyncio.shield(leader)
+            if shared is not None:
+                self.coalesced += 1
+                for message in shared:
+                    await send(message)
+                return
+            # 리더가 실패했거나 응답이 스트리밍/너무 크면 직접 처리
+            await self.app(scope, receive, send)
+            return
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        messages: Optional[list[Message]] = []
+        body_size = 0
+
+        def release(result: Optional[list[Message]]) -> None:
+            """팔로워에게 결과 전달 (None이면 각자 처리), 이후 요청은 새 리더가 됨"""
+            if self._inflight.get(key) is future:
+                del self._inflight[key]
+            if not future.done():
+                future.set_result(result)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal messages, body_size
+            if messages is not None and message["type"] == "http.response.body":
+                body_size += len(message.get("body", b""))
+                if message.get("more_body", False) or body_size > self.max_body_bytes:
+                    # 스트리밍/큰 응답은 공유하지 않고 팔로워를 바로 풀어줌
+                    messages = None
+                    release(None)
+                else:
+                    messages.append(message)
+                    release(messages)
+            elif messages is not None:
+                messages.append(message)
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            release(None)
+
+
+class AnonymousPageCacheMiddleware:
+    """
+    익명 페이지 응답 캐시 미들웨어
+
+    로그인하지 않은 방문자에게 같은 HTML을 보여주는 페이지(홈, 소개, 로그인 등)의
+    응답 전체를 앱 캐시에 저장하고, 다음 익명 요청에는 라우팅, 의존성, 템플릿
+    렌더링 없이 저장된 응답을 보냅니다. 인증 쿠키(access_token)나
+    Authorization 헤더가 있는 요청은 거치지 않습니다.
+
+    응답에는 본문 해시 ETag를 붙이고, If-None-Match가 일치하면 304로 응답합니다.
+    200 HTML 응답 중 Set-Cookie가 없는 것만 저장합니다.
+
+    키: 경로, 쿼리 문자열, 응답이 달라지는 HTMX 헤더, 템플릿 버전
+    (템플릿 파일 최종 수정 시각 - 배포로 템플릿이 바뀌면 공유 캐시의 이전
+    응답을 쓰지 않음)
+
+    Args:
+        app: ASGI 앱
+        paths: 캐시할 경로 (정확히 일치)
+        ttl: 저장 시간(초)
+        auth_cookie: 인증 쿠키 이름
+        template_directory: 버전 계산에 사용할 템플릿 디렉토리
+    """
+
+    SAFE_METHODS = ("GET", "HEAD")
+    CACHE_TAG = "pages:anonymous"
+    VARY_HEADERS = (b"hx-request", b"hx-target", b"hx-history-restore-request")
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        paths: Sequence[str] = (),
+        ttl: int = 300,
+        auth_cookie: str = "access_token",
+        template_directory: str = "templates",
+    ):
+        self.app = app
+        self.paths = frozenset(paths)
+        self.ttl = ttl
+        self.auth_cookie = auth_cookie
+        self.version = directory_version(template_directory)
+        # 통계
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def _is_authenticated(self, headers: dict[bytes, bytes]) -> bool:
+        if b"authorization" in headers:
+            return True
+        raw = headers.get(b"cookie")
+        if not raw:
+            return False
+        try:
+            cookie = SimpleCookie(raw.decode("latin-1"))
+        except CookieError:
+            return True  # 해석할 수 없으면 캐시하지 않음
+        return self.auth_cookie in cookie
+
+    def _key(self, scope: Scope) -> Optional[str]:
+        """캐시 대상이면 캐시 키, 아니면 None"""
+        if scope["type"] != "http" or scope["method"] not in self.SAFE_METHODS:
+            return None
+        if scope["path"] not in self.paths:
+            return None
+        headers = dict(scope["headers"])
+        if self._is_authenticated(headers):
+            return None
+        query = scope.get("query_string", b"").decode("latin-1")
+        variant = ":".join(
+            headers.get(name, b"").decode("latin-1") for name in self.VARY_HEADERS
+        )
+        return f"page:{self.version}:{scope['path']}?{query}:{variant}"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        key = self._key(scope)
+        cache = get_cache() if key is not None else None
+        if key is None or cache is None:
+            await self.app(scope, receive, send)
+            return
+
+        entry = await cache.get(key)
+        if entry is not MISSING:
+            self.hits += 1
+            await self._send(scope, send, *entry)
+            return
+
+        if scope["method"] != "GET":
+            # HEAD 응답에는 본문이 없으므로 저장하지 않음
+            await self.app(scope, receive, send)
+            return
+
+        self.misses += 1
+        messages: list[Message] = []
+
+        async def send_wrapper(message: Message) -> None:
+            messages.append(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+        if not messages:
+            # 응답을 보내지 않고 끝난 경우 (연결 종료 등) 저장할 것이 없음
+            return
+        start = messages[0]
+        headers = MutableHeaders(raw=list(start.get("headers", [])))
+        body = b"".join(m.get("body", b"") for m in messages if m["type"] == "http.response.body")
+        cacheable = (
+            start["status"] == 200
+            and "set-cookie" not in headers
+            and headers.get("content-type", "").startswith("text/html")
+        )
+        if not cacheable:
+            for message in messages:
+                await send(message)
+            return
+
+        # 저장한 응답을 다시 보낼 때는 렌더링하지 않으므로 렌더링 시간 제외
+        del headers["server-timing"]
+        headers["etag"] = compute_etag(body)
+        headers["cache-control"] = "no-cache"
+        headers.add_vary_header("Cookie")
+        entry = (start["status"], headers.raw, body)
+        await cache.set(key, entry, self.ttl, tags=(self.CACHE_TAG,))
+        await self._send(scope, send, *entry)
+
+    async def _send(
+        self,
+        scope: Scope,
+        send: Send,
+        status: int,
+        raw_headers: list[tuple[bytes, bytes]],
+        body: bytes,
+    ) -> None:
+        """저장된 응답 전송 (If-None-Match가 일치하면 304)"""
+        headers = MutableHeaders(raw=list(raw_headers))
+        request_headers = dict(scope["headers"])
+        if_none_match = request_headers.get(b"if-none-match", b"").decode("latin-1")
+        if etag_matches(if_none_match, headers["etag"]):
+            self.not_modified += 1
+            status, body = 304, b""
+            del headers["content-length"]
+            del headers["content-type"]
+        await send({"type": "http.response.start", "status": status, "headers": headers.raw})
+        await send(
+            {"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else body}
+        )
+
+
+async def prewarm_pages(app: ASGIApp, paths: Sequence[str]) -> int:
+    """
+    익명 GET 요청을 앱에 직접 보내 응답 캐시를 채움 (시작 시 사용)
+
+    한 페이지의 렌더링이 실패해도 기록만 하고 나머지 경로를 계속 처리합니다.
+    (시작이 중단되지 않도록)
+
+    Returns:
+        200으로 응답한 경로 수
+    """
+    warmed = 0
+    for path in paths:
+        scope: Scope = {
+            "type": "http",
+            "asgi": {"version": "3.0"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "query_string": b"",
+            "root_path": "",
+            "headers": [(b"host", b"localhost")],
+            "client": None,
+            "server": ("localhost", 80),
+        }
+        status = 0
+
+        async def receive() -> Message:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        try:
+            await app(scope, receive, send)
+        except Exception:
+            logger.exception("익명 페이지 미리 렌더링 실패: %s", path)
+            continue
+        warmed += status == 200
+    return warmed
+
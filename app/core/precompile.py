@@ -0,0 +1,39 @@
+"""
+Template Precompile
+
+템플릿을 모두 컴파일하여 바이트코드 캐시를 미리 채우는 명령
+(Docker 이미지 빌드나 배포 직후, 워커 시작 전에 실행)
+
+사용 예:
+    python -m app.core.precompile
+    python -m app.core.precompile --cache-dir ./.jinja_cache
+"""
+
+import argparse
+from typing import Optional, Sequence
+
+from app.config import settings
+from app.core.templates import create_template_environment, precompile_templates
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description="템플릿 미리 컴파일")
+    parser.add_argument(
+        "--cache-dir",
+        default=settings.template_bytecode_cache_dir,
+        help="바이트코드 캐시 디렉토리 (기본값: TEMPLATE_BYTECODE_CACHE_DIR)",
+    )
+    args = parser.parse_args(argv)
+
+    # 일반 렌더링 환경과 스트리밍(비동기) 환경의 캐시를 모두 채움
+    for enable_async in (False, True):
+        env = create_template_environment(
+            production=True, bytecode_cache_dir=args.cache_dir, enable_async=enable_async
+        )
+        count = precompile_templates(env)
+    print(f"템플릿 {count}개 컴파일 완료")
+
+
+if __name__ == "__main__":
+    main()
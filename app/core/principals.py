@@ -0,0 +1,376 @@
+"""
+Shared Principal Table
+
+같은 호스트의 모든 uvicorn 워커가 공유하는 인증 사용자(principal) 테이블
+(multiprocessing.shared_memory 사용, Redis 불필요)
+
+워커마다 캐시를 두면 워커 수만큼 메모리와 미스가 늘고, 한 워커에서 비활성화한
+사용자가 다른 워커의 캐시에는 TTL 동안 활성으로 남습니다.
+이 테이블은 사용자마다 고정 크기 레코드(id, 플래그, epoch)만 저장하여
+모든 워커가 같은 인증 상태를 보게 합니다.
+
+역할:
+    사용자 객체를 저장하는 캐시가 아니라 활성 여부와 무효화(epoch)만 공유하는
+    테이블입니다. 비활성 사용자는 레코드만으로 거부하고(get_current_user),
+    활성 사용자의 User 객체는 epoch를 키에 넣은 워커별 캐시에서 가져옵니다.
+    (핸들러와 템플릿이 이름/이메일 등 User 전체를 사용하므로 레코드만으로는
+    응답할 수 없음) DB 조회는 워커마다 epoch가 바뀐 뒤 처음 한 번입니다.
+
+구조:
+    [헤더 64B][스트라이프 epoch × stripes][레코드 32B × slots]
+
+    - 레코드: seq(u64) | user_id(i64) | epoch(u64) | flags(u32) | expires_at(u32)
+    - 사용자는 user_id % buckets 버킷(ways개 레코드)에 저장, 버킷이 차면
+      만료가 가장 이른 레코드를 교체
+    - 버킷은 stripes개의 잠금 스트라이프로 나뉘며, 쓰기는 잠금 파일의
+      스트라이프 바이트에 fcntl.lockf 잠금을 잡고 수행 (프로세스 간 잠금)
+    - 읽기는 잠금 없이 seqlock으로 수행: 쓰기 중(seq 홀수)이거나 읽는 동안
+      seq가 바뀌었으면 다시 읽음
+
+epoch:
+    스트라이프마다 epoch 카운터가 있고, 사용자 변경이 커밋되면 그 사용자의
+    레코드를 지우고 스트라이프 epoch를 올립니다.
+    DB에서 불러온 값은 불러오기 전에 읽은 epoch가 그대로일 때만 저장하므로
+    변경과 동시에 읽은 오래된 값이 테이블에 들어가지 않습니다.
+    레코드의 epoch는 워커별 사용자 캐시 키에도 쓰여(UserService.get_principal)
+    변경 후에는 모든 워커가 새 키로 조회하게 됩니다.
+
+Note:
+    조회는 메모리 뷰에서 struct.unpack_from으로 직접 읽으므로 bytes 복사가 없습니다.
+    (결과 튜플 외에는 할당하지 않음)
+    fcntl 잠금은 프로세스 단위이므로 한 프로세스 안의 여러 스레드에서
+    동시에 쓰지 않아야 합니다. (asyncio 워커는 단일 스레드)
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+import time
+from multiprocessing import resource_tracker, shared_memory
+from typing import Any, Iterable, NamedTuple, Optional
+
+from app.config import settings
+from app.core.cache import on_invalidate
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+# 플래그 비트
+PRINCIPAL_ACTIVE = 1 << 0
+PRINCIPAL_SUPERUSER = 1 << 1
+PRINCIPAL_VERIFIED = 1 << 2
+
+_MAGIC = 0x5052494E43495031  # "PRINCIP1"
+_HEADER = struct.Struct("<QIII")  # magic, slots, ways, stripes
+_HEADER_SIZE = 64
+_EPOCH = struct.Struct("<Q")
+_SEQ = struct.Struct("<Q")
+_RECORD = struct.Struct("<QqQII")  # seq, user_id, epoch, flags, expires_at
+_SEQLOCK_RETRIES = 16
+
+
+class Principal(NamedTuple):
+    """공유 테이블의 사용자 레코드"""
+
+    flags: int
+    epoch: int
+
+    @property
+    def is_active(self) -> bool:
+        return bool(self.flags & PRINCIPAL_ACTIVE)
+
+
+def principal_flags(user: Any) -> int:
+    """사용자 객체의 플래그 비트"""
+    return (
+        (PRINCIPAL_ACTIVE if user.is_active else 0)
+        | (PRINCIPAL_SUPERUSER if user.is_superuser else 0)
+        | (PRINCIPAL_VERIFIED if user.is_verified else 0)
+    )
+
+
+class SharedPrincipalTable:
+    """
+    공유 메모리 principal 해시 테이블
+
+    같은 name으로 만든 인스턴스는 (프로세스가 달라도) 같은 메모리를 사용합니다.
+    처음 만든 프로세스가 메모리를 생성하고 나머지는 연결합니다.
+
+    Args:
+        name: 공유 메모리 이름
+        slots: 레코드 수 (ways의 배수로 올림)
+        ways: 버킷당 레코드 수
+        stripes: 잠금 스트라이프 수
+        ttl: 레코드 유지 시간 (초, DB를 직접 수정한 경우의 최대 지연)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        slots: int = 65536,
+        ways: int = 4,
+        stripes: int = 64,
+        ttl: int = 300,
+    ):
+        if fcntl is None:  # pragma: no cover - Windows
+            raise RuntimeError("공유 principal 테이블은 fcntl을 지원하는 OS에서만 사용할 수 있습니다.")
+
+        self.name = name
+        self.ways = ways
+        self.buckets = max(1, -(-slots // ways))
+        self.slots = self.buckets * ways
+        self.stripes = stripes
+        self.ttl = ttl
+        self._records_offset = -(-(_HEADER_SIZE + _EPOCH.size * stripes) // 64) * 64
+        size = self._records_offset + _RECORD.size * self.slots
+
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+            created = True
+        except FileExistsError:
+            self._shm = shared_memory.SharedMemory(name=name)
+            created = False
+        # 워커 하나가 종료될 때 resource_tracker가 공유 메모리를 지우지 않도록 등록 해제
+        try:
+            resource_tracker.unregister(self._shm._name, "shared_memory")  # type: ignore[attr-defined]
+        except (KeyError, AttributeError):  # pragma: no cover - 등록되지 않음/내부 API 변경
+            pass
+
+        buf = self._shm.buf
+        assert buf is not None  # 연결 직후에는 항상 있음 (close()에서만 해제)
+        self._buf: memoryview = buf
+        self._lock_fd = os.open(
+            os.path.join(tempfile.gettempdir(), f"{name}.lock"), os.O_RDWR | os.O_CREAT, 0o600
+        )
+        if created:
+            self._initialize()
+        else:
+            self._check_layout()
+
+    def _initialize(self) -> None:
+        """스트라이프 epoch를 시각 기반으로 초기화 (재생성 후 이전 epoch 키와 겹치지 않도록)"""
+        start = time.time_ns()
+        for stripe in range(self.stripes):
+            _EPOCH.pack_into(self._buf, self._epoch_offset(stripe), start)
+        _HEADER.pack_into(self._buf, 0, _MAGIC, self.slots, self.ways, self.stripes)
+
+    def _check_layout(self) -> None:
+        """다른 프로세스가 만든 테이블의 구조 확인 (초기화 완료까지 잠시 대기)"""
+        for _ in range(100):
+            magic, slots, ways, stripes = _HEADER.unpack_from(self._buf, 0)
+            if magic == _MAGIC:
+                break
+            time.sleep(0.01)
+        else:
+            raise RuntimeError(f"공유 principal 테이블 {self.name}이 초기화되지 않았습니다.")
+        if (slots, ways, stripes) != (self.slots, self.ways, self.stripes):
+            raise RuntimeError(
+                f"공유 principal 테이블 {self.name}의 구조가 설정과 다릅니다. "
+                f"(slots={slots}, ways={ways}, stripes={stripes})"
+            )
+
+    # -------------------------------------------------------------------------
+    # 위치 계산 / 잠금
+    # -------------------------------------------------------------------------
+
+    def _bucket(self, user_id: int) -> int:
+        return user_id % self.buckets
+
+    def _stripe(self, user_id: int) -> int:
+        return self._bucket(user_id) % self.stripes
+
+    def _epoch_offset(self, stripe: int) -> int:
+        return _HEADER_SIZE + _EPOCH.size * stripe
+
+    def _record_offset(self, bucket: int, way: int) -> int:
+        return self._records_offset + _RECORD.size * (bucket * self.ways + way)
+
+    def _lock(self, stripe: int) -> None:
+        fcntl.lockf(self._lock_fd, fcntl.LOCK_EX, 1, stripe)
+
+    def _unlock(self, stripe: int) -> None:
+        fcntl.lockf(self._lock_fd, fcntl.LOCK_UN, 1, stripe)
+
+    def _write(self, offset: int, user_id: int, epoch: int, flags: int, expires_at: int) -> None:
+        """seqlock 쓰기 (스트라이프 잠금을 잡은 상태에서 호출)"""
+        seq = _SEQ.unpack_from(self._buf, offset)[0]
+        _SEQ.pack_into(self._buf, offset, seq + 1)
+        _RECORD.pack_into(self._buf, offset, seq + 1, user_id, epoch, flags, expires_at)
+        _SEQ.pack_into(self._buf, offset, seq + 2)
+
+    # -------------------------------------------------------------------------
+    # 조회 / 저장 / 무효화
+    # -------------------------------------------------------------------------
+
+    def get(self, user_id: int) -> Optional[Principal]:
+        """사용자 레코드 조회 (없거나 만료되었으면 None)"""
+        bucket = self._bucket(user_id)
+        now = int(time.time())
+        for way in range(self.ways):
+            offset = self._record_offset(bucket, way)
+            for _ in range(_SEQLOCK_RETRIES):
+                seq, record_id, epoch, flags, expires_at = _RECORD.unpack_from(
+                    self._buf, offset
+                )
+                if seq & 1 == 0 and _SEQ.unpack_from(self._buf, offset)[0] == seq:
+                    break
+            else:
+                return None  # 쓰기 경합이 계속되면 미스로 처리
+            if record_id == user_id:
+                return Principal(flags, epoch) if expires_at > now else None
+        return None
+
+    def epoch(self, user_id: int) -> int:
+        """사용자가 속한 스트라이프의 현재 epoch (DB 조회 전에 읽어서 put()에 전달)"""
+        return _EPOCH.unpack_from(self._buf, self._epoch_offset(self._stripe(user_id)))[0]
+
+    def put(self, user_id: int, flags: int, epoch: int) -> bool:
+        """
+        사용자 레코드 저장
+
+        epoch 이후 같은 스트라이프에 변경(invalidate)이 있었으면 저장하지 않습니다.
+
+        Returns:
+            저장 여부
+        """
+        stripe = self._stripe(user_id)
+        bucket = self._bucket(user_id)
+        now = int(time.time())
+        self._lock(stripe)
+        try:
+            if _EPOCH.unpack_from(self._buf, self._epoch_offset(stripe))[0] != epoch:
+                return False
+
+            victim, victim_expires = 0, None
+            for way in range(self.ways):
+                offset = self._record_offset(bucket, way)
+                _, record_id, _, _, expires_at = _RECORD.unpack_from(self._buf, offset)
+                if record_id == user_id or record_id == 0 or expires_at <= now:
+                    victim = way
+                    break
+                if victim_expires is None or expires_at < victim_expires:
+                    victim, victim_expires = way, expires_at
+
+            self._write(
+                self._record_offset(bucket, victim), user_id, epoch, flags, now + self.ttl
+            )
+            return True
+        finally:
+            self._unlock(stripe)
+
+    def invalidate(self, user_ids: Iterable[int]) -> None:
+        """사용자 레코드 삭제 및 스트라이프 epoch 증가 (변경 커밋 후 호출)"""
+        for user_id in user_ids:
+            stripe = self._stripe(user_id)
+            bucket = self._bucket(user_id)
+            self._lock(stripe)
+            try:
+                epoch_offset = self._epoch_offset(stripe)
+                epoch = _EPOCH.unpack_from(self._buf, epoch_offset)[0]
+                _EPOCH.pack_into(self._buf, epoch_offset, epoch + 1)
+                for way in range(self.ways):
+                    offset = self._record_offset(bucket, way)
+                    if _RECORD.unpack_from(self._buf, offset)[1] == user_id:
+                        self._write(offset, 0, 0, 0, 0)
+            finally:
+                self._unlock(stripe)
+
+    def close(self) -> None:
+        """현재 프로세스의 연결 종료 (공유 메모리는 다른 워커를 위해 유지)"""
+        # self._buf는 self._shm.buf와 같은 뷰이므로 close()에서 해제되어 이후 접근은 ValueError
+        self._shm.close()
+        os.close(self._lock_fd)
+
+    def unlink(self) -> None:
+        """공유 메모리와 잠금 파일 삭제 (모든 워커 종료 후, 테스트용)"""
+        # unlink()가 resource_tracker 등록 해제를 다시 하므로 먼저 등록
+        resource_tracker.register(self._shm._name, "shared_memory")  # type: ignore[attr-defined]
+        self._shm.unlink()
+        try:
+            os.unlink(os.path.join(tempfile.gettempdir(), f"{self.name}.lock"))
+        except FileNotFoundError:
+            pass
+
+
+# =============================================================================
+# 전역 테이블
+# =============================================================================
+
+_table: Optional[SharedPrincipalTable] = None
+_configured = False
+
+
+def default_table_name() -> str:
+    """같은 DB를 쓰는 워커끼리 공유하는 테이블 이름"""
+    digest = hashlib.sha1(settings.database_url.encode()).hexdigest()[:12]
+    return f"principals-{digest}"
+
+
+def create_principal_table() -> Optional[SharedPrincipalTable]:
+    """
+    설정으로 공유 principal 테이블 생성
+
+    principal_cache:
+        - "auto": 워커가 여러 개이고 redis_url이 없을 때 사용
+        - "shared": 항상 사용
+        - "none": 사용 안 함
+    """
+    mode = settings.principal_cache
+    if mode == "none" or fcntl is None:
+        return None
+    if mode == "auto" and (settings.workers <= 1 or settings.redis_url):
+        return None
+    return SharedPrincipalTable(
+        default_table_name(),
+        slots=settings.principal_cache_slots,
+        ttl=settings.principal_cache_ttl,
+    )
+
+
+def get_principal_table() -> Optional[SharedPrincipalTable]:
+    """전역 principal 테이블 (처음 사용 시 설정으로 생성)"""
+    global _table, _configured
+    if not _configured:
+        _table = create_principal_table()
+        _configured = True
+    return _table
+
+
+def set_principal_table(table: Optional[SharedPrincipalTable]) -> None:
+    """전역 principal 테이블 교체 (테스트용)"""
+    global _table, _configured
+    _table = table
+    _configured = True
+
+
+def close_principal_table() -> None:
+    """전역 principal 테이블 연결 종료"""
+    global _table, _configured
+    if _table is not None:
+        _table.close()
+    _table = None
+    _configured = False
+
+
+def lookup_principal(user_id: int) -> Optional[Principal]:
+    """공유 테이블의 사용자 레코드 (테이블을 사용하지 않으면 None)"""
+    table = get_principal_table()
+    return table.get(user_id) if table is not None else None
+
+
+def _invalidate_user_tags(tags: set[str]) -> None:
+    """커밋된 "user:{id}" 무효화 태그를 공유 테이블에 반영"""
+    table = _table if _configured else None
+    if table is None:
+        return
+    user_ids = [
+        int(tag[5:]) for tag in tags if tag.startswith("user:") and tag[5:].isdigit()
+    ]
+    if user_ids:
+        table.invalidate(user_ids)
+
+
+on_invalidate(_invalidate_user_tags)
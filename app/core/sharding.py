@@ -0,0 +1,212 @@
+"""
+Item Sharding
+
+아이템 행을 소유자(owner_id) 기준으로 여러 데이터베이스(샤드)에 나누어 저장하는
+샤드 라우팅 설정 (SQLAlchemy horizontal_shard 확장 사용)
+
+구성:
+    - "primary": 사용자 등 아이템 외의 모든 테이블
+    - "items_0" ~ "items_{N-1}": 아이템 테이블 샤드 (ITEM_SHARD_URLS 순서)
+
+소유자 → 샤드 배정은 jump consistent hash를 사용하므로 샤드를 추가할 때
+옮겨야 하는 소유자가 약 1/N로 최소화됩니다. (item_sharding.rebalance_items 참고)
+
+라우팅 규칙:
+    - INSERT/UPDATE/DELETE(flush): 객체의 owner_id로 샤드 결정
+    - 조회/DML 문: WHERE 절의 owner_id = 값 비교에서 샤드 결정
+    - 소유자 조건이 없는 아이템 조회는 execution_options(cross_shard=True)가
+      있을 때만 모든 샤드를 조회 (관리자 전용 스캔) - 그 외에는 오류
+
+Note:
+    샤드 간에는 외래 키/조인/트랜잭션이 없습니다.
+    아이템 ID는 샤드 내에서만 유일하므로 항상 소유자와 함께 조회합니다.
+"""
+
+from typing import Any, Iterable, Mapping, Optional, Sequence
+
+from sqlalchemy import Table
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.ext.horizontal_shard import ShardedSession
+from sqlalchemy.orm import Mapper, ORMExecuteState
+from sqlalchemy.sql import operators, visitors
+from sqlalchemy.sql.elements import BinaryExpression, BindParameter, ClauseElement
+
+# 아이템 외 테이블이 있는 샤드
+PRIMARY_SHARD = "primary"
+
+# 소유자 조건 없이 모든 아이템 샤드를 조회하도록 허용하는 실행 옵션
+CROSS_SHARD_OPTION = "cross_shard"
+
+# 샤딩 대상 테이블
+ITEMS_TABLE = "items"
+
+
+class ShardRoutingError(Exception):
+    """아이템 문장의 샤드를 결정할 수 없음"""
+
+
+def jump_hash(key: int, buckets: int) -> int:
+    """
+    Jump consistent hash (Lamping & Veach)
+
+    buckets가 N에서 N+1로 늘어날 때 약 1/(N+1)의 키만 새 버킷으로 이동합니다.
+    """
+    b, j = -1, 0
+    key &= 0xFFFFFFFFFFFFFFFF
+    while j < buckets:
+        b = j
+        key = (key * 2862933555777941757 + 1) & 0xFFFFFFFFFFFFFFFF
+        j = int((b + 1) * ((1 << 31) / ((key >> 33) + 1)))
+    return b
+
+
+def item_shard_ids(shard_count: int) -> list[str]:
+    """아이템 샤드 ID 목록"""
+    return [f"items_{index}" for index in range(shard_count)]
+
+
+def _mix64(key: int) -> int:
+    """연속된 ID가 한 샤드에 몰리지 않도록 키를 섞음 (splitmix64 finalizer)"""
+    key = (key ^ (key >> 30)) * 0xBF58476D1CE4E5B9 & 0xFFFFFFFFFFFFFFFF
+    key = (key ^ (key >> 27)) * 0x94D049BB133111EB & 0xFFFFFFFFFFFFFFFF
+    return key ^ (key >> 31)
+
+
+def owner_shard_index(owner_id: int, shard_count: int) -> int:
+    """소유자의 아이템 샤드 번호"""
+    return jump_hash(_mix64(owner_id), shard_count)
+
+
+def _is_items_table(table: Any) -> bool:
+    """아이템 테이블 여부"""
+    return isinstance(table, Table) and table.name == ITEMS_TABLE
+
+
+def _owner_ids_in(statement: Any) -> set[Any]:
+    """문장(서브쿼리 포함)의 WHERE 절에서 items.owner_id = 값 비교 추출"""
+    owner_ids = set()
+    for element in visitors.iterate(statement):
+        if not isinstance(element, BinaryExpression):
+            continue
+        left, right = element.left, element.right
+        if _is_items_table(getattr(right, "table", None)):
+            left, right = right, left
+        if (
+            _is_items_table(getattr(left, "table", None))
+            and left.key == "owner_id"
+            and element.operator is operators.eq
+            and isinstance(right, BindParameter)
+        ):
+            owner_ids.add(right.effective_value)
+    return owner_ids
+
+
+def _touches_items(orm_context: ORMExecuteState) -> bool:
+    """문장이 아이템 테이블을 대상으로 하는지 여부"""
+    if any(_is_items_table(mapper.local_table) for mapper in orm_context.all_mappers):
+        return True
+    statement = orm_context.statement
+    if not isinstance(statement, ClauseElement):
+        return False
+    return any(_is_items_table(element) for element in visitors.iterate(statement))
+
+
+class ItemShardRouter:
+    """
+    소유자 기준 아이템 샤드 라우터
+
+    ShardedSession의 shard_chooser / identity_chooser / execute_chooser를 제공합니다.
+    """
+
+    def __init__(self, shard_count: int):
+        self.shard_ids = item_shard_ids(shard_count)
+
+    def shard_for_owner(self, owner_id: int) -> str:
+        """소유자의 아이템 샤드 ID"""
+        return self.shard_ids[owner_shard_index(owner_id, len(self.shard_ids))]
+
+    def shard_chooser(
+        self,
+        mapper: Optional[Mapper],
+        instance: Any,
+        clause: Any = None,
+        **kw: Any,
+    ) -> str:
+        """flush 대상 객체의 샤드"""
+        if mapper is not None and _is_items_table(mapper.local_table):
+            if instance is None or instance.owner_id is None:
+                raise ShardRoutingError("owner_id가 없는 아이템은 저장할 수 없습니다.")
+            return self.shard_for_owner(instance.owner_id)
+        return PRIMARY_SHARD
+
+    def identity_chooser(
+        self,
+        mapper: Mapper,
+        primary_key: Any,
+        *,
+        lazy_loaded_from: Any = None,
+        **kw: Any,
+    ) -> Iterable[str]:
+        """기본 키 조회(session.get 등)의 후보 샤드"""
+        if not _is_items_table(mapper.local_table):
+            return [PRIMARY_SHARD]
+        if lazy_loaded_from is not None and lazy_loaded_from.obj() is not None:
+            return [self.shard_for_owner(lazy_loaded_from.obj().id)]
+        return self.shard_ids
+
+    def execute_chooser(self, orm_context: ORMExecuteState) -> Iterable[str]:
+        """조회/DML 문을 실행할 샤드"""
+        if not _touches_items(orm_context):
+            return [PRIMARY_SHARD]
+
+        owner_ids = _owner_ids_in(orm_context.statement)
+        if not owner_ids and orm_context.is_insert:
+            # ORM bulk INSERT: 파라미터의 owner_id 사용
+            params = orm_context.parameters or []
+            rows = [params] if isinstance(params, Mapping) else params
+            owner_ids = {row.get("owner_id") for row in rows} - {None}
+
+        if owner_ids:
+            shards = {self.shard_for_owner(owner_id) for owner_id in owner_ids}
+            if len(shards) > 1 and not orm_context.is_select:
+                raise ShardRoutingError("여러 샤드에 걸친 쓰기는 지원하지 않습니다.")
+            return sorted(shards)
+
+        if orm_context.execution_options.get(CROSS_SHARD_OPTION):
+            return self.shard_ids
+        raise ShardRoutingError(
+            "소유자 조건이 없는 아이템 조회입니다. "
+            f"모든 샤드를 조회하려면 execution_options({CROSS_SHARD_OPTION}=True)를 지정하세요."
+        )
+
+
+def create_sharded_session_maker(
+    primary: AsyncEngine,
+    item_engines: Sequence[AsyncEngine],
+) -> async_sessionmaker[AsyncSession]:
+    """
+    샤드 세션 팩토리 생성
+
+    Args:
+        primary: 아이템 외 테이블을 처리하는 엔진
+        item_engines: 아이템 샤드 엔진 (순서가 샤드 번호)
+    """
+    router = ItemShardRouter(len(item_engines))
+    shards = {PRIMARY_SHARD: primary.sync_engine}
+    shards.update(
+        {
+            shard_id: item_engine.sync_engine
+            for shard_id, item_engine in zip(router.shard_ids, item_engines)
+        }
+    )
+    return async_sessionmaker(
+        class_=AsyncSession,
+        sync_session_class=ShardedSession,
+        shards=shards,
+        shard_chooser=router.shard_chooser,
+        identity_chooser=router.identity_chooser,
+        execute_chooser=router.execute_chooser,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
@@ -0,0 +1,242 @@
+"""
+SQLite Write Coordination
+
+SQLite는 데이터베이스 전체에 쓰기 잠금이 하나뿐이므로, 여러 연결이 동시에 쓰면
+"database is locked" 오류가 나고 커밋마다 fsync가 직렬로 일어납니다.
+
+이 모듈은 쓰기 전용 연결 하나를 가진 단일 작성자(actor)를 제공합니다.
+
+흐름:
+    1. 서비스의 쓰기 메서드는 run_write()로 쓰기 작업(func(session))을 제출
+    2. 작성자는 비동기 큐에서 작업을 꺼내고, group_commit_window 동안 도착한
+       작업을 모아 하나의 트랜잭션(BEGIN IMMEDIATE)으로 실행
+    3. 작업마다 SAVEPOINT를 사용하므로 한 작업의 실패는 그 작업만 롤백
+    4. 한 번의 COMMIT(= 한 번의 fsync) 후 각 호출자에게 결과 전달
+    5. 결과 ORM 객체는 호출자 세션에 merge되어 기존처럼 사용
+
+읽기는 WAL 모드의 읽기 연결 풀에서 쓰기와 동시에 처리됩니다.
+작성자가 설정되지 않은 세션(테스트, 다른 DB)에서는 run_write()가
+func(db)를 그대로 실행하므로 동작이 기존과 같습니다.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+T = TypeVar("T")
+
+# session.info에 작성자를 보관하는 키
+WRITER_INFO_KEY = "sqlite_writer"
+
+WriteFunc = Callable[[AsyncSession], Awaitable[Any]]
+
+
+def configure_sqlite_connections(
+    async_engine: AsyncEngine,
+    busy_timeout_ms: int = 5000,
+    immediate: bool = False,
+) -> None:
+    """
+    동시 접근용 SQLite 연결 설정
+
+    - journal_mode=WAL: 읽기가 쓰기를 막지 않음
+    - synchronous=NORMAL: WAL에서 커밋마다 fsync하지 않음 (체크포인트 시 동기화)
+    - busy_timeout: 잠금 경합 시 즉시 실패하지 않고 대기
+
+    immediate=True이면 트랜잭션을 BEGIN IMMEDIATE로 시작합니다.
+    (pysqlite의 암시적 BEGIN을 끄고 직접 BEGIN을 보내야 SAVEPOINT도 올바르게 동작)
+    """
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _configure(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+        cursor.close()
+        if immediate:
+            dbapi_connection.isolation_level = None
+
+    if immediate:
+
+        @event.listens_for(async_engine.sync_engine, "begin")
+        def _begin_immediate(conn):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+@dataclass
+class _Write:
+    """큐에 대기 중인 쓰기 작업"""
+
+    func: WriteFunc
+    future: asyncio.Future = field(repr=False)
+
+
+class SQLiteWriter:
+    """
+    SQLite 단일 작성자
+
+    쓰기 전용 엔진(연결 1개)으로 제출된 쓰기 작업을 순서대로 실행하며,
+    짧은 시간 창 안에 도착한 작업을 하나의 트랜잭션으로 묶어 커밋합니다(group commit).
+
+    Args:
+        engine: 쓰기 전용 엔진 (pool_size=1 권장)
+        window: 첫 작업 도착 후 다른 작업을 기다리는 시간 (초)
+        max_batch: 한 트랜잭션에 묶을 최대 작업 수
+    """
+
+    def __init__(self, engine: AsyncEngine, window: float = 0.002, max_batch: int = 100):
+        self.engine = engine
+        self.window = window
+        self.max_batch = max_batch
+        self._session_maker = async_sessionmaker(
+            engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+            autoflush=False,
+        )
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # 통계 (벤치마크/모니터링용)
+        self.commits = 0
+        self.writes = 0
+
+    async def submit(self, func: WriteFunc) -> Any:
+        """
+        쓰기 작업 제출 후 커밋될 때까지 대기
+
+        Returns:
+            func(session)의 반환값 (작성자 세션에서 분리된 상태)
+
+        Raises:
+            func에서 발생한 예외 또는 커밋 실패 예외
+        """
+        queue = self._queue
+        if queue is None or self._task is None or self._task.done():
+            queue = self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run(queue))
+
+        future = asyncio.get_running_loop().create_future()
+        await queue.put(_Write(func, future))
+        return await future
+
+    async def close(self) -> None:
+        """대기 중인 작업을 모두 처리한 뒤 작성자 종료"""
+        if self._queue is not None and self._task is not None and not self._task.done():
+            await self._queue.put(None)
+            await self._task
+        self._task = None
+        await self.engine.dispose()
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        """
+        작성자 루프: 작업을 모아 group commit
+
+        루프가 어떤 이유로든(종료, 취소, 예상하지 못한 오류) 끝나면 실행 중이던
+        묶음과 큐에 남은 작업을 실패로 처리하여 호출자가 무한히 기다리지 않게 합니다.
+        """
+        batch: list[_Write] = []
+        try:
+            while True:
+                first = await queue.get()
+                if first is None:
+                    return
+                batch = [first]
+
+                # 같은 트랜잭션에 묶을 작업이 도착하도록 잠시 대기
+                if self.window > 0:
+                    await asyncio.sleep(self.window)
+
+                stop = False
+                while len(batch) < self.max_batch and not queue.empty():
+                    write = queue.get_nowait()
+                    if write is None:
+                        stop = True
+                        break
+                    batch.append(write)
+
+                await self._commit(batch)
+                batch = []
+                if stop:
+                    return
+        finally:
+            while not queue.empty():
+                write = queue.get_nowait()
+                if write is not None:
+                    batch.append(write)
+            for write in batch:
+                if not write.future.done():
+                    write.future.set_exception(
+                        RuntimeError("SQLite 작성자가 종료되어 쓰기가 실행되지 않았습니다.")
+                    )
+
+    async def _commit(self, batch: list[_Write]) -> None:
+        """작업 묶음을 한 트랜잭션으로 실행 (작업마다 SAVEPOINT)"""
+        outcomes: list[tuple[_Write, Any, Optional[BaseException]]] = []
+
+        try:
+            async with self._session_maker() as session:
+                async with session.begin():
+                    for write in batch:
+                        try:
+                            async with session.begin_nested():
+                                result = await write.func(session)
+                            outcomes.append((write, result, None))
+                        except Exception as exc:
+                            outcomes.append((write, None, exc))
+                # 결과 객체를 호출자 세션에 merge할 수 있도록 분리
+                session.expunge_all()
+        except Exception as exc:
+            # 커밋 실패: 묶음 전체가 반영되지 않음
+            for write in batch:
+                if not write.future.done():
+                    write.future.set_exception(exc)
+            return
+
+        self.commits += 1
+        self.writes += len(batch)
+        for write, result, error in outcomes:
+            if write.future.done():
+                continue
+            if error is not None:
+                write.future.set_exception(error)
+            else:
+                write.future.set_result(result)
+
+
+async def run_write(db: AsyncSession, func: Callable[[AsyncSession], Awaitable[T]]) -> T:
+    """
+    쓰기 작업 실행
+
+    세션에 SQLite 작성자가 설정되어 있으면 작성자를 통해 실행하고
+    결과 ORM 객체를 db 세션에 merge하여 반환합니다.
+    작성자가 없으면 func(db)를 그대로 실행합니다.
+
+    Note:
+        작성자를 사용하면 쓰기는 요청 트랜잭션과 별개로 즉시 커밋됩니다.
+        func는 인자로 받은 세션만 사용해야 합니다.
+    """
+    writer: Optional[SQLiteWriter] = db.info.get(WRITER_INFO_KEY)
+    if writer is None:
+        return await func(db)
+
+    result = await writer.submit(func)
+    state = inspect(result, raiseerr=False)
+    if state is not None and getattr(state, "mapper", None) is not None:
+        return await db.merge(result, load=False)
+    return result
+
+
+async def attach(db: AsyncSession, instance: T) -> T:
+    """
+    다른 세션에서 불러온 객체를 db 세션의 객체로 변환
+
+    이미 db 세션에 있으면 그대로 반환하고, 아니면 SELECT 없이
+    merge(load=False)로 불러온 상태를 복사합니다. (쓰기 작업 안에서 사용)
+    """
+    if instance in db:
+        return instance
+    return await db.merge(instance, load=False)
@@ -0,0 +1,181 @@
+"""
+Template Render Metrics
+
+템플릿 이름별 렌더링 시간/출력 크기 히스토그램 (워커마다 별도)
+
+측정 방식:
+    InstrumentedTemplate(환경의 template_class)이 템플릿마다 컴파일된 렌더링
+    함수(root_render_func)를 감쌉니다. {% include %}와 {% extends %}도 같은
+    함수를 호출하므로 중첩 템플릿도 각자 이름으로 기록됩니다.
+
+    - 시간: 포함 시간 - include한 템플릿의 시간도 포함합니다.
+      (pages/items.html의 시간에는 partials/items/item.html 렌더링이 포함)
+      extends하는 페이지는 레이아웃(base.html)과 블록 전체를 포함합니다.
+    - 크기: 템플릿이 내보낸 출력의 문자 수 (include 출력 포함)
+      UTF-8 바이트 수는 중첩 단계마다 출력을 인코딩해야 하므로(한글이 섞인
+      40KB 페이지에 약 65us) 세지 않습니다. ASCII 출력이면 바이트 수와 같습니다.
+
+    비동기 환경(스트리밍)은 렌더링 중 조회를 기다리는 시간이 섞이므로
+    측정하지 않습니다.
+
+요청별 Server-Timing:
+    collect_renders()로 모은 렌더링을 server_timing()으로 헤더 값으로 만듭니다.
+    (AppTemplates.TemplateResponse가 TEMPLATE_SERVER_TIMING일 때 추가)
+"""
+
+import bisect
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Iterator, Optional
+
+from jinja2 import Template
+
+from app.config import settings
+
+# 렌더링 시간 버킷 상한 (밀리초)
+DURATION_BUCKETS_MS = (0.1, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250)
+
+# 출력 크기 버킷 상한 (문자 수)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+# Server-Timing 헤더에 넣는 최대 템플릿 수 (시간이 긴 순)
+SERVER_TIMING_LIMIT = 10
+
+# 현재 요청에서 렌더링한 템플릿별 [횟수, 시간(ms), 문자 수]
+_request_renders: ContextVar[Optional[dict[str, list]]] = ContextVar(
+    "template_renders", default=None
+)
+
+
+class Histogram:
+    """누적하지 않는 버킷별 개수 (마지막 버킷은 상한 초과)"""
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.total += value
+
+    def as_dict(self) -> dict[str, Any]:
+        labels = [f"le_{bound}" for bound in self.bounds] + ["inf"]
+        return {"sum": round(self.total, 3), "buckets": dict(zip(labels, self.counts))}
+
+
+class TemplateStats:
+    """템플릿 하나의 렌더링 통계"""
+
+    def __init__(self) -> None:
+        self.renders = 0
+        self.duration_ms = Histogram(DURATION_BUCKETS_MS)
+        self.size_chars = Histogram(SIZE_BUCKETS)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "renders": self.renders,
+            "avg_ms": round(self.duration_ms.total / self.renders, 3) if self.renders else 0,
+            "avg_chars": round(self.size_chars.total / self.renders) if self.renders else 0,
+            "duration_ms": self.duration_ms.as_dict(),
+            "size_chars": self.size_chars.as_dict(),
+        }
+
+
+class TemplateMetrics:
+    """템플릿 이름별 렌더링 통계"""
+
+    def __init__(self) -> None:
+        self._templates: dict[str, TemplateStats] = {}
+
+    def record(self, name: str, duration_ms: float, size: int) -> None:
+        stats = self._templates.get(name)
+        if stats is None:
+            stats = self._templates[name] = TemplateStats()
+        stats.renders += 1
+        stats.duration_ms.observe(duration_ms)
+        stats.size_chars.observe(size)
+
+        renders = _request_renders.get()
+        if renders is not None:
+            entry = renders.setdefault(name, [0, 0.0, 0])
+            entry[0] += 1
+            entry[1] += duration_ms
+            entry[2] += size
+
+    def snapshot(self) -> dict[str, Any]:
+        """템플릿별 통계 (총 렌더링 시간이 긴 순)"""
+        ordered = sorted(
+            self._templates.items(), key=lambda item: item[1].duration_ms.total, reverse=True
+        )
+        return {name: stats.as_dict() for name, stats in ordered}
+
+    def reset(self) -> None:
+        self._templates.clear()
+
+
+template_metrics = TemplateMetrics()
+
+
+def _measure(name: str, events: Iterator[str]) -> Iterator[str]:
+    """
+    렌더링 출력을 모아 한 조각으로 내보내며 시간과 출력 크기를 기록
+
+    조각마다 세면 중첩 단계마다 파이썬 반복이 추가되므로 템플릿 출력을
+    한 번에 모아 크기를 구합니다. 동기 환경은 항상 전체 출력을 이어
+    붙이므로(render) 내보내는 결과는 같습니다.
+    """
+    started = time.perf_counter()
+    output = "".join(events)
+    template_metrics.record(name, (time.perf_counter() - started) * 1000, len(output))
+    yield output
+
+
+def _instrument(name: str, render: Callable[[Any], Iterator[str]]) -> Callable:
+    def root_render_func(context: Any) -> Iterator[str]:
+        if not settings.template_metrics:
+            return render(context)
+        return _measure(name, render(context))
+
+    return root_render_func
+
+
+class InstrumentedTemplate(Template):
+    """렌더링 함수를 감싸 템플릿 이름별 시간/크기를 기록하는 템플릿 (동기 환경)"""
+
+    @classmethod
+    def _from_namespace(cls, environment, namespace, globals):  # type: ignore[override]
+        template = super()._from_namespace(environment, namespace, globals)
+        if not environment.is_async:
+            template.root_render_func = _instrument(
+                template.name or "<string>", template.root_render_func
+            )
+        return template
+
+
+@contextmanager
+def collect_renders() -> Iterator[dict[str, list]]:
+    """블록 안에서 렌더링한 템플릿별 [횟수, 시간(ms), 문자 수] 수집"""
+    renders: dict[str, list] = {}
+    token = _request_renders.set(renders)
+    try:
+        yield renders
+    finally:
+        _request_renders.reset(token)
+
+
+def server_timing(renders: dict[str, list]) -> str:
+    """
+    수집한 렌더링을 Server-Timing 헤더 값으로
+
+    예: tpl;desc="pages/items.html";dur=3.12, tpl;desc="partials/items/item.html x20";dur=1.40
+    (시간은 include 포함, 시간이 긴 순으로 SERVER_TIMING_LIMIT개)
+    """
+    ordered = sorted(renders.items(), key=lambda item: item[1][1], reverse=True)
+    metrics = []
+    for name, (count, duration_ms, _size) in ordered[:SERVER_TIMING_LIMIT]:
+        desc = name if count == 1 else f"{name} x{count}"
+        desc = desc.replace("\\", "\\\\").replace('"', '\\"')
+        metrics.append(f'tpl;desc="{desc}";dur={duration_ms:.2f}')
+    return ", ".join(metrics)
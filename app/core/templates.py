@@ -2,17 +2,70 @@
 Jinja2 Template Configuration
 
 템플릿 엔진 설정 및 커스텀 필터/함수 정의
+
+프로덕션 모드(debug가 아닐 때):
+    - auto_reload 끔: 렌더링마다 템플릿 파일의 수정 시각을 확인하지 않음
+    - 바이트코드 캐시(FileSystemBytecodeCache): 컴파일 결과를 파일로 저장하여
+      다른 워커나 재시작 후에는 파싱/컴파일 없이 불러옴
+    - 시작 시 모든 템플릿을 미리 컴파일 (precompile_templates)
+
+미리 컴파일 (Docker 빌드 등에서 바이트코드 캐시 채우기):
+    python -m app.core.precompile
+
+조건부 응답 (AppTemplates):
+    TEMPLATE_ETAGS가 켜져 있으면 TemplateResponse로 만든 GET/HEAD 200 응답에
+    약한 ETag를 붙이고 If-None-Match가 일치하면 304를 반환합니다.
+    (stream_page의 스트리밍 응답은 본문 전에 헤더를 보내므로 제외)
+
+렌더링 지표 (app.core.template_metrics):
+    동기 환경의 템플릿은 include/extends를 포함해 이름별 렌더링 시간과 출력
+    크기를 기록합니다 (TEMPLATE_METRICS, /api/v1/metrics의 templates).
+    TEMPLATE_SERVER_TIMING이 켜져 있으면 TemplateResponse에 그 요청에서
+    렌더링한 템플릿의 Server-Timing 헤더를 붙입니다.
+
+페이지 렌더링 (render_page):
+    hx-boost 링크 등 HTMX 페이지 이동 요청이면 레이아웃 전체 대신
+    content.html 레이아웃(제목 + main 요소)만 렌더링합니다.
+
+스트리밍 렌더링 (stream_page):
+    비동기 환경(generate_async)으로 레이아웃 앞부분(head, 네비게이션)을 먼저
+    보내고, 느린 조회가 끝나면 content 블록부터 이어서 보냅니다.
+
+비동기 환경 (async_environment, render_template_async, stream_template):
+    템플릿이 비동기 컨텍스트를 직접 사용할 수 있습니다.
+        - {% for item in items %}: 비동기 이터러블(행을 가져오는 대로 렌더링)
+        - {{ load_stats(user.id).total_items }}: async 함수 호출은 자동으로 await
 """
 
+import inspect
+import os
 from datetime import datetime
-from typing import Any
+from typing import Any, AsyncIterator, Awaitable, Callable, Mapping, Optional, cast
 
+from fastapi import Request
 from fastapi.templating import Jinja2Templates
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+from starlette.background import BackgroundTask
+from starlette.responses import Response, StreamingResponse
+from starlette.templating import _TemplateResponse
 
 from app.config import settings
+from app.core.etag import conditional_response
+from app.core.fragment_cache import FragmentCacheExtension
+from app.core.template_metrics import InstrumentedTemplate, collect_renders, server_timing
 
-# Jinja2 템플릿 인스턴스 생성
-templates = Jinja2Templates(directory="templates")
+# 템플릿 디렉토리
+TEMPLATE_DIRECTORY = "templates"
+
+# 페이지 레이아웃 (페이지 템플릿의 layout 변수)
+BASE_LAYOUT = "base.html"
+CONTENT_LAYOUT = "content.html"
+
+# HTMX 페이지 이동 시 교체할 요소 (base.html의 main)
+CONTENT_TARGET = "main-content"
+
+# stream_template이 모아서 내보내는 최소 크기 (문자 수)
+STREAM_CHUNK_SIZE = 8192
 
 
 def format_datetime(value: datetime, format: str = "%Y-%m-%d %H:%M") -> str:
@@ -52,18 +105,258 @@ def nl2br(value: str) -> str:
     return value.replace("\n", "<br>")
 
 
-# 커스텀 필터 등록
-templates.env.filters["datetime"] = format_datetime
-templates.env.filters["date"] = format_date
-templates.env.filters["truncate"] = truncate
-templates.env.filters["currency"] = currency
-templates.env.filters["nl2br"] = nl2br
+def create_template_environment(
+    directory: str = TEMPLATE_DIRECTORY,
+    production: Optional[bool] = None,
+    bytecode_cache_dir: Optional[str] = None,
+    enable_async: bool = False,
+) -> Environment:
+    """
+    템플릿 환경 생성 (필터/전역 변수 등록 포함)
+
+    Args:
+        directory: 템플릿 디렉토리
+        production: 프로덕션 모드 여부 (없으면 debug가 아닐 때)
+        bytecode_cache_dir: 바이트코드 캐시 디렉토리
+            (없으면 TEMPLATE_BYTECODE_CACHE_DIR, 그것도 없으면 시스템 임시 디렉토리)
+        enable_async: 비동기 렌더링 환경 (스트리밍용)
+    """
+    if production is None:
+        production = not settings.debug
+
+    bytecode_cache = None
+    if production and settings.template_bytecode_cache:
+        bytecode_cache_dir = bytecode_cache_dir or settings.template_bytecode_cache_dir
+        if bytecode_cache_dir:
+            os.makedirs(bytecode_cache_dir, exist_ok=True)
+        # 비동기 환경은 컴파일 결과가 다르므로 캐시 파일을 구분
+        pattern = "__jinja2_async_%s.cache" if enable_async else "__jinja2_%s.cache"
+        bytecode_cache = FileSystemBytecodeCache(bytecode_cache_dir, pattern)
+
+    env = Environment(
+        loader=FileSystemLoader(directory),
+        autoescape=True,
+        auto_reload=not production,
+        bytecode_cache=bytecode_cache,
+        enable_async=enable_async,
+        extensions=[FragmentCacheExtension],
+    )
+    env.template_class = InstrumentedTemplate
+
+    # 커스텀 필터 등록
+    env.filters["datetime"] = format_datetime
+    env.filters["date"] = format_date
+    env.filters["truncate"] = truncate
+    env.filters["currency"] = currency
+    env.filters["nl2br"] = nl2br
+
+    # 전역 컨텍스트 변수
+    env.globals["app_name"] = settings.app_name
+    env.globals["debug"] = settings.debug
+    env.globals["now"] = datetime.now
+    return env
+
+
+def precompile_templates(env: Optional[Environment] = None) -> int:
+    """
+    모든 템플릿을 미리 컴파일
+
+    환경의 템플릿 캐시와 바이트코드 캐시를 채워서 첫 요청이 파싱/컴파일
+    비용을 치르지 않게 합니다.
+
+    Args:
+        env: 대상 환경 (없으면 기본 환경과 스트리밍 환경 모두)
+
+    Returns:
+        컴파일한 템플릿 수
+    """
+    envs = [env] if env else [templates.env, async_environment]
+    names = envs[0].list_templates(extensions=["html"])
+    for target in envs:
+        for name in names:
+            target.get_template(name)
+    return len(names)
+
+
+class AppTemplates(Jinja2Templates):
+    """
+    Jinja2Templates + Server-Timing 헤더 (TEMPLATE_SERVER_TIMING)
+    + 약한 ETag/304 조건부 응답 (TEMPLATE_ETAGS)
+    """
+
+    def TemplateResponse(
+        self,
+        request: Request,
+        name: str,
+        context: Optional[dict[str, Any]] = None,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+        media_type: Optional[str] = None,
+        background: Optional[BackgroundTask] = None,
+    ) -> _TemplateResponse:
+        with collect_renders() as renders:
+            response = super().TemplateResponse(
+                request, name, context, status_code, headers, media_type, background
+            )
+        if settings.template_server_timing and renders:
+            response.headers.append("server-timing", server_timing(renders))
+        if not settings.template_etags:
+            return response
+        return conditional_response(request, response)
+
+
+# Jinja2 템플릿 인스턴스 생성
+templates = AppTemplates(env=create_template_environment())
+
+# 비동기 렌더링 환경 (스트리밍, awaitable/비동기 이터러블 컨텍스트)
+async_environment = create_template_environment(enable_async=True)
+
+
+def is_content_navigation(request: Request) -> bool:
+    """
+    HTMX 페이지 이동 요청 여부
+
+    hx-boost 링크/폼과 hx-target="body" 요청은 HX-Target 헤더가 없고,
+    main 요소를 직접 대상으로 하면 main-content입니다.
+    히스토리 복원 요청(캐시 미스)은 전체 페이지가 필요합니다.
+    """
+    headers = request.headers
+    if headers.get("HX-Request") != "true":
+        return False
+    if headers.get("HX-History-Restore-Request") == "true":
+        return False
+    return headers.get("HX-Target") in (None, CONTENT_TARGET)
+
+
+def render_page(
+    request: Request,
+    name: str,
+    context: Optional[dict[str, Any]] = None,
+    status_code: int = 200,
+) -> Response:
+    """
+    페이지 템플릿 응답
+
+    일반 요청은 base.html 레이아웃 전체를, HTMX 페이지 이동 요청은
+    content.html 레이아웃만 렌더링하고 HX-Retarget/HX-Reswap 헤더로
+    현재 페이지의 main 요소를 교체하게 합니다.
+
+    Args:
+        request: 요청
+        name: 페이지 템플릿 이름 (layout 변수로 상속하는 템플릿)
+        context: 템플릿 컨텍스트
+        status_code: 응답 상태 코드
+    """
+    content_only = is_content_navigation(request)
+    context = dict(context or {})
+    context["layout"] = CONTENT_LAYOUT if content_only else BASE_LAYOUT
+
+    response = templates.TemplateResponse(
+        request=request, name=name, context=context, status_code=status_code
+    )
+    _set_page_headers(response, content_only)
+    return response
+
 
+async def stream_page(
+    request: Request,
+    name: str,
+    context: dict[str, Any],
+    load: Callable[[], Awaitable[dict[str, Any]]],
+    status_code: int = 200,
+) -> Response:
+    """
+    페이지 템플릿 스트리밍 응답
 
-# 전역 컨텍스트 변수
-templates.env.globals["app_name"] = settings.app_name
-templates.env.globals["debug"] = settings.debug
-templates.env.globals["now"] = datetime.now
+    레이아웃 앞부분(head, 네비게이션)을 바로 보내고, content 블록에
+    도달하면 load()의 결과를 컨텍스트에 더해 나머지를 이어서 보냅니다.
+    load()는 응답 본문을 보내기 시작할 때 실행되므로 브라우저는 그동안
+    head의 스크립트/스타일을 받습니다.
+
+    상태 코드와 헤더는 load() 전에 보내므로, load()에서 발생한 오류는
+    오류 페이지가 아니라 끊긴 응답이 됩니다. 권한 확인 등 응답 상태를
+    바꿀 수 있는 작업은 load() 밖(의존성)에서 처리하세요.
+
+    TEMPLATE_STREAMING=false면 load()를 기다린 뒤 render_page로 렌더링합니다.
+
+    Args:
+        request: 요청
+        name: 페이지 템플릿 이름 (content 블록이 있어야 함)
+        context: load() 없이 알 수 있는 컨텍스트 (제목, 현재 사용자 등)
+        load: content 블록에 필요한 컨텍스트를 조회하는 코루틴 함수
+            (값은 비동기 이터러블이어도 됨 - 템플릿이 직접 순회)
+        status_code: 응답 상태 코드
+    """
+    if not settings.template_streaming:
+        return render_page(
+            request=request,
+            name=name,
+            context=await resolve_context({**context, **await load()}),
+            status_code=status_code,
+        )
+
+    content_only = is_content_navigation(request)
+    context = {
+        **context,
+        "request": request,
+        "layout": CONTENT_LAYOUT if content_only else BASE_LAYOUT,
+    }
+    template = async_environment.get_template(name)
+    response = StreamingResponse(
+        _stream_template(template, context, load),
+        status_code=status_code,
+        media_type="text/html",
+    )
+    _set_page_headers(response, content_only)
+    return response
+
+
+# content 블록 시작 직전까지 렌더링한 부분을 내보내라는 표시
+_FLUSH = object()
+
+
+async def _stream_template(
+    template: Template,
+    context: dict[str, Any],
+    load: Callable[[], Awaitable[dict[str, Any]]],
+) -> AsyncIterator[str]:
+    """
+    템플릿을 렌더링하며 content 블록 전후로 나누어 내보냄
+
+    Jinja가 내보내는 조각은 매우 작으므로 모아서 보내고, content 블록
+    함수를 감싸 블록 시작 직전에 한 번 내보낸 뒤 load()를 기다립니다.
+    """
+    jinja_context = template.new_context(context)
+    content_block = jinja_context.blocks["content"][0]
+
+    async def deferred_content_block(block_context):
+        yield _FLUSH
+        block_context.vars.update(await load())
+        async for chunk in content_block(block_context):
+            yield chunk
+
+    jinja_context.blocks["content"][0] = deferred_content_block
+
+    # 비동기 환경의 렌더링 함수는 async generator (Template에는 동기 Iterator로 선언됨)
+    render = cast(Callable[[Any], AsyncIterator[Any]], template.root_render_func)
+    buffer: list[str] = []
+    async for chunk in render(jinja_context):
+        if chunk is _FLUSH:
+            yield "".join(buffer)
+            buffer.clear()
+        else:
+            buffer.append(chunk)
+    yield "".join(buffer)
+
+
+def _set_page_headers(response: Response, content_only: bool) -> None:
+    """페이지 응답 헤더 (HTMX 교체 대상, Vary)"""
+    if content_only:
+        response.headers["HX-Retarget"] = f"#{CONTENT_TARGET}"
+        response.headers["HX-Reswap"] = "outerHTML"
+    # 같은 URL이 헤더에 따라 다른 본문을 가지므로 캐시가 구분하도록 표시
+    response.headers.add_vary_header("HX-Request")
+    response.headers.add_vary_header("HX-Target")
 
 
 def render_template(name: str, context: dict[str, Any] = None) -> str:
@@ -83,3 +376,67 @@ def render_template(name: str, context: dict[str, Any] = None) -> str:
         context = {}
     template = templates.env.get_template(name)
     return template.render(**context)
+
+
+async def render_template_async(name: str, context: Optional[dict[str, Any]] = None) -> str:
+    """
+    비동기 환경으로 템플릿을 문자열로 렌더링
+
+    컨텍스트에 비동기 이터러블이나 async 함수를 그대로 넘길 수 있습니다.
+
+    Args:
+        name: 템플릿 파일 이름
+        context: 템플릿 컨텍스트
+
+    Returns:
+        렌더링된 HTML 문자열
+    """
+    template = async_environment.get_template(name)
+    return await template.render_async(**(context or {}))
+
+
+async def stream_template(
+    name: str, context: Optional[dict[str, Any]] = None
+) -> AsyncIterator[str]:
+    """
+    비동기 환경으로 템플릿을 렌더링하며 조각 단위로 내보냄
+
+    StreamingResponse 본문으로 사용하면 비동기 이터러블을 순회하는 동안
+    이미 렌더링한 부분을 보냅니다. 너무 작은 조각은 모아서 내보냅니다.
+
+    Args:
+        name: 템플릿 파일 이름
+        context: 템플릿 컨텍스트
+
+    Yields:
+        렌더링된 HTML 조각
+    """
+    template = async_environment.get_template(name)
+    buffer: list[str] = []
+    size = 0
+    async for chunk in template.generate_async(**(context or {})):
+        buffer.append(chunk)
+        size += len(chunk)
+        if size >= STREAM_CHUNK_SIZE:
+            yield "".join(buffer)
+            buffer.clear()
+            size = 0
+    if buffer:
+        yield "".join(buffer)
+
+
+async def resolve_context(context: dict[str, Any]) -> dict[str, Any]:
+    """
+    동기 환경에서 렌더링할 수 있도록 컨텍스트를 구체화
+
+    awaitable은 기다리고 비동기 이터러블은 리스트로 모읍니다.
+    (async 함수 값은 동기 환경에서 호출할 수 없으므로 그대로 둡니다)
+    """
+    resolved = {}
+    for key, value in context.items():
+        if inspect.isawaitable(value):
+            value = await value
+        if hasattr(value, "__aiter__"):
+            value = [item async for item in value]
+        resolved[key] = value
+    return resolved
@@ -5,16 +5,31 @@ SQLAlchemy 비동기 데이터베이스 연결 설정
 세션 관리 및 의존성 주입 제공
 """
 
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
+from fastapi import Request
+from sqlalchemy import Engine, event, make_url
 from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
 
 from app.config import settings
+from app.core.sharding import ITEMS_TABLE, create_sharded_session_maker
+from app.core.sqlite_writer import (
+    WRITER_INFO_KEY,
+    SQLiteWriter,
+    configure_sqlite_connections,
+)
+
+# 레플리카로 보낼 수 있는 읽기 전용 HTTP 메서드
+READ_ONLY_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+# 쓰기 직후 일정 시간 동안 읽기를 프라이머리로 고정하는 쿠키 (read-your-writes)
+PRIMARY_PIN_COOKIE = "db_primary_pin"
 
 
 class Base(DeclarativeBase):
@@ -23,33 +38,165 @@ class Base(DeclarativeBase):
     pass
 
 
-# 비동기 엔진 생성
+def enable_sqlite_foreign_keys(async_engine: AsyncEngine) -> None:
+    """
+    SQLite 외래 키 제약 활성화
+
+    SQLite는 연결마다 PRAGMA foreign_keys=ON을 설정해야 ON DELETE CASCADE가 동작합니다.
+    다른 DB에서는 아무 것도 하지 않습니다.
+    """
+    if async_engine.dialect.name != "sqlite":
+        return
+
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def _set_sqlite_pragma(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+class RoutingSession(Session):
+    """
+    읽기/쓰기 라우팅 세션
+
+    session.info["use_replica"]가 True인 세션(읽기 전용 요청)의 SELECT는
+    레플리카 엔진으로 보내고, 그 외에는 모두 프라이머리를 사용합니다.
+    세션에서 한 번이라도 쓰기(flush, INSERT/UPDATE/DELETE)가 발생하면
+    info["wrote"]가 설정되어 이후 읽기도 프라이머리로 고정됩니다.
+    """
+
+    replica_bind: Optional[Engine] = None
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or getattr(clause, "is_dml", False):
+            self.info["wrote"] = True
+        elif (
+            self.replica_bind is not None
+            and self.info.get("use_replica")
+            and not self.info.get("wrote")
+        ):
+            return self.replica_bind
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+def create_session_maker(
+    primary: AsyncEngine,
+    replica: Optional[AsyncEngine] = None,
+    writer: Optional[SQLiteWriter] = None,
+) -> async_sessionmaker[AsyncSession]:
+    """
+    세션 팩토리 생성
+
+    Args:
+        primary: 쓰기와 기본 읽기를 처리하는 엔진
+        replica: 읽기 전용 요청의 SELECT를 처리할 엔진 (없으면 프라이머리만 사용)
+        writer: 서비스 쓰기를 처리할 SQLite 단일 작성자 (session.info로 전달)
+    """
+    session_class = type(
+        "RoutingSession",
+        (RoutingSession,),
+        {"replica_bind": replica.sync_engine if replica is not None else None},
+    )
+    return async_sessionmaker(
+        primary,
+        class_=AsyncSession,
+        sync_session_class=session_class,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+        info={WRITER_INFO_KEY: writer} if writer is not None else None,
+    )
+
+
+def is_sqlite_file_url(url: str) -> bool:
+    """파일 기반 SQLite URL 여부 (메모리 DB는 연결마다 별개라 제외)"""
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database not in (
+        None,
+        "",
+        ":memory:",
+    )
+
+
+# SQLite 쓰기 조정 모드: 읽기 연결 풀 + 쓰기 전용 연결 1개
+use_sqlite_writer = (
+    settings.sqlite_write_coordination
+    and not settings.item_shard_urls
+    and is_sqlite_file_url(settings.database_url)
+)
+
+# 비동기 엔진 생성 (쓰기 조정 모드에서는 읽기 연결 풀)
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
     future=True,
+    **({"pool_size": settings.sqlite_reader_pool_size} if use_sqlite_writer else {}),
 )
+enable_sqlite_foreign_keys(engine)
+
+# SQLite 단일 작성자 (선택)
+write_coordinator: Optional[SQLiteWriter] = None
+if use_sqlite_writer:
+    configure_sqlite_connections(engine, settings.sqlite_busy_timeout_ms)
+
+    writer_engine = create_async_engine(
+        settings.database_url,
+        echo=settings.debug,
+        pool_size=1,
+        max_overflow=0,
+    )
+    enable_sqlite_foreign_keys(writer_engine)
+    configure_sqlite_connections(
+        writer_engine, settings.sqlite_busy_timeout_ms, immediate=True
+    )
+    write_coordinator = SQLiteWriter(
+        writer_engine,
+        window=settings.sqlite_group_commit_ms / 1000,
+        max_batch=settings.sqlite_group_commit_max,
+    )
+
+# 읽기 전용 레플리카 엔진 (선택)
+replica_engine: Optional[AsyncEngine] = None
+if settings.database_replica_url:
+    replica_engine = create_async_engine(
+        settings.database_replica_url,
+        echo=settings.debug,
+        future=True,
+    )
+
+# 아이템 샤드 엔진 (선택, 샤드 간 외래 키가 없으므로 FK PRAGMA는 설정하지 않음)
+item_shard_engines: list[AsyncEngine] = [
+    create_async_engine(url, echo=settings.debug, future=True)
+    for url in settings.item_shard_urls
+]
 
 # 비동기 세션 팩토리
-async_session_maker = async_sessionmaker(
-    engine,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False,
-)
+if item_shard_engines:
+    async_session_maker = create_sharded_session_maker(engine, item_shard_engines)
+else:
+    async_session_maker = create_session_maker(engine, replica_engine, write_coordinator)
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
+async def get_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """
     데이터베이스 세션 의존성
 
     FastAPI의 Depends를 통해 사용되며, 요청 종료 시 자동으로 세션을 정리합니다.
 
+    레플리카가 설정된 경우 읽기 전용 요청(GET 등)의 조회는 레플리카로 보냅니다.
+    단, 최근에 쓰기를 한 클라이언트(PRIMARY_PIN_COOKIE 보유)는
+    복제 지연으로 자신의 변경을 못 보는 일이 없도록 프라이머리를 사용합니다.
+
     Yields:
         AsyncSession: 비동기 데이터베이스 세션
     """
     async with async_session_maker() as session:
+        session.info["use_replica"] = (
+            request.method in READ_ONLY_METHODS
+            and PRIMARY_PIN_COOKIE not in request.cookies
+        )
+        # ReadYourWritesMiddleware가 쓰기 여부를 확인할 수 있도록 보관
+        request.state.db_session = session
         try:
             yield session
             await session.commit()
@@ -60,12 +207,44 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             await session.close()
 
 
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """
+    세션 팩토리 의존성
+
+    요청이 끝난 뒤에도 실행되는 백그라운드 작업은 요청 세션을 공유할 수 없으므로
+    이 팩토리로 자체 세션을 엽니다. 테스트에서는 dependency_overrides로 교체합니다.
+    """
+    return async_session_maker
+
+
 async def init_db() -> None:
-    """데이터베이스 테이블 초기화 (개발용)"""
+    """
+    데이터베이스 테이블 초기화 (개발용)
+
+    아이템 샤딩 사용 시 아이템 테이블은 각 샤드에만 생성합니다.
+    """
+    if not item_shard_engines:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        return
+
+    items = Base.metadata.tables[ITEMS_TABLE]
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(
+            Base.metadata.create_all,
+            tables=[table for table in Base.metadata.sorted_tables if table is not items],
+        )
+    for shard_engine in item_shard_engines:
+        async with shard_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, tables=[items])
 
 
 async def close_db() -> None:
     """데이터베이스 연결 종료"""
+    if write_coordinator is not None:
+        await write_coordinator.close()
     await engine.dispose()
+    if replica_engine is not None:
+        await replica_engine.dispose()
+    for shard_engine in item_shard_engines:
+        await shard_engine.dispose()
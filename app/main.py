@@ -26,13 +26,26 @@ from fastapi.staticfiles import StaticFiles
 
 from app.api.v1.router import api_router
 from app.config import settings
+from app.core.cache import close_cache, load_cache_snapshot, save_cache_snapshot
 from app.core.exceptions import setup_exception_handlers
-from app.core.templates import templates
+from app.core.principals import close_principal_table
+from app.core.middleware import (
+    AnonymousPageCacheMiddleware,
+    ReadYourWritesMiddleware,
+    RequestCoalescingMiddleware,
+    prewarm_pages,
+)
+from app.core.templates import TEMPLATE_DIRECTORY, precompile_templates, templates
 from app.database import close_db, init_db
 from app.pages.router import pages_router
 from app.partials.router import partials_router
 
 
+def _anonymous_page_cache_enabled() -> bool:
+    """익명 페이지 응답 캐시 사용 여부 (debug 모드에서는 사용 안 함)"""
+    return bool(settings.anonymous_page_cache_paths) and not settings.debug
+
+
 # =============================================================================
 # 수명주기(Lifespan) 관리
 # =============================================================================
@@ -68,6 +81,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     print("🚀 애플리케이션 시작 중...")
     await init_db()  # DB 엔진 생성 및 테이블 초기화
     print("✅ 데이터베이스 초기화 완료")
+    if loaded := load_cache_snapshot():  # 이전 종료 시 저장한 캐시로 워밍업
+        print(f"✅ 캐시 스냅샷 {loaded}개 항목 불러옴")
+    if settings.template_precompile and not settings.debug:
+        # 첫 요청이 템플릿 파싱/컴파일 비용을 치르지 않도록 미리 컴파일
+        print(f"✅ 템플릿 {precompile_templates()}개 미리 컴파일 완료")
+    if _anonymous_page_cache_enabled() and settings.anonymous_page_cache_prewarm:
+        # 첫 방문자(크롤러, 랜딩 트래픽)도 캐시된 응답을 받도록 미리 렌더링
+        warmed = await prewarm_pages(app, settings.anonymous_page_cache_paths)
+        print(f"✅ 익명 페이지 {warmed}개 캐시 완료")
 
     yield  # 앱이 실행되는 동안 여기서 대기
 
@@ -75,7 +97,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # Shutdown (앱 종료 시 실행)
     # =========================================================================
     print("🛑 애플리케이션 종료 중...")
-    await close_db()  # DB 연결 풀 정리
+    try:
+        save_cache_snapshot()  # 다음 시작 시 워밍업용 캐시 스냅샷 저장 (설정 시)
+    finally:
+        # 스냅샷 저장이 실패해도 연결은 정리
+        await close_cache()  # 캐시 연결 정리 (Redis 사용 시)
+        close_principal_table()  # 공유 principal 테이블 연결 해제 (메모리는 유지)
+        await close_db()  # DB 연결 풀 정리
     print("✅ 데이터베이스 연결 종료 완료")
 
 
@@ -139,6 +167,46 @@ def create_app() -> FastAPI:
         allow_headers=["*"],                  # 모든 헤더 허용
     )
 
+    # =========================================================================
+    # 읽기 레플리카 사용 시 read-your-writes 보장
+    # =========================================================================
+    # 쓰기를 한 클라이언트에 짧은 수명의 쿠키를 설정하여,
+    # 그 동안의 읽기 요청은 레플리카 대신 프라이머리 DB를 사용하게 합니다.
+    # =========================================================================
+    if settings.database_replica_url:
+        app.add_middleware(
+            ReadYourWritesMiddleware,
+            pin_seconds=settings.database_replica_pin_seconds,
+        )
+
+    # =========================================================================
+    # 동일 요청 합치기 (request coalescing)
+    # =========================================================================
+    # 더블 클릭, HTMX 트리거 연속 발생, 여러 탭 새로고침으로 같은 사용자의
+    # 같은 GET 요청이 동시에 들어오면 핸들러를 한 번만 실행하고 응답을 공유합니다.
+    # =========================================================================
+    if settings.request_coalescing_paths:
+        app.add_middleware(
+            RequestCoalescingMiddleware,
+            paths=settings.request_coalescing_paths,
+        )
+
+    # =========================================================================
+    # 익명 페이지 응답 캐시
+    # =========================================================================
+    # 홈, 소개, 로그인 등 로그인하지 않은 방문자에게 같은 HTML을 보여주는
+    # 페이지는 응답 전체를 캐시하고 ETag/304로 응답합니다.
+    # 인증 쿠키가 있으면 거치지 않습니다. (debug 모드에서는 템플릿 수정이
+    # 바로 보이도록 사용하지 않음)
+    # =========================================================================
+    if _anonymous_page_cache_enabled():
+        app.add_middleware(
+            AnonymousPageCacheMiddleware,
+            paths=settings.anonymous_page_cache_paths,
+            ttl=settings.anonymous_page_cache_ttl,
+            template_directory=TEMPLATE_DIRECTORY,
+        )
+
     # =========================================================================
     # 정적 파일 마운트
     # =========================================================================
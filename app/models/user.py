@@ -33,9 +33,11 @@ class User(BaseModel):
         index=True,
         nullable=False,
     )
+    # 캐시에는 저장하지 않음 (app.core.cache 민감한 컬럼)
     hashed_password: Mapped[str] = mapped_column(
         String(255),
         nullable=False,
+        info={"cache": False},
     )
 
     # 프로필 정보
@@ -66,10 +68,13 @@ class User(BaseModel):
     )
 
     # 관계
+    # passive_deletes=True: 사용자 삭제 시 아이템을 메모리로 불러와 하나씩 지우지 않고
+    # 외래 키의 ON DELETE CASCADE(DB)에 맡깁니다. (SQLite는 foreign_keys PRAGMA 필요)
     items: Mapped[List["Item"]] = relationship(
         "Item",
         back_populates="owner",
         cascade="all, delete-orphan",
+        passive_deletes=True,
     )
 
     def __repr__(self) -> str:
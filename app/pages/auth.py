@@ -8,7 +8,7 @@ from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 
 from app.api.deps import CurrentUserOptional
-from app.core.templates import templates
+from app.core.templates import render_page
 
 router = APIRouter()
 
@@ -20,7 +20,7 @@ async def login_page(request: Request, current_user: CurrentUserOptional):
     if current_user:
         return RedirectResponse(url="/dashboard", status_code=302)
 
-    return templates.TemplateResponse(
+    return render_page(
         request=request,
         name="pages/login.html",
         context={
@@ -37,7 +37,7 @@ async def register_page(request: Request, current_user: CurrentUserOptional):
     if current_user:
         return RedirectResponse(url="/dashboard", status_code=302)
 
-    return templates.TemplateResponse(
+    return render_page(
         request=request,
         name="pages/register.html",
         context={
@@ -53,7 +53,7 @@ async def forgot_password_page(request: Request, current_user: CurrentUserOption
     if current_user:
         return RedirectResponse(url="/dashboard", status_code=302)
 
-    return templates.TemplateResponse(
+    return render_page(
         request=request,
         name="pages/forgot-password.html",
         context={
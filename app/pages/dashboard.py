@@ -10,7 +10,8 @@ from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
 
 from app.api.deps import CurrentUser, DbSession, get_item_service
-from app.core.templates import templates
+from app.core.fragment_cache import item_card_version
+from app.core.templates import render_page, stream_page
 from app.services.item import ItemService
 
 router = APIRouter()
@@ -22,29 +23,27 @@ async def dashboard(
     current_user: CurrentUser,
     item_service: Annotated[ItemService, Depends(get_item_service)],
 ):
-    """대시보드 메인"""
-    # 최근 아이템 조회
-    recent_items = await item_service.get_all(
-        owner_id=current_user.id,
-        limit=5,
-    )
+    """대시보드 메인 (레이아웃을 먼저 보내고 통계/최근 아이템을 이어서 스트리밍)"""
+
+    async def load() -> dict:
+        # 최근 아이템 조회
+        recent_items = await item_service.get_all(
+            owner_id=current_user.id,
+            limit=5,
+        )
 
-    # 통계
-    total_items = await item_service.count(owner_id=current_user.id)
-    active_items = await item_service.count(owner_id=current_user.id, is_active=True)
+        # 통계 (전체/활성 개수를 한 번에 집계)
+        stats = await item_service.get_stats(owner_id=current_user.id)
+        return {"recent_items": recent_items, "stats": stats}
 
-    return templates.TemplateResponse(
+    return await stream_page(
         request=request,
         name="pages/dashboard.html",
         context={
             "title": "대시보드",
             "current_user": current_user,
-            "recent_items": recent_items,
-            "stats": {
-                "total_items": total_items,
-                "active_items": active_items,
-            },
         },
+        load=load,
     )
 
 
@@ -56,38 +55,43 @@ async def items_page(
     page: int = Query(1, ge=1),
     search: Optional[str] = None,
 ):
-    """아이템 목록 페이지"""
+    """아이템 목록 페이지 (레이아웃을 먼저 보내고 목록을 이어서 스트리밍)"""
     page_size = 10
     skip = (page - 1) * page_size
 
-    items = await item_service.get_all(
-        owner_id=current_user.id,
-        skip=skip,
-        limit=page_size,
-        search=search,
-    )
-    total = await item_service.count(owner_id=current_user.id, search=search)
-    total_pages = (total + page_size - 1) // page_size
+    async def load() -> dict:
+        items = await item_service.get_all(
+            owner_id=current_user.id,
+            skip=skip,
+            limit=page_size,
+            search=search,
+        )
+        total = await item_service.count(owner_id=current_user.id, search=search)
+        total_pages = (total + page_size - 1) // page_size
+        return {
+            "items": items,
+            "total_pages": total_pages,
+            "total": total,
+            "card_version": await item_card_version(current_user.id),
+        }
 
-    return templates.TemplateResponse(
+    return await stream_page(
         request=request,
         name="pages/items.html",
         context={
             "title": "아이템 관리",
             "current_user": current_user,
-            "items": items,
             "page": page,
-            "total_pages": total_pages,
-            "total": total,
             "search": search,
         },
+        load=load,
     )
 
 
 @router.get("/profile", response_class=HTMLResponse)
 async def profile_page(request: Request, current_user: CurrentUser):
     """프로필 페이지"""
-    return templates.TemplateResponse(
+    return render_page(
         request=request,
         name="pages/profile.html",
         context={
@@ -100,7 +104,7 @@ async def profile_page(request: Request, current_user: CurrentUser):
 @router.get("/settings", response_class=HTMLResponse)
 async def settings_page(request: Request, current_user: CurrentUser):
     """설정 페이지"""
-    return templates.TemplateResponse(
+    return render_page(
         request=request,
         name="pages/settings.html",
         context={
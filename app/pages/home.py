@@ -8,7 +8,7 @@ from fastapi import APIRouter, Request
 from fastapi.responses import HTMLResponse
 
 from app.api.deps import CurrentUserOptional
-from app.core.templates import templates
+from app.core.templates import render_page
 
 router = APIRouter()
 
@@ -16,7 +16,7 @@ router = APIRouter()
 @router.get("/", response_class=HTMLResponse)
 async def home(request: Request, current_user: CurrentUserOptional):
     """홈페이지"""
-    return templates.TemplateResponse(
+    return render_page(
         request=request,
         name="pages/home.html",
         context={
@@ -29,7 +29,7 @@ async def home(request: Request, current_user: CurrentUserOptional):
 @router.get("/about", response_class=HTMLResponse)
 async def about(request: Request, current_user: CurrentUserOptional):
     """소개 페이지"""
-    return templates.TemplateResponse(
+    return render_page(
         request=request,
         name="pages/about.html",
         context={
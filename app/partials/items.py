@@ -7,13 +7,17 @@ Items Partials Router
 import json
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, Form, Query, Request
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, Depends, File, Form, Query, Request, UploadFile
+from fastapi.responses import HTMLResponse, Response
 
-from app.api.deps import CurrentUser, get_item_service
+from app.api.deps import CurrentUser, SessionFactory, get_item_service
+from app.core.exceptions import NotFoundError
+from app.core.fragment_cache import forget_item_card, item_card_version
+from app.core.jobs import Job
 from app.core.templates import templates
 from app.schemas.item import ItemCreate, ItemUpdate
 from app.services.item import ItemService
+from app.services.item_import import get_import_job, start_item_import
 
 router = APIRouter()
 
@@ -40,7 +44,11 @@ async def get_items_partial(
     return templates.TemplateResponse(
         request=request,
         name="partials/items/list.html",
-        context={"items": items, "search": search},
+        context={
+            "items": items,
+            "search": search,
+            "card_version": await item_card_version(current_user.id),
+        },
     )
 
 
@@ -54,6 +62,59 @@ async def get_item_form(request: Request, current_user: CurrentUser):
     )
 
 
+@router.get("/import", response_class=HTMLResponse)
+async def get_import_form(request: Request, current_user: CurrentUser):
+    """아이템 가져오기 폼 파셜"""
+    return templates.TemplateResponse(
+        request=request,
+        name="partials/items/import_form.html",
+    )
+
+
+def _import_progress_response(request: Request, job: Job) -> Response:
+    """가져오기 진행 상황 파셜 응답 (완료 시 토스트 트리거)"""
+    response = templates.TemplateResponse(
+        request=request,
+        name="partials/items/import_progress.html",
+        context={"job": job},
+    )
+    if job.done:
+        toast_type = "error" if job.status == "failed" else "success"
+        response.headers["HX-Trigger"] = json.dumps(
+            {"showToast": {"type": toast_type, "message": job.message or "가져오기가 끝났습니다."}}
+        )
+    return response
+
+
+@router.post("/import", response_class=HTMLResponse)
+async def import_items_partial(
+    request: Request,
+    current_user: CurrentUser,
+    session_factory: SessionFactory,
+    file: UploadFile = File(...),
+):
+    """아이템 가져오기 시작 (HTMX)"""
+    job = await start_item_import(
+        file,
+        owner_id=current_user.id,
+        session_factory=session_factory,
+    )
+    return _import_progress_response(request, job)
+
+
+@router.get("/import/{job_id}", response_class=HTMLResponse)
+async def import_progress_partial(
+    request: Request,
+    job_id: str,
+    current_user: CurrentUser,
+):
+    """아이템 가져오기 진행 상황 파셜 (HTMX 폴링)"""
+    job = get_import_job(job_id, owner_id=current_user.id)
+    if job is None:
+        raise NotFoundError("가져오기 작업을 찾을 수 없습니다.")
+    return _import_progress_response(request, job)
+
+
 @router.get("/{item_id}", response_class=HTMLResponse)
 async def get_item_partial(
     request: Request,
@@ -67,7 +128,7 @@ async def get_item_partial(
     return templates.TemplateResponse(
         request=request,
         name="partials/items/item.html",
-        context={"item": item},
+        context={"item": item, "card_version": await item_card_version(current_user.id)},
     )
 
 
@@ -104,7 +165,7 @@ async def create_item_partial(
     response = templates.TemplateResponse(
         request=request,
         name="partials/items/item.html",
-        context={"item": item},
+        context={"item": item, "card_version": await item_card_version(current_user.id)},
     )
 
     # 토스트 알림 트리거
@@ -132,11 +193,12 @@ async def update_item_partial(
     item = await item_service.get_or_404(item_id, owner_id=current_user.id)
     item_in = ItemUpdate(title=title, description=description, priority=priority)
     updated_item = await item_service.update(item, item_in)
+    forget_item_card(current_user.id, item_id)
 
     response = templates.TemplateResponse(
         request=request,
         name="partials/items/item.html",
-        context={"item": updated_item},
+        context={"item": updated_item, "card_version": await item_card_version(current_user.id)},
     )
 
     response.headers["HX-Trigger"] = json.dumps(
@@ -158,6 +220,7 @@ async def delete_item_partial(
     """아이템 삭제 (HTMX)"""
     item = await item_service.get_or_404(item_id, owner_id=current_user.id)
     await item_service.delete(item)
+    forget_item_card(current_user.id, item_id)
 
     response = HTMLResponse(content="")
     response.headers["HX-Trigger"] = json.dumps(
@@ -177,11 +240,12 @@ async def toggle_item_partial(
     """아이템 활성/비활성 토글 (HTMX)"""
     item = await item_service.get_or_404(item_id, owner_id=current_user.id)
     updated_item = await item_service.toggle_active(item)
+    forget_item_card(current_user.id, item_id)
 
     response = templates.TemplateResponse(
         request=request,
         name="partials/items/item.html",
-        context={"item": updated_item},
+        context={"item": updated_item, "card_version": await item_card_version(current_user.id)},
     )
 
     status = "활성화" if updated_item.is_active else "비활성화"
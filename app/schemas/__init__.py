@@ -6,6 +6,7 @@ API 요청/응답 데이터 검증을 위한 스키마 정의
 
 from app.schemas.common import Message, PaginatedResponse
 from app.schemas.item import Item, ItemCreate, ItemUpdate
+from app.schemas.job import JobStatus
 from app.schemas.user import Token, TokenPayload, User, UserCreate, UserLogin, UserUpdate
 
 __all__ = [
@@ -23,4 +24,6 @@ __all__ = [
     "Item",
     "ItemCreate",
     "ItemUpdate",
+    # Job
+    "JobStatus",
 ]
@@ -0,0 +1,27 @@
+"""
+Job Schemas
+
+백그라운드 작업 상태 관련 Pydantic 스키마 정의
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class JobStatus(BaseModel):
+    """백그라운드 작업 상태 응답 스키마"""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    kind: str
+    status: str
+    done: bool
+    progress: Optional[float] = None
+    succeeded: int
+    failed: int
+    message: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
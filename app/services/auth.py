@@ -46,7 +46,6 @@ from app.core.exceptions import AuthenticationError, ConflictError, ValidationEr
 from app.core.security import (
     create_access_token,
     create_refresh_token,
-    get_password_hash,
     verify_password,
     verify_token,
 )
@@ -97,8 +96,8 @@ class AuthService:
         """
         회원가입 처리
 
-        새로운 사용자를 등록합니다. 이메일과 사용자명의 중복을 확인하고,
-        비밀번호를 해시화하여 저장합니다.
+        새로운 사용자를 등록합니다. 비밀번호를 해시화하여 바로 저장을 시도하고,
+        이메일/사용자명 유일성 충돌이 나면 ConflictError로 변환합니다.
 
         Args:
             user_in: 사용자 생성 데이터
@@ -114,30 +113,37 @@ class AuthService:
             ConflictError: 이메일 또는 사용자명이 이미 존재할 경우
 
         회원가입 흐름:
-            1. 이메일 중복 확인
-            2. 사용자명 중복 확인
-            3. 비밀번호 해시화 (bcrypt)
-            4. DB에 사용자 저장
-            5. 생성된 사용자 반환
+            1. 비밀번호 해시화 (bcrypt)
+            2. INSERT ... ON CONFLICT DO NOTHING RETURNING으로 저장 시도
+            3. 충돌 시 어떤 필드가 중복인지 한 번의 EXISTS 쿼리로 확인
+            4. 생성된 사용자 반환
+
+        중복 확인 후 INSERT하는 방식은 쿼리가 3번 필요하고, 확인과 INSERT 사이에
+        다른 요청이 같은 이메일로 가입하면 IntegrityError가 발생합니다.
+        INSERT를 먼저 시도하면 정상 경로는 한 번의 왕복으로 끝나고 경쟁 상황도
+        유일성 제약이 처리합니다.
 
         보안 고려사항:
             - 비밀번호는 절대 평문으로 저장하지 않음
             - bcrypt 해시 사용 (salt 자동 포함)
             - 같은 비밀번호도 매번 다른 해시값 생성
         """
-        # Step 1: 이메일 중복 확인
-        # 이미 등록된 이메일이면 회원가입 불가
-        if await self.user_service.is_email_taken(user_in.email):
+        # Step 1 & 2: 사용자 생성 시도 (UserService에서 비밀번호 해시화 처리)
+        # 이메일/사용자명이 이미 존재하면 None 반환
+        user = await self.user_service.create_if_unique(user_in)
+        if user is not None:
+            return user
+
+        # Step 3: 충돌한 필드 확인 (충돌 시에만 실행)
+        taken = await self.user_service.get_taken_fields(
+            email=user_in.email,
+            username=user_in.username,
+        )
+        if "email" in taken:
             raise ConflictError("이미 등록된 이메일입니다.")
-
-        # Step 2: 사용자명 중복 확인
-        # 사용자명은 로그인이나 프로필 URL에 사용될 수 있음
-        if await self.user_service.is_username_taken(user_in.username):
+        if "username" in taken:
             raise ConflictError("이미 사용중인 사용자명입니다.")
-
-        # Step 3: 사용자 생성 (UserService에서 비밀번호 해시화 처리)
-        user = await self.user_service.create(user_in)
-        return user
+        raise ConflictError()
 
     # =========================================================================
     # 로그인
@@ -343,16 +349,16 @@ class AuthService:
         # Step 1: 현재 비밀번호 검증
         # 다른 사람이 로그인된 세션을 탈취해도
         # 현재 비밀번호를 모르면 변경 불가
-        if not verify_password(current_password, user.hashed_password):
+        # (해시는 캐시하지 않으므로 캐시에서 온 사용자 객체 대신 DB에서 조회)
+        hashed_password = await self.user_service.get_hashed_password(user.id)
+        if hashed_password is None or not verify_password(
+            current_password, hashed_password
+        ):
             raise ValidationError("현재 비밀번호가 올바르지 않습니다.")
 
         # Step 2: 새 비밀번호 해시화 및 저장
-        user.hashed_password = get_password_hash(new_password)
-
-        # Step 3: DB에 변경사항 반영
-        # flush: 변경사항을 DB에 전송 (아직 커밋은 아님)
-        # refresh: DB에서 최신 데이터로 객체 갱신
-        await self.db.flush()
-        await self.db.refresh(user)
+        # UserService.set_password: 해싱 후 flush + refresh
+        # (SQLite 쓰기 조정 모드에서는 단일 작성자를 통해 커밋)
+        user = await self.user_service.set_password(user, new_password)
 
         return user
@@ -4,24 +4,82 @@ Item Service
 아이템 관련 비즈니스 로직
 """
 
-from typing import Optional
+from datetime import datetime
+from typing import AsyncIterator, Optional, cast
 
-from sqlalchemy import func, select
+from sqlalchemy import (
+    CursorResult,
+    RowMapping,
+    Select,
+    Table,
+    case,
+    delete,
+    func,
+    insert,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
+from app.config import settings
+from app.core.cache import cached, invalidate
 from app.core.exceptions import NotFoundError
+from app.core.sharding import CROSS_SHARD_OPTION
+from app.core.sqlite_writer import attach, run_write
 from app.models.item import Item
 from app.models.user import User
 from app.schemas.item import ItemCreate, ItemUpdate
 
 
+# 내보내기(export)에 포함되는 컬럼 (응답 스키마 Item과 동일한 필드)
+EXPORT_COLUMNS = (
+    Item.id,
+    Item.title,
+    Item.description,
+    Item.priority,
+    Item.is_active,
+    Item.owner_id,
+    Item.created_at,
+    Item.updated_at,
+)
+
+# 목록 정렬 순서 (우선순위 높은 순, 최신순)
+LIST_ORDER = (Item.priority.desc(), Item.created_at.desc())
+
+
 class ItemService:
     """아이템 서비스"""
 
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @staticmethod
+    def _apply_filters(
+        query: Select,
+        owner_id: Optional[int] = None,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+    ) -> Select:
+        """목록/개수/내보내기 쿼리에 공통 필터 적용"""
+        if owner_id:
+            query = query.where(Item.owner_id == owner_id)
+
+        if is_active is not None:
+            query = query.where(Item.is_active == is_active)
+
+        if search:
+            query = query.where(
+                Item.title.ilike(f"%{search}%")
+                | Item.description.ilike(f"%{search}%")
+            )
+
+        return query
+
+    @cached(
+        "item:{item_id}:{owner_id}",
+        tags=("item:{item_id}", "items:owner:{owner_id}"),
+        negative_ttl=settings.cache_negative_ttl,
+    )
     async def get_by_id(
         self,
         item_id: int,
@@ -30,6 +88,9 @@ class ItemService:
         """
         ID로 아이템 조회
 
+        없는 아이템(삭제된 ID 등)도 잠시 캐시하므로 반복되는 404 조회는
+        DB에 가지 않습니다. (생성 시 소유자/아이템 태그 무효화로 삭제)
+
         Args:
             item_id: 아이템 ID
             owner_id: 소유자 ID (지정 시 소유자 검증)
@@ -40,6 +101,31 @@ class ItemService:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    @cached(
+        "item:version:{item_id}:{owner_id}",
+        tags=("item:{item_id}", "items:owner:{owner_id}"),
+        negative_ttl=settings.cache_negative_ttl,
+    )
+    async def get_version(
+        self,
+        item_id: int,
+        owner_id: Optional[int] = None,
+    ) -> Optional[tuple[int, datetime]]:
+        """
+        아이템 검증자(ETag)용 버전 (ID, 수정 시각)
+
+        두 컬럼만 조회하므로 ORM 객체를 만들지 않습니다.
+
+        Returns:
+            (ID, 수정 시각) 또는 None (아이템 없음)
+        """
+        query = select(Item.id, Item.updated_at).where(Item.id == item_id)
+        if owner_id:
+            query = query.where(Item.owner_id == owner_id)
+        result = await self.db.execute(query)
+        row = result.one_or_none()
+        return (row.id, row.updated_at) if row is not None else None
+
     async def get_by_id_with_owner(self, item_id: int) -> Optional[Item]:
         """소유자 정보 포함 아이템 조회"""
         query = (
@@ -50,6 +136,10 @@ class ItemService:
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    @cached(
+        "items:{owner_id}:g{generation}:{skip}:{limit}:{is_active}:{search}",
+        generation="items:owner:{owner_id}",
+    )
     async def get_all(
         self,
         owner_id: Optional[int] = None,
@@ -59,26 +149,65 @@ class ItemService:
         search: Optional[str] = None,
     ) -> list[Item]:
         """아이템 목록 조회"""
-        query = select(Item)
-
-        if owner_id:
-            query = query.where(Item.owner_id == owner_id)
+        query = self._apply_filters(
+            select(Item),
+            owner_id=owner_id,
+            is_active=is_active,
+            search=search,
+        )
+        query = query.order_by(*LIST_ORDER)
+        query = query.offset(skip).limit(limit)
 
-        if is_active is not None:
-            query = query.where(Item.is_active == is_active)
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
 
-        if search:
-            query = query.where(
-                Item.title.ilike(f"%{search}%")
-                | Item.description.ilike(f"%{search}%")
-            )
+    async def scan_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+    ) -> list[Item]:
+        """
+        전체 사용자의 아이템 목록 조회 (관리자용)
 
-        query = query.order_by(Item.priority.desc(), Item.created_at.desc())
-        query = query.offset(skip).limit(limit)
+        아이템 샤딩 사용 시 모든 샤드를 조회합니다. 샤드마다 skip + limit개까지
+        정렬해서 가져온 뒤 합쳐서 다시 정렬하고 잘라냅니다.
+        """
+        query = self._apply_filters(select(Item), is_active=is_active, search=search)
+        query = (
+            query.order_by(*LIST_ORDER)
+            .limit(skip + limit)
+            .execution_options(**{CROSS_SHARD_OPTION: True})
+        )
 
         result = await self.db.execute(query)
-        return list(result.scalars().all())
+        items = sorted(
+            result.scalars().all(),
+            key=lambda item: (item.priority, item.created_at),
+            reverse=True,
+        )
+        return items[skip : skip + limit]
+
+    async def count_all(
+        self,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+    ) -> int:
+        """전체 사용자의 아이템 개수 조회 (관리자용, 샤드별 개수 합계)"""
+        query = self._apply_filters(
+            select(func.count(Item.id)), is_active=is_active, search=search
+        )
+        result = await self.db.execute(
+            query.execution_options(**{CROSS_SHARD_OPTION: True})
+        )
+        return sum(result.scalars().all())
 
+    @cached(
+        "items:count:{owner_id}:g{generation}:{is_active}:{search}",
+        generation="items:owner:{owner_id}",
+        stale_ttl=settings.cache_stale_ttl,
+    )
     async def count(
         self,
         owner_id: Optional[int] = None,
@@ -86,58 +215,258 @@ class ItemService:
         search: Optional[str] = None,
     ) -> int:
         """아이템 개수 조회"""
-        query = select(func.count(Item.id))
+        query = self._apply_filters(
+            select(func.count(Item.id)),
+            owner_id=owner_id,
+            is_active=is_active,
+            search=search,
+        )
+        result = await self.db.execute(query)
+        return result.scalar() or 0
 
-        if owner_id:
-            query = query.where(Item.owner_id == owner_id)
+    async def count_owned_uncached(self, owner_id: int) -> int:
+        """
+        소유자의 아이템 개수를 DB에서 직접 조회 (캐시/stale 값을 쓰지 않음)
 
-        if is_active is not None:
-            query = query.where(Item.is_active == is_active)
+        사용자 삭제 방식(즉시/배치)처럼 오래된 개수로 결정하면 안 되는 곳에서 사용합니다.
+        """
+        result = await self.db.execute(
+            select(func.count(Item.id)).where(Item.owner_id == owner_id)
+        )
+        return result.scalar() or 0
 
-        if search:
-            query = query.where(
-                Item.title.ilike(f"%{search}%")
-                | Item.description.ilike(f"%{search}%")
-            )
+    @cached(
+        "items:version:{owner_id}:g{generation}:{is_active}:{search}",
+        generation="items:owner:{owner_id}",
+    )
+    async def get_list_version(
+        self,
+        owner_id: Optional[int] = None,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+    ) -> tuple[int, Optional[datetime]]:
+        """
+        목록 검증자(ETag)용 버전 (개수, 최종 수정 시각)
 
+        필터가 같은 목록 전체를 한 번의 집계 쿼리로 확인합니다.
+        수정/생성은 최종 수정 시각, 삭제는 개수로 드러납니다.
+        """
+        query = self._apply_filters(
+            select(func.count(Item.id), func.max(Item.updated_at)),
+            owner_id=owner_id,
+            is_active=is_active,
+            search=search,
+        )
         result = await self.db.execute(query)
-        return result.scalar() or 0
+        total, last_modified = result.one()
+        return total, last_modified
+
+    @cached(
+        "items:stats:{owner_id}:g{generation}",
+        generation="items:owner:{owner_id}",
+        stale_ttl=settings.cache_stale_ttl,
+    )
+    async def get_stats(self, owner_id: int) -> dict[str, int]:
+        """
+        대시보드 통계 (전체/활성 아이템 수)
+
+        두 개수를 한 번의 쿼리로 집계합니다.
+        """
+        result = await self.db.execute(
+            select(
+                func.count(Item.id),
+                func.coalesce(func.sum(case((Item.is_active.is_(True), 1), else_=0)), 0),
+            ).where(Item.owner_id == owner_id)
+        )
+        total_items, active_items = result.one()
+        return {"total_items": total_items, "active_items": active_items}
+
+    async def stream_rows(
+        self,
+        owner_id: int,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[RowMapping]:
+        """
+        아이템 행 스트리밍 (내보내기용)
+
+        서버 사이드 커서(AsyncSession.stream + yield_per)로 batch_size개씩
+        가져오므로 아이템 수와 관계없이 메모리 사용량이 일정합니다.
+        ORM 객체 대신 컬럼 매핑을 반환하여 identity map에도 쌓이지 않습니다.
+
+        Args:
+            owner_id: 소유자 ID
+            is_active: 활성 상태 필터
+            search: 검색어
+            batch_size: 커서에서 한 번에 가져올 행 수
+
+        Yields:
+            EXPORT_COLUMNS 컬럼을 키로 하는 행 매핑
+        """
+        query = self._apply_filters(
+            select(*EXPORT_COLUMNS),
+            owner_id=owner_id,
+            is_active=is_active,
+            search=search,
+        )
+        query = query.order_by(Item.id).execution_options(yield_per=batch_size)
+
+        result = await self.db.stream(query)
+        try:
+            async for row in result.mappings():
+                yield row
+        finally:
+            await result.close()
 
     async def create(self, item_in: ItemCreate, owner: User) -> Item:
         """아이템 생성"""
-        item = Item(
-            title=item_in.title,
-            description=item_in.description,
-            priority=item_in.priority,
-            owner_id=owner.id,
-        )
-        self.db.add(item)
-        await self.db.flush()
-        await self.db.refresh(item)
+        owner_id = owner.id
+
+        async def write(db: AsyncSession) -> Item:
+            item = Item(
+                title=item_in.title,
+                description=item_in.description,
+                priority=item_in.priority,
+                owner_id=owner_id,
+            )
+            db.add(item)
+            await db.flush()
+            await db.refresh(item)
+            return item
+
+        invalidate(self.db, f"items:owner:{owner_id}")
+        item = await run_write(self.db, write)
+        # 새 ID에 남아 있을 수 있는 "없음" 캐시 삭제 (소유자 없이 조회한 경우)
+        invalidate(self.db, f"item:{item.id}")
         return item
 
+    async def bulk_create(self, items_in: list[ItemCreate], owner_id: int) -> int:
+        """
+        아이템 일괄 생성
+
+        ORM 객체를 만들지 않고 하나의 INSERT 문을 executemany로 실행합니다.
+        (flush/refresh 왕복 없음, 샤드 세션에서도 동작하도록 테이블 대상 Core INSERT 사용)
+
+        Returns:
+            생성된 아이템 수
+        """
+        if not items_in:
+            return 0
+        rows = [
+            {
+                "title": item_in.title,
+                "description": item_in.description,
+                "priority": item_in.priority,
+                "owner_id": owner_id,
+            }
+            for item_in in items_in
+        ]
+
+        async def write(db: AsyncSession) -> int:
+            await db.execute(insert(cast(Table, Item.__table__)), rows)
+            return len(rows)
+
+        invalidate(self.db, f"items:owner:{owner_id}")
+        return await run_write(self.db, write)
+
     async def update(self, item: Item, item_in: ItemUpdate) -> Item:
         """아이템 수정"""
         update_data = item_in.model_dump(exclude_unset=True)
 
-        for field, value in update_data.items():
-            setattr(item, field, value)
+        async def write(db: AsyncSession) -> Item:
+            target = await attach(db, item)
+            for field, value in update_data.items():
+                setattr(target, field, value)
+            await db.flush()
+            await db.refresh(target)
+            return target
 
-        await self.db.flush()
-        await self.db.refresh(item)
-        return item
+        self._invalidate_item(item)
+        return await run_write(self.db, write)
 
     async def delete(self, item: Item) -> None:
         """아이템 삭제"""
-        await self.db.delete(item)
-        await self.db.flush()
+
+        async def write(db: AsyncSession) -> None:
+            await db.delete(await attach(db, item))
+            await db.flush()
+
+        self._invalidate_item(item)
+        await run_write(self.db, write)
+        if item in self.db:
+            self.db.expunge(item)
+
+    async def delete_by_owner_batch(self, owner_id: int, batch_size: int) -> int:
+        """
+        소유자의 아이템을 최대 batch_size개 삭제
+
+        ORM 객체를 불러오지 않고 DELETE ... WHERE id IN (SELECT ... LIMIT n)
+        한 문장으로 처리합니다. 대량 삭제 시 배치마다 커밋하여
+        트랜잭션을 짧게 유지하는 용도입니다.
+
+        Returns:
+            삭제된 아이템 수
+        """
+        batch_ids = (
+            select(Item.id)
+            .where(Item.owner_id == owner_id)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        stmt = (
+            delete(Item)
+            .where(Item.id.in_(batch_ids))
+            .execution_options(synchronize_session=False)
+        )
+
+        async def write(db: AsyncSession) -> int:
+            result = cast(CursorResult, await db.execute(stmt))
+            return result.rowcount or 0
+
+        invalidate(self.db, f"items:owner:{owner_id}")
+        return await run_write(self.db, write)
+
+    async def delete_by_owner(self, owner_id: int) -> int:
+        """
+        소유자의 아이템 전체 삭제
+
+        샤딩 사용 시 아이템은 사용자와 다른 DB에 있어 ON DELETE CASCADE가
+        동작하지 않으므로, 사용자 삭제 전에 호출합니다. (샤딩하지 않으면
+        사용자 삭제 시 DB의 CASCADE가 아이템을 삭제)
+
+        Returns:
+            삭제된 아이템 수
+        """
+        stmt = (
+            delete(Item)
+            .where(Item.owner_id == owner_id)
+            .execution_options(synchronize_session=False)
+        )
+
+        async def write(db: AsyncSession) -> int:
+            result = cast(CursorResult, await db.execute(stmt))
+            return result.rowcount or 0
+
+        invalidate(self.db, f"items:owner:{owner_id}")
+        return await run_write(self.db, write)
 
     async def toggle_active(self, item: Item) -> Item:
         """아이템 활성/비활성 토글"""
-        item.is_active = not item.is_active
-        await self.db.flush()
-        await self.db.refresh(item)
-        return item
+
+        async def write(db: AsyncSession) -> Item:
+            target = await attach(db, item)
+            target.is_active = not target.is_active
+            await db.flush()
+            await db.refresh(target)
+            return target
+
+        self._invalidate_item(item)
+        return await run_write(self.db, write)
+
+    def _invalidate_item(self, item: Item) -> None:
+        """아이템 변경 시 커밋 후 무효화할 캐시 태그 등록"""
+        invalidate(self.db, f"item:{item.id}", f"items:owner:{item.owner_id}")
 
     async def get_or_404(
         self,
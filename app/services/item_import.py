@@ -0,0 +1,257 @@
+"""
+Item Import Service
+
+CSV / NDJSON 파일로 아이템을 대량 가져오는 백그라운드 작업
+
+흐름:
+    1. 업로드 파일을 임시 파일로 청크 단위 복사 (요청 종료 후에도 읽기 위해)
+    2. 작업 레지스트리에 작업 등록 후 백그라운드 태스크로 실행
+    3. 스레드에서 import_batch_size개씩 읽어 ItemCreate로 검증, executemany INSERT
+    4. 배치마다 커밋하고 진행 상황 갱신 (HTMX가 폴링)
+    5. 잘못된 행은 작업 오류 목록에 모아 두고 가져오기는 계속 진행
+"""
+
+import csv
+import io
+import itertools
+import json
+import os
+import shutil
+import tempfile
+from typing import IO, Any, BinaryIO, Generator, Iterator, Optional
+
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+from pydantic import ValidationError as PydanticValidationError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.exceptions import ValidationError
+from app.core.jobs import Job, job_registry
+from app.schemas.item import ItemCreate
+from app.services.item import ItemService
+
+# 작업 종류 식별자
+IMPORT_JOB_KIND = "item_import"
+
+# 파일 확장자 → 가져오기 형식
+IMPORT_FORMATS = {
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+# 오류 리포트 CSV 컬럼
+ERROR_REPORT_FIELDS = ("line", "error", "raw")
+
+
+def detect_format(filename: Optional[str], format: Optional[str] = None) -> str:
+    """
+    가져오기 형식 결정
+
+    명시적인 format이 있으면 그대로 사용하고, 없으면 파일 확장자로 판단합니다.
+
+    Raises:
+        ValidationError: 지원하지 않는 형식
+    """
+    if format:
+        if format not in ("csv", "ndjson"):
+            raise ValidationError(f"지원하지 않는 가져오기 형식입니다: {format}")
+        return format
+
+    extension = os.path.splitext(filename or "")[1].lower()
+    if extension not in IMPORT_FORMATS:
+        raise ValidationError("CSV 또는 NDJSON(.ndjson, .jsonl) 파일만 가져올 수 있습니다.")
+    return IMPORT_FORMATS[extension]
+
+
+def _iter_lines(path: str, job: Job) -> Iterator[str]:
+    """파일을 한 줄씩 읽으며 읽은 바이트 수를 진행 상황에 반영"""
+    with open(path, "rb") as f:
+        for index, raw in enumerate(f):
+            job.processed += len(raw)
+            # 첫 줄의 BOM(엑셀 CSV 등) 제거
+            yield raw.decode("utf-8-sig" if index == 0 else "utf-8", errors="replace")
+
+
+def _iter_records(path: str, format: str, job: Job) -> Generator[tuple[int, Any], None, None]:
+    """
+    파일에서 (줄 번호, 레코드) 쌍을 순서대로 생성
+
+    레코드는 dict이거나, 파싱에 실패한 경우 예외 객체입니다.
+    """
+    lines = _iter_lines(path, job)
+
+    if format == "csv":
+        reader = csv.DictReader(lines)
+        for row in reader:
+            yield reader.line_num, row
+        return
+
+    for line_no, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except json.JSONDecodeError as exc:
+            yield line_no, exc
+
+
+def _read_records(records: Iterator[tuple[int, Any]], count: int) -> list[tuple[int, Any]]:
+    """레코드를 최대 count개 읽음 (파일 읽기가 이벤트 루프를 막지 않도록 스레드에서 실행)"""
+    return list(itertools.islice(records, count))
+
+
+def _parse_record(record: Any) -> ItemCreate:
+    """
+    레코드를 ItemCreate로 검증
+
+    CSV의 빈 문자열은 값이 없는 것으로 취급합니다.
+    """
+    if isinstance(record, Exception):
+        raise record
+    if not isinstance(record, dict):
+        raise ValueError("각 행은 JSON 객체여야 합니다.")
+
+    data = {
+        key: value
+        for key, value in record.items()
+        if key in ItemCreate.model_fields and value not in (None, "")
+    }
+    return ItemCreate.model_validate(data)
+
+
+def _error_message(exc: Exception) -> str:
+    """검증 오류를 한 줄 메시지로 변환"""
+    if isinstance(exc, PydanticValidationError):
+        return "; ".join(
+            f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}"
+            for error in exc.errors()
+        )
+    return str(exc)
+
+
+def _record_error(job: Job, line: int, exc: Exception, record: Any) -> None:
+    """잘못된 행 기록 (메모리 보호를 위해 import_max_errors개까지만 보관)"""
+    job.failed += 1
+    if len(job.errors) >= settings.import_max_errors:
+        return
+    raw = record if isinstance(record, (dict, str)) else ""
+    job.errors.append(
+        {
+            "line": line,
+            "error": _error_message(exc),
+            "raw": json.dumps(raw, ensure_ascii=False) if isinstance(raw, dict) else raw,
+        }
+    )
+
+
+async def run_item_import(
+    job: Job,
+    path: str,
+    format: str,
+    owner_id: int,
+    session_factory: async_sessionmaker[AsyncSession],
+    batch_size: Optional[int] = None,
+) -> None:
+    """
+    아이템 가져오기 실행
+
+    배치마다 커밋하므로 긴 트랜잭션을 잡지 않으며,
+    실패하더라도 이미 커밋된 배치는 유지됩니다.
+    """
+    batch_size = batch_size or settings.import_batch_size
+
+    records = _iter_records(path, format, job)
+    try:
+        async with session_factory() as session:
+            item_service = ItemService(session)
+            batch: list[ItemCreate] = []
+
+            while chunk := await run_in_threadpool(_read_records, records, batch_size):
+                for line, record in chunk:
+                    try:
+                        batch.append(_parse_record(record))
+                    except (PydanticValidationError, ValueError) as exc:
+                        _record_error(job, line, exc, record)
+                        continue
+
+                    if len(batch) >= batch_size:
+                        job.succeeded += await item_service.bulk_create(batch, owner_id)
+                        await session.commit()
+                        batch = []
+
+            if batch:
+                job.succeeded += await item_service.bulk_create(batch, owner_id)
+                await session.commit()
+    finally:
+        records.close()
+        os.unlink(path)
+
+    job.message = f"{job.succeeded}개 가져옴, {job.failed}개 실패"
+
+
+def _copy_upload(source: BinaryIO, target: IO[bytes]) -> int:
+    """업로드 파일을 임시 파일로 복사하고 크기 반환 (스레드풀에서 실행)"""
+    shutil.copyfileobj(source, target, 1024 * 1024)
+    return target.tell()
+
+
+async def start_item_import(
+    upload: UploadFile,
+    owner_id: int,
+    session_factory: async_sessionmaker[AsyncSession],
+    format: Optional[str] = None,
+) -> Job:
+    """
+    업로드 파일로 가져오기 작업 시작
+
+    업로드 파일은 요청이 끝나면 닫히므로 임시 파일로 복사한 뒤
+    백그라운드 태스크에서 읽습니다.
+
+    Returns:
+        등록된 작업 (진행 상황 폴링용)
+
+    Raises:
+        ValidationError: 지원하지 않는 파일 형식
+    """
+    format = detect_format(upload.filename, format)
+
+    copied = False
+    with tempfile.NamedTemporaryFile(
+        prefix="item-import-", suffix=f".{format}", delete=False
+    ) as tmp:
+        path = tmp.name
+        try:
+            size = await run_in_threadpool(_copy_upload, upload.file, tmp)
+            copied = True
+        finally:
+            # 복사에 실패하면 남은 임시 파일 삭제 (성공하면 가져오기 작업이 삭제)
+            if not copied:
+                tmp.close()
+                os.unlink(path)
+
+    job = job_registry.create(IMPORT_JOB_KIND, owner_id)
+    job.total = size  # 진행률 기준 (읽은 바이트 수 / 파일 크기)
+    job_registry.run(
+        job,
+        lambda job: run_item_import(job, path, format, owner_id, session_factory),
+    )
+    return job
+
+
+def get_import_job(job_id: str, owner_id: int) -> Optional[Job]:
+    """소유자 본인의 가져오기 작업 조회"""
+    job = job_registry.get(job_id)
+    if job is None or job.kind != IMPORT_JOB_KIND or job.owner_id != owner_id:
+        return None
+    return job
+
+
+def build_error_report(job: Job) -> str:
+    """잘못된 행 목록을 CSV 문자열로 생성"""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=ERROR_REPORT_FIELDS)
+    writer.writeheader()
+    writer.writerows(job.errors)
+    return buffer.getvalue()
@@ -0,0 +1,199 @@
+"""
+Item Shard Rebalancing
+
+아이템을 샤드 배치(ITEM_SHARD_URLS)에 맞게 옮기는 마이그레이션 도구
+
+사용 예:
+    # 단일 DB → 샤드 2개로 이전
+    python -m app.services.item_sharding \\
+        --from sqlite+aiosqlite:///./app.db \\
+        --to sqlite+aiosqlite:///./items_0.db --to sqlite+aiosqlite:///./items_1.db
+
+    # 샤드 추가 (2개 → 3개), --from을 생략하면 현재 ITEM_SHARD_URLS 사용
+    python -m app.services.item_sharding --to ... --to ... --to ... --dry-run
+
+흐름:
+    1. 원본 DB마다 아이템을 가진 소유자 목록 조회
+    2. 새 배치에서의 소유자 샤드(jump hash) 계산, 같은 DB면 건너뜀
+    3. 소유자 단위로 대상 DB에 배치 복사(한 트랜잭션) 후 원본에서 삭제
+       - 아이템 ID는 가능하면 유지하고, 대상에 이미 있는 ID만 새로 발급
+       - 대상에 이미 그 소유자의 아이템이 있으면(중단된 이전 실행) 복사 없이 원본만 삭제
+
+Note:
+    애플리케이션을 멈춘 상태에서 실행하고, 완료 후 ITEM_SHARD_URLS를
+    --to 목록과 같은 순서로 바꾼 뒤 재시작합니다.
+"""
+
+import argparse
+import asyncio
+from dataclasses import dataclass
+from typing import Callable, Optional, Sequence, cast
+
+from sqlalchemy import Table, delete, exists, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, create_async_engine
+
+from app.config import settings
+from app.core.sharding import owner_shard_index
+from app.database import Base
+from app.models.item import Item
+
+
+@dataclass
+class RebalanceResult:
+    """리밸런싱 결과"""
+
+    owners_moved: int = 0
+    items_moved: int = 0
+    ids_reassigned: int = 0
+
+
+async def _copy_owner_items(
+    source: AsyncConnection,
+    target: AsyncConnection,
+    items: Table,
+    owner_id: int,
+    batch_size: int,
+    result: RebalanceResult,
+) -> None:
+    """소유자의 아이템을 원본에서 대상으로 배치 복사"""
+    rows = await source.stream(
+        select(items).where(items.c.owner_id == owner_id).order_by(items.c.id)
+    )
+    async for partition in rows.mappings().partitions(batch_size):
+        ids = [row["id"] for row in partition]
+        taken = set(
+            (await target.execute(select(items.c.id).where(items.c.id.in_(ids))))
+            .scalars()
+            .all()
+        )
+        keep_id = [dict(row) for row in partition if row["id"] not in taken]
+        new_id = [
+            {key: value for key, value in row.items() if key != "id"}
+            for row in partition
+            if row["id"] in taken
+        ]
+        if keep_id:
+            await target.execute(insert(items), keep_id)
+        if new_id:
+            await target.execute(insert(items), new_id)
+
+        result.items_moved += len(partition)
+        result.ids_reassigned += len(new_id)
+
+
+async def rebalance_items(
+    source_urls: Sequence[str],
+    target_urls: Sequence[str],
+    batch_size: int = 1000,
+    dry_run: bool = False,
+    log: Callable[[str], None] = print,
+) -> RebalanceResult:
+    """
+    아이템을 target_urls 샤드 배치로 이동
+
+    Args:
+        source_urls: 현재 아이템이 있는 DB URL 목록 (단일 DB 또는 기존 샤드)
+        target_urls: 새 샤드 URL 목록 (순서가 샤드 번호)
+        batch_size: 한 번에 복사할 행 수
+        dry_run: True이면 옮길 소유자/아이템 수만 계산
+        log: 진행 상황 출력 함수
+    """
+    items = cast(Table, Item.__table__)
+    engines: dict[str, AsyncEngine] = {}
+
+    def engine_for(url: str) -> AsyncEngine:
+        if url not in engines:
+            engines[url] = create_async_engine(url)
+        return engines[url]
+
+    result = RebalanceResult()
+    try:
+        if not dry_run:
+            for url in target_urls:
+                async with engine_for(url).begin() as conn:
+                    await conn.run_sync(Base.metadata.create_all, tables=[items])
+
+        for source_url in source_urls:
+            source_engine = engine_for(source_url)
+            async with source_engine.connect() as conn:
+                owner_ids = (
+                    await conn.execute(select(items.c.owner_id).distinct())
+                ).scalars().all()
+
+            for owner_id in owner_ids:
+                target_url = target_urls[owner_shard_index(owner_id, len(target_urls))]
+                if target_url == source_url:
+                    continue
+
+                if dry_run:
+                    async with source_engine.connect() as conn:
+                        count = await conn.scalar(
+                            select(func.count())
+                            .select_from(items)
+                            .where(items.c.owner_id == owner_id)
+                        )
+                    result.owners_moved += 1
+                    result.items_moved += count or 0
+                    continue
+
+                async with source_engine.connect() as source, engine_for(
+                    target_url
+                ).begin() as target:
+                    already_copied = await target.scalar(
+                        select(exists().where(items.c.owner_id == owner_id))
+                    )
+                    if not already_copied:
+                        await _copy_owner_items(
+                            source, target, items, owner_id, batch_size, result
+                        )
+
+                async with source_engine.begin() as source:
+                    await source.execute(delete(items).where(items.c.owner_id == owner_id))
+
+                result.owners_moved += 1
+                log(f"owner {owner_id}: {source_url} -> {target_url}")
+    finally:
+        for engine in engines.values():
+            await engine.dispose()
+
+    log(
+        f"{'(dry run) ' if dry_run else ''}"
+        f"소유자 {result.owners_moved}명, 아이템 {result.items_moved}개 이동"
+        f" (새 ID 발급 {result.ids_reassigned}개)"
+    )
+    return result
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """명령행 진입점"""
+    parser = argparse.ArgumentParser(description="아이템 샤드 리밸런싱")
+    parser.add_argument(
+        "--from",
+        dest="source_urls",
+        action="append",
+        help="현재 아이템 DB URL (여러 번 지정, 기본값: ITEM_SHARD_URLS 또는 DATABASE_URL)",
+    )
+    parser.add_argument(
+        "--to",
+        dest="target_urls",
+        action="append",
+        required=True,
+        help="새 샤드 DB URL (샤드 순서대로 여러 번 지정)",
+    )
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args(argv)
+
+    source_urls = args.source_urls or settings.item_shard_urls or [settings.database_url]
+    asyncio.run(
+        rebalance_items(
+            source_urls,
+            args.target_urls,
+            batch_size=args.batch_size,
+            dry_run=args.dry_run,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,27 +4,103 @@ User Service
 사용자 관련 비즈니스 로직
 """
 
-from typing import Optional
+from typing import Any, Optional
 
-from sqlalchemy import select
+from sqlalchemy import delete, exists, inspect, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.dml import ReturningInsert
 
+from app.config import settings
+from app.core.cache import cached, invalidate
+from app.core.principals import Principal, get_principal_table, principal_flags
 from app.core.security import get_password_hash
+from app.core.sqlite_writer import attach, run_write
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 
 
+def _insert_ignoring_conflicts(
+    dialect: str, values: dict[str, Any]
+) -> Optional[ReturningInsert[User]]:
+    """
+    INSERT ... ON CONFLICT DO NOTHING RETURNING 문 (지원하지 않는 DB면 None)
+
+    on_conflict_do_nothing은 방언별 insert에만 있으므로 방언 이름으로 고릅니다.
+    """
+    if dialect == "sqlite":
+        return sqlite.insert(User).values(**values).on_conflict_do_nothing().returning(User)
+    if dialect == "postgresql":
+        return postgresql.insert(User).values(**values).on_conflict_do_nothing().returning(User)
+    return None
+
+
 class UserService:
     """사용자 서비스"""
 
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @cached(
+        "user:{user_id}",
+        tags=("user:{user_id}",),
+        negative_ttl=settings.cache_negative_ttl,
+    )
     async def get_by_id(self, user_id: int) -> Optional[User]:
-        """ID로 사용자 조회"""
+        """ID로 사용자 조회 (없는 사용자도 잠시 캐시)"""
+        result = await self.db.execute(select(User).where(User.id == user_id))
+        return result.scalar_one_or_none()
+
+    async def get_principal(
+        self, user_id: int, principal: Optional[Principal] = None
+    ) -> Optional[User]:
+        """
+        인증용 사용자 조회 (get_current_user에서 사용)
+
+        공유 principal 테이블을 사용하면 워커별 캐시 키에 레코드의 epoch를 넣어
+        다른 워커에서 변경된 사용자도 곧바로 새로 조회합니다.
+        테이블에 레코드가 없으면 DB에서 불러온 뒤 레코드를 저장합니다.
+        (테이블은 활성 여부/epoch만 공유하고 User 객체는 워커별 캐시에서 가져옴)
+
+        Args:
+            user_id: 사용자 ID
+            principal: 이미 조회한 테이블 레코드 (없으면 직접 조회)
+        """
+        table = get_principal_table()
+        if table is None:
+            return await self.get_by_id(user_id)
+
+        if principal is None:
+            principal = table.get(user_id)
+        if principal is not None:
+            return await self._get_at_epoch(user_id, principal.epoch)
+
+        # 불러오기 전의 epoch로 저장해야 동시에 커밋된 변경을 덮어쓰지 않음
+        epoch = table.epoch(user_id)
+        user = await self._get_at_epoch(user_id, epoch)
+        if user is not None:
+            table.put(user_id, principal_flags(user), epoch)
+        return user
+
+    @cached("user:{user_id}:epoch:{epoch}", tags=("user:{user_id}",))
+    async def _get_at_epoch(self, user_id: int, epoch: int) -> Optional[User]:
+        """principal epoch 기준 사용자 조회 (epoch는 캐시 키에만 사용)"""
         result = await self.db.execute(select(User).where(User.id == user_id))
         return result.scalar_one_or_none()
 
+    async def get_hashed_password(self, user_id: int) -> Optional[str]:
+        """
+        저장된 비밀번호 해시 조회
+
+        해시는 캐시에 저장하지 않으므로 캐시에서 복원한 사용자 객체 대신
+        DB에서 직접 읽습니다.
+        """
+        result = await self.db.execute(
+            select(User.hashed_password).where(User.id == user_id)
+        )
+        return result.scalar_one_or_none()
+
     async def get_by_email(self, email: str) -> Optional[User]:
         """이메일로 사용자 조회"""
         result = await self.db.execute(select(User).where(User.email == email))
@@ -51,17 +127,66 @@ class UserService:
         result = await self.db.execute(query)
         return list(result.scalars().all())
 
+    @staticmethod
+    def _create_values(user_in: UserCreate) -> dict[str, Any]:
+        """사용자 생성용 컬럼 값 (비밀번호 해싱 포함)"""
+        return {
+            "email": user_in.email,
+            "username": user_in.username,
+            "full_name": user_in.full_name,
+            "hashed_password": get_password_hash(user_in.password),
+        }
+
     async def create(self, user_in: UserCreate) -> User:
         """사용자 생성"""
-        user = User(
-            email=user_in.email,
-            username=user_in.username,
-            full_name=user_in.full_name,
-            hashed_password=get_password_hash(user_in.password),
-        )
-        self.db.add(user)
-        await self.db.flush()
-        await self.db.refresh(user)
+        values = self._create_values(user_in)
+
+        async def write(db: AsyncSession) -> User:
+            user = User(**values)
+            db.add(user)
+            await db.flush()
+            await db.refresh(user)
+            return user
+
+        user = await run_write(self.db, write)
+        # 새 ID에 남아 있을 수 있는 "없음" 캐시 삭제
+        invalidate(self.db, f"user:{user.id}")
+        return user
+
+    async def create_if_unique(self, user_in: UserCreate) -> Optional[User]:
+        """
+        사용자 생성 (유일성 충돌 시 None)
+
+        중복 확인 조회 없이 바로 INSERT를 시도합니다.
+        SQLite/PostgreSQL에서는 INSERT ... ON CONFLICT DO NOTHING RETURNING
+        한 문장으로 처리하여 한 번의 왕복으로 끝나고, 동시 가입 경쟁 상황에서도
+        IntegrityError가 발생하지 않습니다.
+        그 외 DB에서는 SAVEPOINT 안에서 INSERT 후 IntegrityError를 충돌로 처리합니다.
+
+        Returns:
+            생성된 User 객체, 이메일/사용자명이 이미 존재하면 None
+        """
+        values = self._create_values(user_in)
+
+        async def write(db: AsyncSession) -> Optional[User]:
+            stmt = _insert_ignoring_conflicts(db.get_bind(inspect(User)).dialect.name, values)
+            if stmt is not None:
+                result = await db.execute(stmt)
+                return result.scalar_one_or_none()
+
+            user = User(**values)
+            try:
+                async with db.begin_nested():
+                    db.add(user)
+                    await db.flush()
+            except IntegrityError:
+                return None
+            await db.refresh(user)
+            return user
+
+        user = await run_write(self.db, write)
+        if user is not None:
+            invalidate(self.db, f"user:{user.id}")
         return user
 
     async def update(self, user: User, user_in: UserUpdate) -> User:
@@ -74,53 +199,121 @@ class UserService:
                 update_data.pop("password")
             )
 
-        for field, value in update_data.items():
-            setattr(user, field, value)
-
-        await self.db.flush()
-        await self.db.refresh(user)
-        return user
+        return await self._set_fields(user, update_data)
 
     async def delete(self, user: User) -> None:
-        """사용자 삭제"""
-        await self.db.delete(user)
-        await self.db.flush()
+        """
+        사용자 삭제
+
+        아이템은 외래 키의 ON DELETE CASCADE(DB)가 함께 삭제하므로
+        소유자 아이템 캐시도 무효화합니다.
+        """
+
+        async def write(db: AsyncSession) -> None:
+            await db.delete(await attach(db, user))
+            await db.flush()
+
+        invalidate(self.db, f"user:{user.id}", f"items:owner:{user.id}")
+        await run_write(self.db, write)
+        if user in self.db:
+            self.db.expunge(user)
+
+    async def delete_by_id(self, user_id: int) -> None:
+        """
+        ID로 사용자 삭제 (객체를 불러오지 않음, 배치 삭제 작업의 마지막 단계)
+
+        아이템 캐시 무효화는 delete()와 같습니다.
+        """
+        stmt = delete(User).where(User.id == user_id)
+
+        async def write(db: AsyncSession) -> None:
+            await db.execute(stmt)
+
+        invalidate(self.db, f"user:{user_id}", f"items:owner:{user_id}")
+        await run_write(self.db, write)
 
     async def activate(self, user: User) -> User:
         """사용자 활성화"""
-        user.is_active = True
-        await self.db.flush()
-        await self.db.refresh(user)
-        return user
+        return await self._set_fields(user, {"is_active": True})
 
     async def deactivate(self, user: User) -> User:
         """사용자 비활성화"""
-        user.is_active = False
-        await self.db.flush()
-        await self.db.refresh(user)
-        return user
+        return await self._set_fields(user, {"is_active": False})
 
     async def verify(self, user: User) -> User:
         """사용자 인증 완료"""
-        user.is_verified = True
-        await self.db.flush()
-        await self.db.refresh(user)
-        return user
+        return await self._set_fields(user, {"is_verified": True})
+
+    async def set_password(self, user: User, password: str) -> User:
+        """비밀번호 변경 (해싱 후 저장)"""
+        return await self._set_fields(
+            user, {"hashed_password": get_password_hash(password)}
+        )
+
+    async def _set_fields(self, user: User, values: dict[str, Any]) -> User:
+        """사용자 컬럼 값 변경 후 저장"""
+
+        async def write(db: AsyncSession) -> User:
+            target = await attach(db, user)
+            for field, value in values.items():
+                setattr(target, field, value)
+            await db.flush()
+            await db.refresh(target)
+            return target
+
+        invalidate(self.db, f"user:{user.id}")
+        return await run_write(self.db, write)
 
     async def is_email_taken(self, email: str, exclude_user_id: Optional[int] = None) -> bool:
         """이메일 중복 확인"""
-        query = select(User).where(User.email == email)
-        if exclude_user_id:
-            query = query.where(User.id != exclude_user_id)
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none() is not None
+        taken = await self.get_taken_fields(email=email, exclude_user_id=exclude_user_id)
+        return "email" in taken
 
     async def is_username_taken(
         self, username: str, exclude_user_id: Optional[int] = None
     ) -> bool:
         """사용자명 중복 확인"""
-        query = select(User).where(User.username == username)
-        if exclude_user_id:
-            query = query.where(User.id != exclude_user_id)
-        result = await self.db.execute(query)
-        return result.scalar_one_or_none() is not None
+        taken = await self.get_taken_fields(username=username, exclude_user_id=exclude_user_id)
+        return "username" in taken
+
+    async def get_taken_fields(
+        self,
+        email: Optional[str] = None,
+        username: Optional[str] = None,
+        exclude_user_id: Optional[int] = None,
+    ) -> set[str]:
+        """
+        이미 사용중인 필드 조회
+
+        이메일/사용자명 중복 여부를 EXISTS 서브쿼리로 묶어 한 번의 쿼리로 확인합니다.
+        (사용자 행을 불러오지 않음)
+
+        Args:
+            email: 확인할 이메일 (None이면 확인하지 않음)
+            username: 확인할 사용자명 (None이면 확인하지 않음)
+            exclude_user_id: 제외할 사용자 ID (자기 자신 수정 시)
+
+        Returns:
+            사용중인 필드 이름 집합 ("email", "username")
+        """
+        checks = {
+            field: column == value
+            for field, column, value in (
+                ("email", User.email, email),
+                ("username", User.username, username),
+            )
+            if value
+        }
+        if not checks:
+            return set()
+
+        columns = []
+        for field, condition in checks.items():
+            subquery = exists().where(condition)
+            if exclude_user_id:
+                subquery = subquery.where(User.id != exclude_user_id)
+            columns.append(subquery.label(field))
+
+        result = await self.db.execute(select(*columns))
+        row = result.one()
+        return {field for field in checks if row._mapping[field]}
@@ -0,0 +1,79 @@
+"""
+User Deletion Service
+
+아이템이 많은 사용자를 백그라운드에서 배치 단위로 삭제하는 작업
+
+흐름:
+    1. 요청 처리 중 사용자를 비활성화 (즉시 로그인/접근 차단)
+    2. 백그라운드 작업에서 아이템을 user_delete_batch_size개씩 삭제, 배치마다 커밋
+    3. 아이템이 모두 지워지면 사용자 행 삭제
+
+배치마다 짧은 트랜잭션으로 처리하므로 워커 메모리 사용량이 일정하고
+다른 요청의 쓰기를 오래 막지 않습니다.
+"""
+
+import asyncio
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.config import settings
+from app.core.jobs import Job, job_registry
+from app.services.item import ItemService
+from app.services.user import UserService
+
+# 작업 종류 식별자
+USER_DELETION_JOB_KIND = "user_deletion"
+
+
+async def run_user_deletion(
+    job: Job,
+    user_id: int,
+    session_factory: async_sessionmaker[AsyncSession],
+    batch_size: Optional[int] = None,
+) -> None:
+    """사용자 아이템을 배치 단위로 삭제한 뒤 사용자 삭제"""
+    batch_size = batch_size or settings.user_delete_batch_size
+
+    async with session_factory() as session:
+        item_service = ItemService(session)
+
+        while True:
+            deleted = await item_service.delete_by_owner_batch(user_id, batch_size)
+            await session.commit()
+            if not deleted:
+                break
+            job.processed += deleted
+            job.succeeded += deleted
+            # 다른 요청이 이벤트 루프를 사용할 수 있도록 양보
+            await asyncio.sleep(0)
+
+        # 다른 쓰기와 마찬가지로 SQLite 작성자를 통해 삭제 (run_write)
+        await UserService(session).delete_by_id(user_id)
+        await session.commit()
+
+    job.message = f"사용자와 아이템 {job.succeeded}개가 삭제되었습니다."
+
+
+def start_user_deletion(
+    user_id: int,
+    item_count: int,
+    requested_by: int,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> Job:
+    """
+    사용자 배치 삭제 작업 시작
+
+    Args:
+        user_id: 삭제할 사용자 ID
+        item_count: 삭제할 아이템 수 (진행률 계산용)
+        requested_by: 작업을 요청한 관리자 ID (작업 조회 권한)
+        session_factory: 작업에서 사용할 세션 팩토리
+    """
+    job = job_registry.create(USER_DELETION_JOB_KIND, requested_by)
+    job.total = item_count
+    job_registry.run(
+        job,
+        lambda job: run_user_deletion(job, user_id, session_factory),
+    )
+    return job
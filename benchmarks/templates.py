@@ -0,0 +1,84 @@
+"""
+템플릿 렌더링 벤치마크
+
+대시보드 페이지 템플릿의 첫 렌더링 지연과 반복 렌더링 시간을 비교합니다.
+
+    - development: auto_reload 켬, 바이트코드 캐시 없음 (DEBUG=true 기본값)
+    - production (cold): auto_reload 끔, 비어 있는 바이트코드 캐시
+    - production (warm): auto_reload 끔, 미리 채운 바이트코드 캐시
+      (다른 워커가 이미 컴파일했거나 python -m app.core.precompile 실행 후)
+
+실행:
+    python -m benchmarks.templates --renders 2000
+"""
+
+import argparse
+import tempfile
+import time
+from datetime import datetime
+from types import SimpleNamespace
+
+from app.core.templates import create_template_environment, precompile_templates
+
+TEMPLATE = "pages/dashboard.html"
+
+
+def _context() -> dict:
+    """대시보드 렌더링용 컨텍스트 (DB 없이 만든 객체)"""
+    user = SimpleNamespace(
+        username="bench", full_name="Bench User", is_active=True, is_superuser=False
+    )
+    items = [
+        SimpleNamespace(id=n, title=f"Item {n}", is_active=n % 2 == 0, created_at=datetime.now())
+        for n in range(5)
+    ]
+    return {
+        "title": "대시보드",
+        "current_user": user,
+        "recent_items": items,
+        "stats": {"total_items": 42, "active_items": 21},
+    }
+
+
+def _first_render_ms(production: bool, cache_dir: str) -> float:
+    """새 환경(= 새 워커)에서 첫 렌더링까지 걸린 시간"""
+    env = create_template_environment(production=production, bytecode_cache_dir=cache_dir)
+    started = time.perf_counter()
+    env.get_template(TEMPLATE).render(**_context())
+    return (time.perf_counter() - started) * 1000
+
+
+def _steady_render_us(production: bool, cache_dir: str, renders: int) -> float:
+    """컴파일 후 반복 렌더링 1회 평균 시간"""
+    env = create_template_environment(production=production, bytecode_cache_dir=cache_dir)
+    context = _context()
+    env.get_template(TEMPLATE).render(**context)
+    started = time.perf_counter()
+    for _ in range(renders):
+        # 라우트처럼 매번 get_template으로 가져옴 (auto_reload면 파일 수정 시각 확인)
+        env.get_template(TEMPLATE).render(**context)
+    return (time.perf_counter() - started) / renders * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="템플릿 렌더링 벤치마크")
+    parser.add_argument("--renders", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cold_dir, tempfile.TemporaryDirectory() as warm_dir:
+        precompile_templates(create_template_environment(production=True, bytecode_cache_dir=warm_dir))
+
+        rows = [
+            ("development", False, cold_dir),
+            ("production (cold)", True, cold_dir),
+            ("production (warm)", True, warm_dir),
+        ]
+        print(f"{'mode':<20} {'first render (ms)':>18} {'steady render (µs)':>20}")
+        for label, production, cache_dir in rows:
+            first = _first_render_ms(production, cache_dir)
+            steady = _steady_render_us(production, cache_dir, args.renders)
+            print(f"{label:<20} {first:>18.2f} {steady:>20.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,7 +13,9 @@ from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 
 from app.config import settings
-from app.database import Base, get_db
+from app.core.cache import MemoryCache, set_cache, set_refresh_session_factory
+from app.core.fragment_cache import card_cache
+from app.database import Base, enable_sqlite_foreign_keys, get_db, get_session_factory
 from app.main import app
 from app.models.user import User
 from app.core.security import get_password_hash
@@ -27,6 +29,7 @@ test_engine = create_async_engine(
     TEST_DATABASE_URL,
     echo=False,
 )
+enable_sqlite_foreign_keys(test_engine)
 
 # 테스트용 세션 팩토리
 TestSessionLocal = async_sessionmaker(
@@ -44,6 +47,18 @@ def event_loop() -> Generator:
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def fresh_cache() -> Generator:
+    """테스트마다 빈 메모리 캐시 사용 (테스트 간 캐시 공유 방지)"""
+    cache = MemoryCache()
+    set_cache(cache)
+    # 렌더링한 아이템 카드도 비움 (테스트마다 같은 ID가 다시 생성됨)
+    card_cache.clear_nowait()
+    # stale 값 백그라운드 갱신도 테스트 DB 사용
+    set_refresh_session_factory(TestSessionLocal)
+    yield cache
+
+
 @pytest_asyncio.fixture(scope="function")
 async def db_session() -> AsyncGenerator[AsyncSession, None]:
     """테스트용 데이터베이스 세션"""
@@ -67,6 +82,8 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    # 백그라운드 작업도 테스트 DB를 사용하도록 세션 팩토리 교체
+    app.dependency_overrides[get_session_factory] = lambda: TestSessionLocal
 
     async with AsyncClient(
         transport=ASGITransport(app=app),
@@ -84,6 +84,10 @@ async def test_get_current_user(auth_client: AsyncClient, test_user):
     assert data["email"] == test_user.email
     assert data["username"] == test_user.username
 
+    etag = response.headers["etag"]
+    response = await auth_client.get("/api/v1/auth/me", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
 
 @pytest.mark.asyncio
 async def test_logout(auth_client: AsyncClient):
@@ -93,3 +97,18 @@ async def test_logout(auth_client: AsyncClient):
 
     # 쿠키가 삭제되었는지 확인
     assert response.cookies.get("access_token") is None or response.cookies.get("access_token") == ""
+
+
+@pytest.mark.asyncio
+async def test_register_duplicate_username(client: AsyncClient, test_user):
+    """중복 사용자명 회원가입 테스트"""
+    response = await client.post(
+        "/api/v1/auth/register",
+        json={
+            "email": "another@example.com",
+            "username": "testuser",  # 이미 존재하는 사용자명
+            "password": "password123",
+        },
+    )
+    assert response.status_code == 409
+    assert response.json()["message"] == "이미 사용중인 사용자명입니다."
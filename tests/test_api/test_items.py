@@ -4,14 +4,20 @@ Items API Tests
 아이템 CRUD API 테스트
 """
 
+import json
+
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import set_cache
+from app.core.jobs import job_registry
 from app.models.item import Item
 
 
-@pytest.fixture
+@pytest_asyncio.fixture
 async def test_item(db_session: AsyncSession, test_user) -> Item:
     """테스트용 아이템 생성"""
     item = Item(
@@ -65,6 +71,87 @@ async def test_get_item(auth_client: AsyncClient, test_item):
     assert data["id"] == test_item.id
 
 
+@pytest.mark.asyncio
+async def test_missing_item_is_negatively_cached(auth_client: AsyncClient, fresh_cache):
+    """없는 아이템 조회는 잠시 캐시되고, 생성 시 삭제"""
+    for _ in range(2):
+        response = await auth_client.get("/api/v1/items/1")
+        assert response.status_code == 404
+    assert fresh_cache.metrics.negative_hits == 1
+
+    response = await auth_client.post("/api/v1/items", json={"title": "Created"})
+    assert response.status_code == 201
+    assert response.json()["id"] == 1
+
+    response = await auth_client.get("/api/v1/items/1")
+    assert response.status_code == 200
+    assert response.json()["title"] == "Created"
+
+
+@pytest.mark.asyncio
+async def test_item_etag_returns_not_modified(
+    auth_client: AsyncClient, db_session: AsyncSession, test_item, fresh_cache
+):
+    """DB 버전으로 만든 ETag가 같으면 304, 변경/삭제 후에는 다시 200"""
+    url = f"/api/v1/items/{test_item.id}"
+    response = await auth_client.get(url)
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+
+    response = await auth_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    list_etag = (await auth_client.get("/api/v1/items")).headers["etag"]
+    response = await auth_client.get("/api/v1/items", headers={"If-None-Match": list_etag})
+    assert response.status_code == 304
+    # 쿼리(필터, 페이지)가 다르면 다른 ETag
+    response = await auth_client.get(
+        "/api/v1/items?limit=5", headers={"If-None-Match": list_etag}
+    )
+    assert response.status_code == 200
+
+    # 같은 초 안의 변경도 캐시 세대 번호로 구분
+    await auth_client.patch(url, json={"title": "Changed"})
+    await db_session.commit()
+    response = await auth_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["title"] == "Changed"
+
+    await auth_client.delete(url)
+    await db_session.commit()
+    response = await auth_client.get("/api/v1/items", headers={"If-None-Match": list_etag})
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+@pytest.mark.asyncio
+async def test_item_etag_without_cache_uses_body(
+    auth_client: AsyncClient, db_session: AsyncSession, test_item
+):
+    """캐시가 없으면 본문으로 ETag를 만들어 같은 초 안의 변경도 구분"""
+    set_cache(None)
+    url = f"/api/v1/items/{test_item.id}"
+    etag = (await auth_client.get(url)).headers["etag"]
+    list_etag = (await auth_client.get("/api/v1/items")).headers["etag"]
+    response = await auth_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    # 초 단위 DB처럼 수정 시각이 그대로인 변경
+    updated_at = test_item.updated_at
+    await auth_client.patch(url, json={"title": "Changed"})
+    await db_session.execute(
+        update(Item).where(Item.id == test_item.id).values(updated_at=updated_at)
+    )
+    await db_session.commit()
+    response = await auth_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["title"] == "Changed"
+    response = await auth_client.get("/api/v1/items", headers={"If-None-Match": list_etag})
+    assert response.status_code == 200
+
+
 @pytest.mark.asyncio
 async def test_update_item(auth_client: AsyncClient, test_item):
     """아이템 수정 테스트"""
@@ -104,3 +191,104 @@ async def test_unauthorized_access(client: AsyncClient):
     """인증되지 않은 접근 테스트"""
     response = await client.get("/api/v1/items")
     assert response.status_code == 401
+
+
+@pytest.mark.asyncio
+async def test_export_items_csv(auth_client: AsyncClient, test_item):
+    """아이템 CSV 내보내기 테스트"""
+    response = await auth_client.get("/api/v1/items/export?format=csv")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert "attachment" in response.headers["content-disposition"]
+
+    lines = response.text.strip().splitlines()
+    assert lines[0].startswith("id,title,description")
+    assert len(lines) == 2
+    assert "Test Item" in lines[1]
+
+
+@pytest.mark.asyncio
+async def test_export_items_ndjson(auth_client: AsyncClient, test_item):
+    """아이템 NDJSON 내보내기 테스트"""
+    response = await auth_client.get("/api/v1/items/export?format=ndjson")
+    assert response.status_code == 200
+
+    rows = [json.loads(line) for line in response.text.splitlines() if line]
+    assert len(rows) == 1
+    assert rows[0]["id"] == test_item.id
+    assert rows[0]["title"] == test_item.title
+
+
+@pytest.mark.asyncio
+async def test_export_items_json_gzip(auth_client: AsyncClient, test_item):
+    """아이템 JSON 배열 gzip 내보내기 테스트"""
+    response = await auth_client.get("/api/v1/items/export?format=json&compress=true")
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+
+    # httpx가 Content-Encoding에 따라 자동으로 압축을 해제함
+    data = response.json()
+    assert isinstance(data, list)
+    assert data[0]["id"] == test_item.id
+
+
+@pytest.mark.asyncio
+async def test_import_items_csv(auth_client: AsyncClient):
+    """아이템 CSV 가져오기 테스트 (잘못된 행은 오류 리포트로 수집)"""
+    content = (
+        "title,description,priority\n"
+        "First,desc 1,1\n"
+        ",missing title,2\n"
+        "Second,,11\n"
+        "Third,desc 3,\n"
+    )
+    response = await auth_client.post(
+        "/api/v1/items/import",
+        files={"file": ("items.csv", content.encode("utf-8"), "text/csv")},
+    )
+    assert response.status_code == 202
+    job_id = response.json()["id"]
+
+    await job_registry.wait(job_id)
+
+    response = await auth_client.get(f"/api/v1/items/import/{job_id}")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "completed"
+    assert data["succeeded"] == 2
+    assert data["failed"] == 2
+
+    response = await auth_client.get("/api/v1/items")
+    assert {item["title"] for item in response.json()} == {"First", "Third"}
+
+    response = await auth_client.get(f"/api/v1/items/import/{job_id}/errors")
+    assert response.status_code == 200
+    lines = response.text.strip().splitlines()
+    assert lines[0] == "line,error,raw"
+    assert len(lines) == 3
+
+
+@pytest.mark.asyncio
+async def test_import_items_ndjson(auth_client: AsyncClient):
+    """아이템 NDJSON 가져오기 테스트"""
+    content = '{"title": "A", "priority": 3}\n\nnot json\n{"title": "B"}\n'
+    response = await auth_client.post(
+        "/api/v1/items/import",
+        files={"file": ("items.ndjson", content.encode("utf-8"))},
+    )
+    assert response.status_code == 202
+
+    job = await job_registry.wait(response.json()["id"])
+    assert job.succeeded == 2
+    assert job.failed == 1
+    assert job.errors[0]["line"] == 3
+
+
+@pytest.mark.asyncio
+async def test_import_items_unsupported_format(auth_client: AsyncClient):
+    """지원하지 않는 파일 형식 가져오기 테스트"""
+    response = await auth_client.post(
+        "/api/v1/items/import",
+        files={"file": ("items.xlsx", b"data")},
+    )
+    assert response.status_code == 422
@@ -0,0 +1,135 @@
+"""
+Users API Tests
+
+사용자 관리 API 테스트
+"""
+
+import pytest
+import pytest_asyncio
+from httpx import AsyncClient
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.jobs import job_registry
+from app.core.security import get_password_hash
+from app.models.item import Item
+from app.models.user import User
+from app.services.item import ItemService
+from tests.conftest import TestSessionLocal
+
+
+@pytest_asyncio.fixture
+async def admin_client(client: AsyncClient, db_session: AsyncSession) -> AsyncClient:
+    """관리자로 로그인한 테스트 클라이언트"""
+    admin = User(
+        email="admin@example.com",
+        username="admin",
+        hashed_password=get_password_hash("adminpassword"),
+        is_active=True,
+        is_superuser=True,
+    )
+    db_session.add(admin)
+    await db_session.commit()
+
+    response = await client.post(
+        "/api/v1/auth/login",
+        json={"email": "admin@example.com", "password": "adminpassword"},
+    )
+    assert response.status_code == 200
+    client.cookies = response.cookies
+    return client
+
+
+async def _add_items(db_session: AsyncSession, owner_id: int, count: int) -> None:
+    """테스트용 아이템 여러 개 생성"""
+    db_session.add_all(
+        [Item(title=f"Item {i}", owner_id=owner_id) for i in range(count)]
+    )
+    await db_session.commit()
+
+
+async def _count_items(db_session: AsyncSession, owner_id: int) -> int:
+    result = await db_session.execute(
+        select(func.count(Item.id)).where(Item.owner_id == owner_id)
+    )
+    return result.scalar()
+
+
+@pytest.mark.asyncio
+async def test_delete_user_cascades_items(
+    admin_client: AsyncClient, db_session: AsyncSession, test_user
+):
+    """사용자 삭제 시 아이템이 DB CASCADE로 삭제되는지 테스트"""
+    await _add_items(db_session, test_user.id, 3)
+
+    response = await admin_client.delete(f"/api/v1/users/{test_user.id}")
+    assert response.status_code == 200
+
+    db_session.expunge_all()
+    assert await _count_items(db_session, test_user.id) == 0
+    assert await db_session.get(User, test_user.id) is None
+
+
+@pytest.mark.asyncio
+async def test_delete_user_in_background_batches(
+    admin_client: AsyncClient, db_session: AsyncSession, test_user, monkeypatch
+):
+    """아이템이 많은 사용자는 백그라운드 배치로 삭제되는지 테스트"""
+    monkeypatch.setattr(settings, "user_delete_batch_threshold", 2)
+    monkeypatch.setattr(settings, "user_delete_batch_size", 2)
+    await _add_items(db_session, test_user.id, 5)
+
+    response = await admin_client.delete(f"/api/v1/users/{test_user.id}")
+    assert response.status_code == 202
+    job_id = response.json()["job_id"]
+
+    await job_registry.wait(job_id)
+
+    response = await admin_client.get(f"/api/v1/jobs/{job_id}")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "completed"
+    assert data["succeeded"] == 5
+
+    db_session.expunge_all()
+    assert await _count_items(db_session, test_user.id) == 0
+    assert await db_session.get(User, test_user.id) is None
+
+
+@pytest.mark.asyncio
+async def test_delete_user_ignores_stale_cached_count(
+    admin_client: AsyncClient, db_session: AsyncSession, test_user, monkeypatch
+):
+    """캐시된 아이템 개수가 오래되었어도 DB의 현재 개수로 배치 삭제를 결정"""
+    monkeypatch.setattr(settings, "user_delete_batch_threshold", 2)
+    async with TestSessionLocal() as session:
+        assert await ItemService(session).count(owner_id=test_user.id) == 0  # 0개로 캐시
+    await _add_items(db_session, test_user.id, 5)  # 무효화 없이 추가
+
+    response = await admin_client.delete(f"/api/v1/users/{test_user.id}")
+    assert response.status_code == 202
+    await job_registry.wait(response.json()["job_id"])
+
+
+@pytest.mark.asyncio
+async def test_update_me_duplicate_email(
+    auth_client: AsyncClient, db_session: AsyncSession
+):
+    """이미 사용중인 이메일로 내 정보 수정 테스트"""
+    db_session.add(
+        User(email="taken@example.com", username="other", hashed_password="x")
+    )
+    await db_session.commit()
+
+    response = await auth_client.patch(
+        "/api/v1/users/me", json={"email": "taken@example.com"}
+    )
+    assert response.status_code == 400
+
+    # 자기 자신의 값은 중복으로 취급하지 않음
+    response = await auth_client.patch(
+        "/api/v1/users/me",
+        json={"email": "test@example.com", "username": "testuser"},
+    )
+    assert response.status_code == 200
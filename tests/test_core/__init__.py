@@ -0,0 +1,3 @@
+"""
+Core Tests Module
+"""
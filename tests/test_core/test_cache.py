@@ -0,0 +1,330 @@
+"""
+Cache Tests
+
+캐시 백엔드 및 서비스 캐시 데코레이터 테스트
+"""
+
+import asyncio
+import json
+import os
+import pickle
+import time
+import zlib
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.cache import (
+    MISSING,
+    SNAPSHOT_MAGIC,
+    MemoryCache,
+    RedisCache,
+    TieredCache,
+    create_cache,
+    load_cache_snapshot,
+    save_cache_snapshot,
+    set_cache,
+)
+from app.models.item import Item
+from app.models.user import User
+from app.schemas.item import ItemCreate
+from app.services.item import ItemService
+from app.services.user import UserService
+from tests.conftest import TestSessionLocal, test_engine
+
+
+@pytest.mark.asyncio
+async def test_memory_cache_lru_ttl_and_tags():
+    """LRU 제거, 만료, 태그 무효화 및 통계"""
+    cache = MemoryCache(max_entries=2)
+
+    await cache.set("a", 1, tags=["t"])
+    await cache.set("b", 2)
+    assert await cache.get("a") == 1  # a를 최근 사용으로
+    await cache.set("c", 3, tags=["t"])  # 가장 오래된 b 제거
+
+    assert await cache.get("b") is MISSING
+    assert cache.metrics.evictions == 1
+
+    await cache.invalidate_tags("t")
+    assert await cache.get("a") is MISSING
+    assert await cache.get("c") is MISSING
+    assert cache.metrics.invalidations == 2
+
+    await cache.set("d", 4, ttl=0)
+    assert await cache.get("d") is MISSING
+    assert cache.metrics.expirations == 1
+    assert cache.metrics.hits == 1
+
+
+def test_auto_backend_skips_per_worker_memory_cache(monkeypatch):
+    """워커가 여러 개이고 Redis가 없으면 워커별 메모리 캐시를 만들지 않음"""
+    monkeypatch.setattr(settings, "cache_backend", "auto")
+    monkeypatch.setattr(settings, "redis_url", None)
+    monkeypatch.setattr(settings, "workers", 1)
+    assert isinstance(create_cache(), MemoryCache)
+
+    monkeypatch.setattr(settings, "workers", 4)
+    assert create_cache() is None
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_tags_and_errors():
+    """Redis 백엔드 태그 무효화, 연결 실패 시 미스 처리"""
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    cache = RedisCache(client=fakeredis.FakeAsyncRedis(server=server))
+
+    await cache.set("user:1", {"id": 1}, tags=["user:1"])
+    await cache.set("user:2", {"id": 2}, tags=["user:2"])
+    assert await cache.get("user:1") == {"id": 1}
+
+    await cache.invalidate_tags("user:1")
+    assert await cache.get("user:1") is MISSING
+    assert await cache.get("user:2") == {"id": 2}
+
+    server.connected = False
+    assert await cache.get("user:2") is MISSING
+    assert cache.metrics.errors == 1
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_write_failure_is_logged(fresh_cache: MemoryCache, tmp_path, caplog):
+    """스냅샷 파일을 쓸 수 없으면 0을 반환하고 임시 파일을 남기지 않음"""
+    await fresh_cache.set("key", 1)
+    directory = tmp_path / "snapshot"
+    directory.mkdir()
+    path = str(directory / "cache.bin")
+    os.mkdir(path)  # 디렉토리로 교체할 수 없음
+    os.utime(path, (0, 0))  # 이전 실행에서 남은 것처럼
+
+    assert save_cache_snapshot(path) == 0
+    assert "캐시 스냅샷 저장 실패" in caplog.text
+    assert not [name for name in os.listdir(directory) if name.endswith(".tmp")]
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_stores_json_without_password_hash(
+    test_user: User, fresh_cache: MemoryCache
+):
+    """Redis 값은 pickle이 아닌 JSON, 사용자 캐시에 비밀번호 해시 제외"""
+    fakeredis = pytest.importorskip("fakeredis")
+    client = fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer())
+    cache = RedisCache(client=client)
+    set_cache(cache)
+
+    async with TestSessionLocal() as session:
+        await UserService(session).get_by_id(test_user.id)
+    keys = await client.keys("cache:user:*")
+    assert len(keys) == 1
+    raw = await client.get(keys[0])
+    assert b"hashed_password" not in raw and b"testuser" in raw
+    json.loads(raw)
+
+    async with TestSessionLocal() as session:
+        user = await UserService(session).get_by_id(test_user.id)
+        assert user.username == "testuser"
+        assert await UserService(session).get_hashed_password(test_user.id)
+
+    value = (200, [(b"content-type", b"text/html")], datetime(2026, 1, 1, 9, 30))
+    await cache.set("page", value)
+    assert await cache.get("page") == value
+
+    await client.set("cache:bad", pickle.dumps({"id": 1}))
+    assert await cache.get("bad") is MISSING
+    assert cache.metrics.errors == 1
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_tiered_cache_broadcasts_invalidation():
+    """한 워커의 무효화가 다른 워커의 L1에 전파되고, 브로커 장애 시 TTL 전용 모드"""
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+
+    def worker() -> TieredCache:
+        client = fakeredis.FakeAsyncRedis(server=server)
+        return TieredCache(MemoryCache(), RedisCache(client=client), fallback_ttl=1)
+
+    a, b = worker(), worker()
+    await asyncio.gather(a.wait_subscribed(), b.wait_subscribed())
+
+    await a.set("item:1", "v1", tags=["item:1"])
+    assert await b.get("item:1") == "v1"  # L2 적중 → b의 L1에 저장
+    assert b.l1.get_nowait("item:1") == "v1"
+
+    await a.invalidate_tags("item:1")
+    for _ in range(50):
+        if b.l1.get_nowait("item:1") is MISSING:
+            break
+        await asyncio.sleep(0.01)
+    assert b.l1.get_nowait("item:1") is MISSING
+    assert await b.get("item:1") is MISSING
+
+    server.connected = False
+    await a.invalidate_tags("item:2")
+    assert a.degraded is True
+    await a.set("item:3", "v3", ttl=60)
+    expires_at = a.l1._entries["item:3"][0]
+    assert expires_at - time.monotonic() <= 1
+
+    server.connected = True
+    await a.close()
+    await b.close()
+
+
+@pytest.mark.asyncio
+async def test_service_read_is_cached_until_commit(
+    db_session: AsyncSession, test_user: User, fresh_cache: MemoryCache
+):
+    """조회 결과는 캐시되고, 변경이 커밋되면 무효화"""
+    statements = []
+
+    def count(*args, **kwargs):
+        statements.append(args[2])
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", count)
+    try:
+        async with TestSessionLocal() as session:
+            assert (await UserService(session).get_by_id(test_user.id)).username == "testuser"
+        queries = len(statements)
+
+        async with TestSessionLocal() as session:
+            user = await UserService(session).get_by_id(test_user.id)
+            assert user in session
+            assert user.email == "test@example.com"
+        assert len(statements) == queries
+        assert fresh_cache.metrics.hits == 1
+
+        async with TestSessionLocal() as session:
+            service = UserService(session)
+            user = await service.get_by_id(test_user.id)
+            await service.deactivate(user)
+            await session.commit()
+
+        async with TestSessionLocal() as session:
+            user = await UserService(session).get_by_id(test_user.id)
+            assert user.is_active is False
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", count)
+
+
+@pytest.mark.asyncio
+async def test_item_lists_use_owner_generation(
+    db_session: AsyncSession, test_user: User, fresh_cache: MemoryCache
+):
+    """목록/개수는 소유자 세대 키로 캐시되고, 변경 커밋 시 세대 번호만 증가"""
+    async with TestSessionLocal() as session:
+        service = ItemService(session)
+        assert await service.get_all(owner_id=test_user.id) == []
+        assert await service.count(owner_id=test_user.id) == 0
+        assert await service.count(owner_id=test_user.id) == 0
+    assert fresh_cache.metrics.hits == 1
+    generation = fresh_cache.get_generation_nowait(f"items:owner:{test_user.id}")
+    assert f"items:owner:{test_user.id}" not in fresh_cache._tags  # 목록 키는 태그 색인 없음
+
+    async with TestSessionLocal() as session:
+        await ItemService(session).create(ItemCreate(title="new"), test_user)
+        await session.commit()
+
+    assert fresh_cache.get_generation_nowait(f"items:owner:{test_user.id}") == generation + 1
+    async with TestSessionLocal() as session:
+        service = ItemService(session)
+        assert [item.title for item in await service.get_all(owner_id=test_user.id)] == ["new"]
+        assert await service.count(owner_id=test_user.id) == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_generation_survives_missing_key():
+    """Redis 세대 번호: 처음 조회 시 생성, 무효화 시 증가"""
+    fakeredis = pytest.importorskip("fakeredis")
+    cache = RedisCache(client=fakeredis.FakeAsyncRedis(server=fakeredis.FakeServer()))
+
+    generation = await cache.get_generation("items:owner:1")
+    assert await cache.get_generation("items:owner:1") == generation
+    await cache.invalidate_tags("items:owner:1")
+    assert await cache.get_generation("items:owner:1") == generation + 1
+
+    # 세대 번호가 없는 태그를 무효화해도 새 번호에서 시작
+    await cache.invalidate_tags("items:owner:2")
+    assert await cache.get_generation("items:owner:2") > generation
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_stale_while_revalidate_and_single_flight(
+    db_session: AsyncSession, test_user: User
+):
+    """만료된 통계는 이전 값을 반환하며 한 번만 갱신, 동시 미스는 한 번만 조회"""
+    cache = MemoryCache(default_ttl=0)  # 저장 즉시 stale
+    set_cache(cache)
+
+    async with TestSessionLocal() as session:
+        assert (await ItemService(session).get_stats(test_user.id))["total_items"] == 0
+
+    # 캐시 무효화 없이 DB 변경 (만료로만 반영되는 경우)
+    db_session.add(Item(title="direct", owner_id=test_user.id))
+    await db_session.commit()
+
+    async with TestSessionLocal() as session:
+        service = ItemService(session)
+        assert (await service.get_stats(test_user.id))["total_items"] == 0  # stale
+        assert (await service.get_stats(test_user.id))["total_items"] == 0  # 갱신 중
+    assert cache.metrics.stale_hits == 1
+    await cache.wait_pending()
+
+    async with TestSessionLocal() as session:
+        assert (await ItemService(session).get_stats(test_user.id))["total_items"] == 1
+    await cache.wait_pending()
+
+    statements = []
+
+    def count(*args, **kwargs):
+        statements.append(args[2])
+
+    async def read_count() -> int:
+        async with TestSessionLocal() as session:
+            return await ItemService(session).count(owner_id=test_user.id, is_active=False)
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", count)
+    try:
+        assert await asyncio.gather(*(read_count() for _ in range(5))) == [0] * 5
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", count)
+    assert len(statements) == 1
+    assert cache.metrics.coalesced == 4
+
+
+@pytest.mark.asyncio
+async def test_snapshot_restores_unexpired_entries(
+    db_session: AsyncSession, test_user: User, fresh_cache: MemoryCache, tmp_path
+):
+    """종료 시 저장한 스냅샷을 시작 시 불러오고, 만료된 항목은 제외"""
+    path = str(tmp_path / "cache.bin")
+    async with TestSessionLocal() as session:
+        await UserService(session).get_by_id(test_user.id)
+    await fresh_cache.set("short", 1, ttl=0)
+    await fresh_cache.set("long", 2, ttl=60, tags=["t"])
+
+    assert save_cache_snapshot(path) == 2  # "short"는 이미 만료
+    # 이 프로세스가 시작한 뒤 이미 저장된 스냅샷은 덮어쓰지 않음 (단일 작성자)
+    assert save_cache_snapshot(path) == 0
+    raw = await asyncio.to_thread(Path(path).read_bytes)
+    assert b"hashed_password" not in zlib.decompress(raw[len(SNAPSHOT_MAGIC) :])
+
+    restored = MemoryCache()
+    set_cache(restored)
+    assert load_cache_snapshot(path) == 2
+    assert await restored.get("long") == 2
+    await restored.invalidate_tags("t")
+    assert await restored.get("long") is MISSING
+
+    async with TestSessionLocal() as session:
+        user = await UserService(session).get_by_id(test_user.id)
+        assert user.username == "testuser"
+    assert restored.metrics.hits == 2
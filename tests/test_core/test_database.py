@@ -0,0 +1,105 @@
+"""
+Database Routing Tests
+
+읽기 레플리카 라우팅 세션 테스트
+(두 번째 SQLite 파일을 레플리카 대용으로 사용)
+"""
+
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.middleware import ReadYourWritesMiddleware
+from app.database import PRIMARY_PIN_COOKIE, Base, create_session_maker
+from app.models.user import User
+
+
+@pytest_asyncio.fixture
+async def engines(tmp_path):
+    """프라이머리/레플리카 엔진 (각각 다른 사용자 행을 가짐)"""
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    replica = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'replica.db'}")
+
+    for engine, name in ((primary, "primary"), (replica, "replica")):
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+            await conn.execute(
+                User.__table__.insert().values(
+                    email=f"{name}@example.com", username=name, hashed_password="x"
+                )
+            )
+
+    yield primary, replica
+
+    await primary.dispose()
+    await replica.dispose()
+
+
+async def _usernames(session) -> set[str]:
+    result = await session.execute(select(User.username))
+    return set(result.scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_read_only_session_uses_replica(engines):
+    """읽기 전용 세션의 조회는 레플리카로 라우팅"""
+    session_maker = create_session_maker(*engines)
+
+    async with session_maker() as session:
+        session.info["use_replica"] = True
+        assert await _usernames(session) == {"replica"}
+
+    async with session_maker() as session:
+        assert await _usernames(session) == {"primary"}
+
+
+@pytest.mark.asyncio
+async def test_reads_after_write_stay_on_primary(engines):
+    """쓰기 이후의 조회는 같은 세션에서 프라이머리로 고정"""
+    session_maker = create_session_maker(*engines)
+
+    async with session_maker() as session:
+        session.info["use_replica"] = True
+        session.add(User(email="new@example.com", username="new", hashed_password="x"))
+        await session.flush()
+
+        assert session.info["wrote"] is True
+        assert await _usernames(session) == {"primary", "new"}
+
+
+@pytest.mark.asyncio
+async def test_without_replica_uses_primary(engines):
+    """레플리카가 없으면 항상 프라이머리 사용"""
+    session_maker = create_session_maker(engines[0])
+
+    async with session_maker() as session:
+        session.info["use_replica"] = True
+        assert await _usernames(session) == {"primary"}
+
+
+@pytest.mark.asyncio
+async def test_read_your_writes_cookie(engines):
+    """쓰기가 발생한 요청에만 프라이머리 고정 쿠키 설정"""
+    session_maker = create_session_maker(*engines)
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, pin_seconds=3)
+
+    @app.api_route("/items", methods=["GET", "POST"])
+    async def items(request: Request):
+        async with session_maker() as session:
+            request.state.db_session = session
+            if request.method == "POST":
+                session.add(User(email="w@example.com", username="w", hashed_password="x"))
+                await session.flush()
+            return {"ok": True}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.get("/items")
+        assert PRIMARY_PIN_COOKIE not in response.cookies
+
+        response = await ac.post("/items")
+        assert response.cookies[PRIMARY_PIN_COOKIE] == "1"
+        assert "Max-Age=3" in response.headers["set-cookie"]
@@ -0,0 +1,166 @@
+"""
+Middleware Tests
+
+동일 요청 합치기, 익명 페이지 캐시 미들웨어 테스트
+"""
+
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import HTMLResponse, PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+from starlette.types import Receive, Scope, Send
+
+from app.core.middleware import (
+    AnonymousPageCacheMiddleware,
+    RequestCoalescingMiddleware,
+    prewarm_pages,
+)
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_gets_share_one_response():
+    """같은 사용자/URL의 동시 GET은 한 번만 처리, 사용자나 쿼리가 다르면 따로 처리"""
+    calls = []
+
+    async def items(request: Request) -> PlainTextResponse:
+        calls.append(request.url.query)
+        await asyncio.sleep(0.05)
+        return PlainTextResponse(f"items {len(calls)}")
+
+    app = RequestCoalescingMiddleware(
+        Starlette(routes=[Route("/items", items), Route("/other", items)]),
+        paths=["/items"],
+    )
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+
+        async def get(url: str, token: str = "a") -> str:
+            response = await client.get(url, headers={"Cookie": f"access_token={token}"})
+            assert response.status_code == 200
+            return response.text
+
+        bodies = await asyncio.gather(*(get("/items?search=x") for _ in range(3)))
+        assert bodies == ["items 1"] * 3
+        assert app.coalesced == 2
+
+        await asyncio.gather(get("/items?search=y"), get("/items?search=y", token="b"))
+        assert len(calls) == 3
+
+        # 대상 경로가 아니면 합치지 않음
+        await asyncio.gather(get("/other"), get("/other"))
+        assert len(calls) == 5
+
+
+@pytest.mark.asyncio
+async def test_streaming_responses_are_not_coalesced():
+    """스트리밍 응답은 팔로워가 리더의 전체 본문을 기다리지 않고 직접 처리"""
+    calls = []
+    finish = asyncio.Event()
+
+    async def page(request: Request) -> StreamingResponse:
+        calls.append(request.url.path)
+
+        async def chunks():
+            yield b"<head>"
+            await finish.wait()
+            yield b"<body>"
+
+        return StreamingResponse(chunks(), media_type="text/html")
+
+    app = RequestCoalescingMiddleware(
+        Starlette(routes=[Route("/dashboard", page)]), paths=["/dashboard"]
+    )
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        requests = [asyncio.create_task(client.get("/dashboard")) for _ in range(2)]
+        for _ in range(100):
+            if len(calls) == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert len(calls) == 2  # 리더가 끝나기 전에 팔로워도 처리 시작
+        finish.set()
+        responses = await asyncio.gather(*requests)
+
+    assert [response.text for response in responses] == ["<head><body>"] * 2
+    assert app.coalesced == 0
+
+
+@pytest.mark.asyncio
+async def test_anonymous_pages_are_cached_with_etag(fresh_cache, tmp_path):
+    """익명 요청은 캐시된 응답(ETag/304), 인증 쿠키가 있으면 매번 처리"""
+    calls = []
+
+    async def home(request: Request) -> HTMLResponse:
+        calls.append(request.headers.get("cookie"))
+        return HTMLResponse("<h1>홈</h1>")
+
+    app = AnonymousPageCacheMiddleware(
+        Starlette(routes=[Route("/", home), Route("/other", home)]),
+        paths=["/"],
+        template_directory=str(tmp_path),
+    )
+
+    assert await prewarm_pages(app, ["/"]) == 1
+    assert len(calls) == 1
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        response = await client.get("/")
+        assert response.status_code == 200
+        assert response.text == "<h1>홈</h1>"
+        assert "Cookie" in response.headers["vary"]
+        etag = response.headers["etag"]
+        assert len(calls) == 1 and app.hits == 1
+
+        response = await client.get("/", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        # 인증 쿠키가 있으면 캐시를 거치지 않음, 다른 쿠키는 상관없음
+        await client.get("/", headers={"Cookie": "access_token=abc"})
+        await client.get("/", headers={"Cookie": "db_primary_pin=1"})
+        await client.get("/other")
+        assert len(calls) == 3
+        assert "etag" not in (await client.get("/other")).headers
+
+
+@pytest.mark.asyncio
+async def test_prewarm_continues_after_failing_page(fresh_cache, tmp_path, caplog):
+    """미리 렌더링 중 한 페이지가 실패해도 나머지 페이지는 캐시"""
+
+    async def broken(request: Request) -> HTMLResponse:
+        raise RuntimeError("템플릿 오류")
+
+    async def about(request: Request) -> HTMLResponse:
+        return HTMLResponse("<h1>소개</h1>")
+
+    app = AnonymousPageCacheMiddleware(
+        Starlette(routes=[Route("/", broken), Route("/about", about)]),
+        paths=["/", "/about"],
+        template_directory=str(tmp_path),
+    )
+
+    assert await prewarm_pages(app, ["/", "/about"]) == 1
+    assert "익명 페이지 미리 렌더링 실패: /" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_page_cache_skips_app_that_sends_nothing(fresh_cache, tmp_path):
+    """앱이 응답을 보내지 않고 끝나도 오류 없이 저장하지 않음"""
+
+    async def silent(scope: Scope, receive: Receive, send: Send) -> None:
+        return None
+
+    app = AnonymousPageCacheMiddleware(silent, paths=["/"], template_directory=str(tmp_path))
+    sent = []
+
+    async def send(message) -> None:
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": []}
+    await app(scope, None, send)
+    assert sent == []
+    assert app.misses == 1
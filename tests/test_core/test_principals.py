@@ -0,0 +1,83 @@
+"""
+Shared Principal Table Tests
+
+워커 간 공유 principal 테이블 테스트
+"""
+
+import uuid
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.principals import (
+    PRINCIPAL_ACTIVE,
+    PRINCIPAL_SUPERUSER,
+    SharedPrincipalTable,
+    set_principal_table,
+)
+from app.models.user import User
+from app.services.user import UserService
+
+
+@pytest.fixture
+def principal_table():
+    """테스트마다 새 이름의 공유 테이블 (종료 후 삭제)"""
+    table = SharedPrincipalTable(f"test-principals-{uuid.uuid4().hex[:8]}", slots=8, ways=2)
+    set_principal_table(table)
+    yield table
+    set_principal_table(None)
+    table.close()
+    table.unlink()
+
+
+def test_records_are_shared_between_attached_tables(principal_table: SharedPrincipalTable):
+    """같은 이름으로 연결한 테이블(다른 워커)이 같은 레코드와 epoch를 봄"""
+    other = SharedPrincipalTable(principal_table.name, slots=8, ways=2)
+    try:
+        epoch = principal_table.epoch(1)
+        assert principal_table.put(1, PRINCIPAL_ACTIVE | PRINCIPAL_SUPERUSER, epoch)
+
+        record = other.get(1)
+        assert record is not None and record.is_active
+        assert record.flags & PRINCIPAL_SUPERUSER
+        assert record.epoch == epoch
+
+        # 다른 워커의 무효화: 레코드 삭제 + epoch 증가, 이전 epoch로는 저장 불가
+        other.invalidate([1])
+        assert principal_table.get(1) is None
+        assert principal_table.epoch(1) == epoch + 1
+        assert not principal_table.put(1, PRINCIPAL_ACTIVE, epoch)
+
+        # 버킷(ways=2)이 차면 기존 레코드 하나를 교체
+        buckets = principal_table.buckets
+        for user_id in (2, 2 + buckets, 2 + 2 * buckets):
+            assert principal_table.put(user_id, PRINCIPAL_ACTIVE, principal_table.epoch(user_id))
+        stored = [principal_table.get(u) for u in (2, 2 + buckets, 2 + 2 * buckets)]
+        assert sum(record is not None for record in stored) == 2
+    finally:
+        other.close()
+
+
+@pytest.mark.asyncio
+async def test_deactivation_is_seen_through_shared_table(
+    auth_client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    principal_table: SharedPrincipalTable,
+):
+    """인증 시 레코드가 저장되고, 비활성화 커밋 후에는 테이블만으로 거부"""
+    response = await auth_client.get("/api/v1/auth/me")
+    assert response.status_code == 200
+    record = principal_table.get(test_user.id)
+    assert record is not None and record.is_active
+
+    await UserService(db_session).deactivate(test_user)
+    await db_session.commit()
+    assert principal_table.get(test_user.id) is None
+
+    # 다른 워커가 비활성 상태를 기록한 경우
+    principal_table.put(test_user.id, 0, principal_table.epoch(test_user.id))
+    response = await auth_client.get("/api/v1/auth/me")
+    assert response.status_code == 401
+    assert response.json()["detail"] == "비활성화된 계정입니다."
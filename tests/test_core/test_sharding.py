@@ -0,0 +1,131 @@
+"""
+Item Sharding Tests
+
+소유자 기준 아이템 샤드 라우팅 및 리밸런싱 테스트
+"""
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.sharding import (
+    ShardRoutingError,
+    create_sharded_session_maker,
+    jump_hash,
+    owner_shard_index,
+)
+from app.database import Base
+from app.models.item import Item
+from app.models.user import User
+from app.schemas.item import ItemCreate
+from app.services.item import ItemService
+from app.services.item_sharding import rebalance_items
+
+
+async def _owner_counts(url: str) -> dict[int, int]:
+    """DB별 소유자 → 아이템 수"""
+    engine = create_async_engine(url)
+    async with engine.connect() as conn:
+        rows = await conn.execute(
+            select(Item.owner_id, func.count()).group_by(Item.owner_id)
+        )
+        counts = dict(rows.all())
+    await engine.dispose()
+    return counts
+
+
+@pytest_asyncio.fixture
+async def sharded(tmp_path):
+    """(세션 팩토리, 샤드 URL 목록, 사용자 목록) - 샤드 3개 구성"""
+    primary = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}")
+    urls = [f"sqlite+aiosqlite:///{tmp_path / f'items_{i}.db'}" for i in range(3)]
+    shards = [create_async_engine(url) for url in urls]
+
+    async with primary.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all, tables=[User.__table__])
+    for shard in shards:
+        async with shard.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all, tables=[Item.__table__])
+
+    session_maker = create_sharded_session_maker(primary, shards)
+    async with session_maker() as session:
+        users = [
+            User(email=f"user{n}@example.com", username=f"user{n}", hashed_password="x")
+            for n in range(6)
+        ]
+        session.add_all(users)
+        await session.commit()
+
+    yield session_maker, urls, users
+
+    for engine in (primary, *shards):
+        await engine.dispose()
+
+
+def test_jump_hash_moves_keys_only_to_new_bucket():
+    """버킷 추가 시 키는 새 버킷으로만 이동"""
+    for key in range(1000):
+        before, after = jump_hash(key, 4), jump_hash(key, 5)
+        assert after in (before, 4)
+
+
+@pytest.mark.asyncio
+async def test_items_are_routed_by_owner(sharded):
+    """아이템은 소유자의 샤드에만 저장되고 소유자 조회는 해당 샤드만 사용"""
+    session_maker, urls, users = sharded
+
+    async with session_maker() as session:
+        service = ItemService(session)
+        for user in users:
+            item = await service.create(ItemCreate(title="first"), user)
+            await service.bulk_create([ItemCreate(title="bulk")] * 2, user.id)
+            await service.toggle_active(item)
+        await session.commit()
+
+        for user in users:
+            assert await service.count(owner_id=user.id) == 3
+            assert await service.count(owner_id=user.id, is_active=False) == 1
+
+        with pytest.raises(ShardRoutingError):
+            await service.count()
+
+        assert await service.count_all() == 18
+        assert len(await service.scan_all(limit=5)) == 5
+
+        deleted = await service.delete_by_owner(users[0].id)
+        await session.commit()
+        assert deleted == 3
+
+    for index, url in enumerate(urls):
+        owners = set(await _owner_counts(url))
+        assert all(owner_shard_index(owner, 3) == index for owner in owners)
+
+
+@pytest.mark.asyncio
+async def test_rebalance_moves_items_to_new_layout(sharded, tmp_path):
+    """샤드 추가 리밸런싱: 소유자 아이템을 새 샤드로 이동, 재실행 시 변화 없음"""
+    session_maker, urls, users = sharded
+
+    async with session_maker() as session:
+        service = ItemService(session)
+        for user in users:
+            await service.bulk_create([ItemCreate(title="item")] * 4, user.id)
+        await session.commit()
+
+    new_urls = urls + [f"sqlite+aiosqlite:///{tmp_path / 'items_3.db'}"]
+    result = await rebalance_items(urls, new_urls, batch_size=3, log=lambda _: None)
+
+    expected_moves = [user for user in users if owner_shard_index(user.id, 4) == 3]
+    assert result.owners_moved == len(expected_moves)
+    assert result.items_moved == 4 * len(expected_moves)
+
+    total = 0
+    for index, url in enumerate(new_urls):
+        counts = await _owner_counts(url)
+        assert all(owner_shard_index(owner, 4) == index for owner in counts)
+        total += sum(counts.values())
+    assert total == 24
+
+    again = await rebalance_items(new_urls, new_urls, log=lambda _: None)
+    assert again.owners_moved == 0
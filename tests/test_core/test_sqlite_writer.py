@@ -0,0 +1,135 @@
+"""
+SQLite Writer Tests
+
+단일 작성자 group commit 테스트
+"""
+
+import asyncio
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core.sqlite_writer import SQLiteWriter, configure_sqlite_connections
+from app.database import Base, create_session_maker, enable_sqlite_foreign_keys
+from app.models.item import Item
+from app.models.user import User
+from app.schemas.item import ItemCreate
+from app.services.item import ItemService
+
+
+@pytest_asyncio.fixture
+async def coordinated(tmp_path):
+    """(세션 팩토리, 작성자, 사용자 ID) - 읽기 풀과 쓰기 전용 연결을 분리한 구성"""
+    url = f"sqlite+aiosqlite:///{tmp_path / 'app.db'}"
+    reader = create_async_engine(url)
+    enable_sqlite_foreign_keys(reader)
+    configure_sqlite_connections(reader)
+
+    writer_engine = create_async_engine(url, pool_size=1, max_overflow=0)
+    enable_sqlite_foreign_keys(writer_engine)
+    configure_sqlite_connections(writer_engine, immediate=True)
+    writer = SQLiteWriter(writer_engine, window=0.01)
+
+    async with reader.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        result = await conn.execute(
+            User.__table__.insert().values(
+                email="w@example.com", username="writer", hashed_password="x"
+            )
+        )
+        user_id = result.inserted_primary_key[0]
+
+    yield create_session_maker(reader, writer=writer), writer, user_id
+
+    await writer.close()
+    await reader.dispose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_writes_share_commits(coordinated):
+    """동시에 도착한 쓰기는 적은 수의 트랜잭션으로 묶여 커밋"""
+    session_maker, writer, user_id = coordinated
+    owner = User(id=user_id)
+
+    async def create(n: int) -> Item:
+        async with session_maker() as session:
+            return await ItemService(session).create(ItemCreate(title=f"item {n}"), owner)
+
+    items = await asyncio.gather(*(create(n) for n in range(20)))
+
+    assert len({item.id for item in items}) == 20
+    assert writer.writes == 20
+    assert writer.commits < 20
+
+    async with session_maker() as session:
+        count = await session.scalar(select(func.count(Item.id)))
+    assert count == 20
+
+
+@pytest.mark.asyncio
+async def test_failed_write_rolls_back_only_itself(coordinated):
+    """한 쓰기의 실패는 같은 묶음의 다른 쓰기에 영향 없음"""
+    session_maker, writer, user_id = coordinated
+
+    async def failing(db):
+        db.add(Item(title="rolled back", owner_id=user_id))
+        await db.flush()
+        raise ValueError("boom")
+
+    async def ok(db):
+        db.add(Item(title="kept", owner_id=user_id))
+        await db.flush()
+
+    results = await asyncio.gather(
+        writer.submit(failing), writer.submit(ok), return_exceptions=True
+    )
+
+    assert isinstance(results[0], ValueError)
+    assert writer.commits == 1
+    async with session_maker() as session:
+        titles = (await session.scalars(select(Item.title))).all()
+    assert titles == ["kept"]
+
+
+@pytest.mark.asyncio
+async def test_write_result_is_merged_into_caller_session(coordinated):
+    """작성자가 수정한 결과는 호출자 세션의 같은 객체에 반영"""
+    session_maker, _writer, user_id = coordinated
+
+    async with session_maker() as session:
+        service = ItemService(session)
+        item = await service.create(ItemCreate(title="toggle"), User(id=user_id))
+        assert item in session
+
+        toggled = await service.toggle_active(item)
+        assert toggled is item
+        assert item.is_active is False
+
+        await service.delete(item)
+        assert item not in session
+        assert await service.get_by_id(item.id) is None
+
+
+@pytest.mark.asyncio
+async def test_interrupted_batch_fails_waiting_writes(coordinated):
+    """묶음 실행 중 작성자가 중단되면 대기 중인 쓰기는 멈추지 않고 실패"""
+    _session_maker, writer, user_id = coordinated
+
+    async def cancelled(db):
+        raise asyncio.CancelledError
+
+    async def ok(db):
+        db.add(Item(title="never", owner_id=user_id))
+        await db.flush()
+
+    results = await asyncio.wait_for(
+        asyncio.gather(writer.submit(cancelled), writer.submit(ok), return_exceptions=True),
+        timeout=5,
+    )
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    # 다음 쓰기는 새 작성자 루프에서 처리
+    await writer.submit(ok)
+    assert writer.commits == 1
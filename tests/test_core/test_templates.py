@@ -0,0 +1,76 @@
+"""
+Template Environment Tests
+
+템플릿 환경(프로덕션 모드) 테스트
+"""
+
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.templates import (
+    create_template_environment,
+    precompile_templates,
+    render_template_async,
+    resolve_context,
+    stream_template,
+)
+
+
+def test_production_environment_precompiles_into_bytecode_cache(tmp_path):
+    """프로덕션 모드: auto_reload 끔, 미리 컴파일한 결과를 다른 환경이 재사용"""
+    env = create_template_environment(production=True, bytecode_cache_dir=str(tmp_path))
+    assert env.auto_reload is False
+    assert "datetime" in env.filters
+
+    compiled = precompile_templates(env)
+    assert compiled == len(env.list_templates(extensions=["html"]))
+    assert len(list(tmp_path.iterdir())) == compiled
+
+    # 새 워커: 바이트코드 캐시에서 불러와 렌더링
+    other = create_template_environment(production=True, bytecode_cache_dir=str(tmp_path))
+    html = other.get_template("partials/toasts/success.html").render(message="저장됨")
+    assert "저장됨" in html
+
+    assert create_template_environment(production=False).auto_reload is True
+
+
+@pytest.mark.asyncio
+async def test_async_environment_consumes_async_iterables_and_functions():
+    """비동기 환경: 비동기 제너레이터를 순회하고 async 함수 호출을 await"""
+    fetched = []
+
+    async def rows():
+        for n in range(3):
+            fetched.append(n)
+            yield SimpleNamespace(
+                id=n, title=f"행 {n}", description=None, is_active=True,
+                priority=0, created_at=datetime.now(), updated_at=datetime.now(),
+            )
+
+    context = {
+        "current_user": SimpleNamespace(username="u", full_name=None, is_superuser=False),
+        "items": rows(),
+        "page": 1,
+        "total_pages": 1,
+        "total": 3,
+        "search": None,
+    }
+    html = await render_template_async("pages/items.html", context)
+    assert fetched == [0, 1, 2]
+    assert "행 2" in html and "아이템이 없습니다" not in html
+
+    # 빈 비동기 이터러블은 for-else의 빈 상태
+    async def empty():
+        return
+        yield
+
+    chunks = [chunk async for chunk in stream_template("pages/items.html", {**context, "items": empty()})]
+    assert "아이템이 없습니다" in "".join(chunks)
+
+    # 동기 환경용으로 구체화
+    resolved = await resolve_context({"items": rows(), "total": asyncio.sleep(0, result=3)})
+    assert [item.title for item in resolved["items"]] == ["행 0", "행 1", "행 2"]
+    assert resolved["total"] == 3
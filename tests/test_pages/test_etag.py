@@ -0,0 +1,67 @@
+"""
+ETag Tests
+
+페이지/파셜 응답의 약한 ETag와 304 응답 테스트
+"""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+
+
+@pytest.fixture(autouse=True)
+def template_etags(monkeypatch):
+    """템플릿 ETag는 선택 기능이므로 이 모듈에서만 켬"""
+    monkeypatch.setattr(settings, "template_etags", True)
+
+
+@pytest.mark.asyncio
+async def test_partial_returns_304_until_content_changes(
+    auth_client: AsyncClient, db_session: AsyncSession
+):
+    """같은 본문이면 304, 아이템이 바뀌면 새 ETag로 200"""
+    response = await auth_client.get("/partials/items")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert etag.startswith('W/"')
+    assert response.headers["cache-control"] == "no-cache"
+
+    response = await auth_client.get("/partials/items", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    await auth_client.post("/api/v1/items", json={"title": "새 아이템"})
+    await db_session.commit()
+
+    response = await auth_client.get("/partials/items", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_boosted_page_304_keeps_htmx_headers(auth_client: AsyncClient):
+    """304 응답에도 HTMX 교체 헤더와 Vary가 붙음"""
+    headers = {"HX-Request": "true", "HX-Boosted": "true"}
+    response = await auth_client.get("/profile", headers=headers)
+    etag = response.headers["etag"]
+
+    response = await auth_client.get("/profile", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["HX-Retarget"] == "#main-content"
+    assert "HX-Request" in response.headers["vary"]
+
+    # 전체 페이지는 다른 본문이므로 다른 ETag
+    response = await auth_client.get("/profile", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_etags_are_off_by_default(auth_client: AsyncClient, monkeypatch):
+    """TEMPLATE_ETAGS를 켜지 않으면 ETag를 붙이지 않음"""
+    monkeypatch.setattr(settings, "template_etags", False)
+    response = await auth_client.get("/partials/items")
+    assert response.status_code == 200
+    assert "etag" not in response.headers
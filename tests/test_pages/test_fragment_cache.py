@@ -0,0 +1,127 @@
+"""
+Fragment Cache Tests
+
+레이아웃 컴포넌트({% cache %} 블록) 캐시 테스트
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import MemoryCache
+from app.core.fragment_cache import card_cache
+from app.core.templates import create_template_environment
+from app.models.user import User
+
+
+@pytest.mark.asyncio
+async def test_navbar_fragment_is_cached_and_follows_profile_updates(
+    auth_client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    fresh_cache: MemoryCache,
+):
+    """네비게이션은 사용자별로 캐시되고, 사용자 정보 변경 커밋 시 다시 렌더링"""
+    response = await auth_client.get("/profile")
+    assert response.status_code == 200
+    assert test_user.username in response.text
+
+    keys = [key for key in fresh_cache._entries if key.startswith("fragment:base.html:")]
+    assert any(key.endswith(f":navbar:{test_user.id}") for key in keys)
+    assert any(key.endswith(":footer") for key in keys)
+
+    hits = fresh_cache.metrics.hits
+    await auth_client.get("/settings")
+    assert fresh_cache.metrics.hits >= hits + 2
+
+    response = await auth_client.patch("/api/v1/users/me", json={"username": "renamed_user"})
+    assert response.status_code == 200
+    await db_session.commit()  # 테스트 세션은 요청 종료 시 커밋하지 않음
+    await fresh_cache.wait_pending()
+    assert not any(":navbar:" in key for key in fresh_cache._entries)
+
+    # 스트리밍(비동기 환경) 페이지도 같은 캐시를 사용
+    response = await auth_client.get("/dashboard")
+    assert "renamed_user" in response.text
+
+
+@pytest.mark.asyncio
+async def test_item_cards_are_shared_and_rerendered_only_when_changed(
+    auth_client: AsyncClient, db_session: AsyncSession
+):
+    """목록/상세 파셜과 아이템 페이지가 카드를 공유하고, 변경된 카드만 다시 렌더링"""
+    response = await auth_client.post("/api/v1/items", json={"title": "카드 아이템"})
+    item_id = response.json()["id"]
+    await db_session.commit()
+
+    await auth_client.get("/partials/items")
+    assert len(card_cache) == 1
+    hits = card_cache.metrics.hits
+
+    await auth_client.get(f"/partials/items/{item_id}")
+    await auth_client.get("/items")
+    assert card_cache.metrics.hits == hits + 2
+
+    response = await auth_client.post(f"/partials/items/{item_id}/toggle")
+    assert response.status_code == 200
+    assert 'title="활성화"' in response.text
+    await db_session.commit()
+
+    # 커밋된 변경은 태그로 이전 카드 삭제, 새 버전만 남음
+    response = await auth_client.get("/partials/items")
+    assert 'title="활성화"' in response.text
+    assert len(card_cache) == 1
+
+
+
+@pytest.mark.asyncio
+async def test_item_card_follows_changes_committed_by_other_workers(
+    auth_client: AsyncClient,
+    db_session: AsyncSession,
+    test_user: User,
+    fresh_cache: MemoryCache,
+):
+    """다른 워커의 커밋(공유 캐시 세대 변경)은 updated_at이 같아도 카드를 다시 렌더링"""
+    response = await auth_client.post("/api/v1/items", json={"title": "이전 제목"})
+    item_id = response.json()["id"]
+    await db_session.commit()
+
+    response = await auth_client.get(f"/partials/items/{item_id}")
+    assert "이전 제목" in response.text
+    assert any(f"item:{test_user.id}:{item_id}:" in key for key in card_cache._entries)
+
+    # 다른 워커가 같은 초 안에 변경: 이 워커의 카드 저장소는 그대로, 공유 캐시 태그만 무효화
+    await db_session.execute(
+        text("UPDATE items SET title = '새 제목' WHERE id = :id"), {"id": item_id}
+    )
+    await db_session.commit()
+    await fresh_cache.invalidate_tags(f"item:{item_id}", f"items:owner:{test_user.id}")
+
+    response = await auth_client.get(f"/partials/items/{item_id}")
+    assert "새 제목" in response.text
+
+def test_fragment_key_follows_included_template_changes(tmp_path: Path, fresh_cache: MemoryCache):
+    """블록 안에서 include한 템플릿만 바뀌어도 배포 후 다시 렌더링 (바이트코드 캐시 포함)"""
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "page.html").write_text('{% cache "nav" %}{% include "nav.html" %}{% endcache %}')
+    navbar = templates / "nav.html"
+    navbar.write_text("이전 메뉴")
+
+    def render() -> str:
+        env = create_template_environment(
+            directory=str(templates), production=True, bytecode_cache_dir=str(tmp_path / "bc")
+        )
+        return env.get_template("page.html").render()
+
+    assert render() == "이전 메뉴"
+    assert render() == "이전 메뉴"  # 같은 버전이면 캐시 사용
+
+    navbar.write_text("새 메뉴")
+    mtime = navbar.stat().st_mtime_ns + 10**9
+    os.utime(navbar, ns=(mtime, mtime))
+    assert render() == "새 메뉴"
@@ -0,0 +1,43 @@
+"""
+HTMX Navigation Tests
+
+hx-boost 페이지 이동 시 콘텐츠 블록만 렌더링하는지 테스트
+"""
+
+import pytest
+from httpx import AsyncClient
+
+BOOSTED = {"HX-Request": "true", "HX-Boosted": "true"}
+
+
+@pytest.mark.asyncio
+async def test_boosted_navigation_renders_content_only(auth_client: AsyncClient):
+    """hx-boost 요청: 제목 + main만 렌더링하고 main을 교체하도록 지시"""
+    full = await auth_client.get("/dashboard")
+    boosted = await auth_client.get("/dashboard", headers=BOOSTED)
+
+    assert boosted.status_code == 200
+    assert boosted.headers["HX-Retarget"] == "#main-content"
+    assert boosted.headers["HX-Reswap"] == "outerHTML"
+    assert "HX-Request" in boosted.headers["Vary"]
+
+    html = boosted.text
+    assert "<title>대시보드 |" in html
+    assert '<main id="main-content"' in html
+    assert "<head>" not in html and "htmx.org" not in html
+    assert len(html) < len(full.text) / 2
+
+    # 전체 페이지 응답은 교체 헤더 없음
+    assert "HX-Retarget" not in full.headers
+    assert '<main id="main-content"' in full.text
+
+
+@pytest.mark.asyncio
+async def test_history_restore_and_targeted_requests_get_full_page(client: AsyncClient):
+    """히스토리 복원 요청이나 다른 요소를 대상으로 한 요청은 전체 페이지"""
+    restore = await client.get("/about", headers={**BOOSTED, "HX-History-Restore-Request": "true"})
+    assert "<head>" in restore.text
+
+    targeted = await client.get("/about", headers={"HX-Request": "true", "HX-Target": "items-list"})
+    assert "<head>" in targeted.text
+    assert "HX-Retarget" not in targeted.headers
@@ -0,0 +1,60 @@
+"""
+Streaming Page Tests
+
+레이아웃을 먼저 보내고 본문을 이어서 렌더링하는 스트리밍 응답 테스트
+"""
+
+from types import SimpleNamespace
+
+import pytest
+from httpx import AsyncClient
+from starlette.requests import Request
+
+from app.core.templates import stream_page
+
+
+@pytest.mark.asyncio
+async def test_layout_is_sent_before_content_is_loaded():
+    """첫 조각(head, 네비게이션)을 보낸 뒤에 load()를 실행"""
+    events = []
+
+    async def load() -> dict:
+        events.append("load")
+        return {"recent_items": [], "stats": {"total_items": 7, "active_items": 3}}
+
+    request = Request(
+        {"type": "http", "method": "GET", "path": "/dashboard", "headers": [], "query_string": b""}
+    )
+    user = SimpleNamespace(username="streamer", full_name=None, is_superuser=False)
+    response = await stream_page(
+        request=request,
+        name="pages/dashboard.html",
+        context={"title": "대시보드", "current_user": user},
+        load=load,
+    )
+
+    chunks = []
+    async for chunk in response.body_iterator:
+        events.append("chunk")
+        chunks.append(chunk)
+
+    assert events[:2] == ["chunk", "load"]
+    assert "</head>" in chunks[0] and "streamer" in chunks[0]
+    assert "전체 아이템" not in chunks[0]
+    assert "전체 아이템" in "".join(chunks[1:])
+
+
+@pytest.mark.asyncio
+async def test_streamed_items_page(auth_client: AsyncClient):
+    """스트리밍으로 렌더링한 아이템 목록 페이지"""
+    response = await auth_client.post(
+        "/api/v1/items", json={"title": "스트리밍 아이템", "description": "본문"}
+    )
+    assert response.status_code == 201
+
+    response = await auth_client.get("/items")
+    assert response.status_code == 200
+    assert "text/html" in response.headers["content-type"]
+    assert "스트리밍 아이템" in response.text
+    assert "총 1개의 아이템" in response.text
+    assert response.text.rstrip().endswith("</html>")
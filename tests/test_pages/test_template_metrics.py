@@ -0,0 +1,57 @@
+"""
+Template Metrics Tests
+
+템플릿별 렌더링 시간/크기 기록과 Server-Timing 헤더 테스트
+"""
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.core.template_metrics import template_metrics
+from app.core.templates import render_template
+
+
+@pytest.mark.asyncio
+async def test_partial_records_nested_includes(
+    auth_client: AsyncClient, db_session: AsyncSession, monkeypatch
+):
+    """목록 파셜과 include한 카드가 각자 기록되고 Server-Timing에 표시"""
+    monkeypatch.setattr(settings, "template_server_timing", True)
+    template_metrics.reset()
+    for title in ("첫째", "둘째"):
+        await auth_client.post("/api/v1/items", json={"title": title})
+    await db_session.commit()
+
+    response = await auth_client.get("/partials/items")
+    assert response.status_code == 200
+    server_timing = response.headers["server-timing"]
+    assert 'tpl;desc="partials/items/list.html";dur=' in server_timing
+    assert 'desc="partials/items/item.html x2"' in server_timing
+
+    stats = template_metrics.snapshot()
+    page, card = stats["partials/items/list.html"], stats["partials/items/item.html"]
+    assert page["renders"] == 1 and card["renders"] == 2
+    # 목록 시간/크기는 include한 카드를 포함
+    assert page["duration_ms"]["sum"] >= card["duration_ms"]["sum"]
+    assert page["size_chars"]["sum"] >= card["size_chars"]["sum"] > 0
+    assert sum(card["duration_ms"]["buckets"].values()) == 2
+
+
+@pytest.mark.asyncio
+async def test_server_timing_is_off_by_default(auth_client: AsyncClient):
+    """TEMPLATE_SERVER_TIMING을 켜지 않으면 템플릿 이름을 헤더에 노출하지 않음"""
+    response = await auth_client.get("/partials/items")
+    assert response.status_code == 200
+    assert "server-timing" not in response.headers
+
+
+def test_render_template_records_output_size():
+    """render_template도 기록, 크기는 출력 문자 수"""
+    template_metrics.reset()
+    html = render_template("partials/toasts/success.html", {"message": "저장됨"})
+
+    stats = template_metrics.snapshot()["partials/toasts/success.html"]
+    assert stats["renders"] == 1
+    assert stats["size_chars"]["sum"] == len(html)